@@ -0,0 +1,61 @@
+"""Benchmark streaming AES encryption against the one-shot str/base64 path.
+
+Reports throughput in MB/s and the peak Python heap usage (tracemalloc)
+for each approach, using a temporary file as the attachment.
+
+Run with: ``python -m benchmarks.bench_aes_stream``
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from confy_addons import AESEncryption
+
+FILE_SIZES = (1024 * 1024, 16 * 1024 * 1024, 64 * 1024 * 1024)
+MEGABYTE = 1024 * 1024
+
+
+def measure(func) -> tuple[float, int]:
+    """Run func once and return its duration in seconds and peak heap bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Print MB/s and peak memory for one-shot and streaming encryption."""
+    aes = AESEncryption()
+    print(f'{"size":>8} {"path":>9} {"MB/s":>9} {"peak MB":>9}')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src_path = os.path.join(tmp, 'attachment.bin')
+        dst_path = os.path.join(tmp, 'attachment.enc')
+
+        for size in FILE_SIZES:
+            with open(src_path, 'wb') as f:
+                f.write(os.urandom(size))
+
+            def one_shot():
+                with open(src_path, 'rb') as src, open(dst_path, 'w', encoding='ascii') as dst:
+                    dst.write(aes.encrypt(src.read().decode('latin-1')))
+
+            def streaming():
+                with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+                    aes.encrypt_stream(src, dst)
+
+            for name, func in (('one-shot', one_shot), ('stream', streaming)):
+                elapsed, peak = measure(func)
+                print(
+                    f'{size // MEGABYTE:>6}MB {name:>9} '
+                    f'{size / MEGABYTE / elapsed:>9.1f} {peak / MEGABYTE:>9.1f}'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark frame classification with a startswith chain versus the codec.
+
+Run with: ``python -m benchmarks.bench_codec [frames]``
+"""
+
+import sys
+import time
+
+from confy_addons.codec import decode
+from confy_addons.prefixes import (
+    AES_KEY_PREFIX,
+    AES_PREFIX,
+    KEY_EXCHANGE_PREFIX,
+    SYSTEM_ERROR_PREFIX,
+    SYSTEM_PREFIX,
+)
+
+DEFAULT_FRAMES = 200_000
+PREFIXES = (SYSTEM_PREFIX, KEY_EXCHANGE_PREFIX, AES_KEY_PREFIX, AES_PREFIX, SYSTEM_ERROR_PREFIX)
+
+
+def mixed_traffic(frames: int) -> list[str]:
+    """Return frames that are mostly AES messages with some control traffic."""
+    control = [f'{prefix}{"x" * 64}' for prefix in PREFIXES if prefix != AES_PREFIX]
+    return [
+        control[i % len(control)] if i % 10 == 0 else f'{AES_PREFIX}{"y" * 200}'
+        for i in range(frames)
+    ]
+
+
+def startswith_chain(frame: str):
+    """Classify a frame the way consumers did before the codec existed."""
+    for prefix in PREFIXES:
+        if frame.startswith(prefix):
+            return prefix, frame[len(prefix) :]
+    raise ValueError('Unknown message prefix')
+
+
+def rate(parse, traffic) -> float:
+    """Return the frames/sec of parse over traffic."""
+    start = time.perf_counter()
+    for frame in traffic:
+        parse(frame)
+    return len(traffic) / (time.perf_counter() - start)
+
+
+def main():
+    """Print frames/sec for str and bytes mixed traffic."""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FRAMES
+    traffic = mixed_traffic(frames)
+    encoded = [frame.encode('ascii') for frame in traffic]
+
+    print(f'{frames} mixed frames (90% {AES_PREFIX!r})')
+    print(f'{"parser":<22} {"frames/s":>12}')
+    print(f'{"startswith chain":<22} {rate(startswith_chain, traffic):>12,.0f}')
+    print(f'{"codec.decode (str)":<22} {rate(decode, traffic):>12,.0f}')
+    print(f'{"codec.decode (bytes)":<22} {rate(decode, encoded):>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
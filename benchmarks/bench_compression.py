@@ -0,0 +1,95 @@
+"""Benchmark compression ratio and latency of AESEncryption per threshold and corpus.
+
+Each corpus mimics a kind of traffic; the benchmark reports the ciphertext
+size relative to uncompressed encryption and the encrypt + decrypt latency,
+to help choose compression_threshold.
+
+Run with: ``python -m benchmarks.bench_compression [messages]``
+"""
+
+import json
+import random
+import sys
+import time
+
+from confy_addons import AESEncryption, ZlibCompression
+from confy_addons.messages import (
+    RECIPIENT_CONNECTED,
+    RECIPIENT_NOT_CONNECTED,
+    THE_OTHER_USER_LOGGED_OUT,
+)
+
+DEFAULT_MESSAGES = 2_000
+THRESHOLDS = (None, 0, 128, 256, 1024)
+WORDS = (
+    'oi tudo bem sim e voce estou chegando daqui a pouco ok combinado ate mais '
+    'reuniao amanha as dez vou mandar o arquivo obrigado valeu beleza'
+).split()
+
+
+def chat_messages(count: int, rng: random.Random) -> list[str]:
+    """Return short chat lines of a few words."""
+    return [' '.join(rng.choices(WORDS, k=rng.randint(2, 12))) for _ in range(count)]
+
+
+def chat_history(count: int, rng: random.Random) -> list[str]:
+    """Return JSON chat history pages of 20 to 50 messages each."""
+    return [
+        json.dumps([
+            {'from': f'user-{rng.randint(1, 5)}', 'ts': 1_700_000_000 + i, 'text': line}
+            for i, line in enumerate(chat_messages(rng.randint(20, 50), rng))
+        ])
+        for _ in range(count // 20 or 1)
+    ]
+
+
+def system_payloads(count: int, rng: random.Random) -> list[str]:
+    """Return system notifications as sent by the relay."""
+    notices = (RECIPIENT_CONNECTED, RECIPIENT_NOT_CONNECTED, THE_OTHER_USER_LOGGED_OUT)
+    return [
+        json.dumps({'type': 'system', 'message': rng.choice(notices), 'id': rng.random()})
+        for _ in range(count)
+    ]
+
+
+def measure(aes: AESEncryption, corpus: list[str]) -> tuple[int, float]:
+    """Return the total ciphertext length and the mean round-trip latency in seconds."""
+    start = time.perf_counter()
+    total = 0
+    for plaintext in corpus:
+        ciphertext = aes.encrypt(plaintext)
+        aes.decrypt(ciphertext)
+        total += len(ciphertext)
+    return total, (time.perf_counter() - start) / len(corpus)
+
+
+def main():
+    """Print size ratio and latency for every corpus and threshold."""
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MESSAGES
+    rng = random.Random(0)
+    corpora = {
+        'chat messages': chat_messages(messages, rng),
+        'chat history': chat_history(messages, rng),
+        'system payloads': system_payloads(messages, rng),
+    }
+    codec = ZlibCompression()
+
+    print(f'{"corpus":<16} {"avg bytes":>9} {"threshold":>9} {"ratio":>6} {"us/msg":>7}')
+    for name, corpus in corpora.items():
+        average = sum(len(plaintext.encode('utf-8')) for plaintext in corpus) // len(corpus)
+        baseline = None
+        for threshold in THRESHOLDS:
+            if threshold is None:
+                aes = AESEncryption()
+            else:
+                aes = AESEncryption(compression=codec, compression_threshold=threshold)
+            size, latency = measure(aes, corpus)
+            baseline = baseline or size
+            label = 'off' if threshold is None else str(threshold)
+            print(
+                f'{name:<16} {average:>9} {label:>9} {size / baseline:>6.2f} {latency * 1e6:>7.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
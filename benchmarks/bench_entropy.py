@@ -0,0 +1,66 @@
+"""Benchmark IV generation with and without the buffered random pool.
+
+Reports how many 16-byte IVs per second os.urandom and the random pool
+hand out, and the end-to-end throughput of AESEncryption.encrypt and
+AEADEncryption.encrypt_bytes with the pool and with one os.urandom call
+per message.
+
+Run with: ``python -m benchmarks.bench_entropy [calls]``
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+
+from confy_addons import AEADEncryption, AESEncryption
+from confy_addons.core.constants import AES_IV_SIZE
+from confy_addons.encryption import aead, aes
+from confy_addons.encryption.entropy import RandomPool, token_bytes
+
+DEFAULT_CALLS = 200_000
+PAYLOAD_SIZE = 64
+
+
+def rate(func: Callable[[], object], calls: int) -> float:
+    """Return how many times per second func runs."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    """Print IVs per second and encrypt throughput with and without the pool."""
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS
+    pool = RandomPool()
+    aes_handler, aead_handler = AESEncryption(), AEADEncryption()
+    text = 'x' * PAYLOAD_SIZE
+    data = b'x' * PAYLOAD_SIZE
+
+    print(f'{calls} calls each, {PAYLOAD_SIZE} byte payloads')
+    print(f'{"case":<26} {"ops/s":>12}')
+    urandom_rate = rate(lambda: os.urandom(AES_IV_SIZE), calls)
+    pool_rate = rate(lambda: pool.token_bytes(AES_IV_SIZE), calls)
+    print(f'{"os.urandom(16)":<26} {urandom_rate:>12.0f}')
+    print(
+        f'{"RandomPool.token_bytes(16)":<26} {pool_rate:>12.0f} {pool_rate / urandom_rate:>6.2f}x'
+    )
+
+    cases = {
+        'aes encrypt': lambda: aes_handler.encrypt(text),
+        'aead encrypt_bytes': lambda: aead_handler.encrypt_bytes(data),
+    }
+    for name, func in cases.items():
+        pooled = rate(func, calls)
+        aes.token_bytes = aead.token_bytes = os.urandom
+        try:
+            direct = rate(func, calls)
+        finally:
+            aes.token_bytes = aead.token_bytes = token_bytes
+        print(f'{name + " (urandom)":<26} {direct:>12.0f}')
+        print(f'{name + " (pool)":<26} {pooled:>12.0f} {pooled / direct:>6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
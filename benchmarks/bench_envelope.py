@@ -0,0 +1,52 @@
+"""Benchmark multi-recipient fan-out: per-recipient encryption against envelopes.
+
+The per-recipient path creates a data key, wraps it and encrypts the payload
+for every recipient; the envelope path encrypts the payload once and only
+wraps the data key per recipient.
+
+Run with: ``python -m benchmarks.bench_envelope``
+"""
+
+import time
+
+from confy_addons import AESEncryption, EnvelopeEncryption, RSAEncryption, RSAPublicEncryption
+
+RECIPIENT_COUNTS = (1, 4, 16, 64)
+PAYLOAD_SIZE = 64 * 1024
+ROUNDS = 5
+
+
+def per_recipient(plaintext: str, recipients: dict[str, RSAPublicEncryption]):
+    """Encrypt the payload separately for each recipient."""
+    for recipient in recipients.values():
+        aes = AESEncryption()
+        recipient.encrypt(aes.key)
+        aes.encrypt(plaintext)
+
+
+def best_latency(func) -> float:
+    """Return the best wall time of func over ROUNDS runs, in milliseconds."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    """Print fan-out latency against recipient count for both paths."""
+    public_key = RSAPublicEncryption(RSAEncryption().public_key)
+    plaintext = 'A' * PAYLOAD_SIZE
+    print(f'{PAYLOAD_SIZE // 1024} KiB payload')
+    print(f'{"recipients":>10} {"per-recipient ms":>17} {"envelope ms":>12} {"speedup":>8}')
+
+    for count in RECIPIENT_COUNTS:
+        recipients = {f'user-{index}': public_key for index in range(count)}
+        before = best_latency(lambda: per_recipient(plaintext, recipients))
+        after = best_latency(lambda: EnvelopeEncryption.seal(plaintext, recipients))
+        print(f'{count:>10} {before:>17.2f} {after:>12.2f} {before / after:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark event loop lag while RSA work runs inline versus on an executor.
+
+A ticker coroutine sleeps for a fixed interval and records how late it wakes
+up; the worst delay is the time the loop could not serve anything else.
+
+Run with: ``python -m benchmarks.bench_event_loop_lag [signatures]``
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from confy_addons import AsyncRSAEncryption, RSAEncryption
+
+DEFAULT_SIGNATURES = 50
+TICK_INTERVAL = 0.001
+
+
+async def ticker(stop: asyncio.Event) -> float:
+    """Return the worst wake-up delay of a periodic sleep until stop is set."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        worst = max(worst, time.perf_counter() - start - TICK_INTERVAL)
+    return worst
+
+
+async def measure(work) -> tuple[float, float]:
+    """Run work alongside the ticker and return (elapsed, worst lag) in seconds."""
+    stop = asyncio.Event()
+    lag = asyncio.create_task(ticker(stop))
+    await asyncio.sleep(TICK_INTERVAL)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return elapsed, await lag
+
+
+async def run(signatures: int):
+    """Print elapsed time and worst loop lag for each scenario."""
+    rsa = RSAEncryption()
+    handler = AsyncRSAEncryption(rsa)
+
+    async def inline_keygen():
+        RSAEncryption()
+
+    async def offloaded_keygen():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            await AsyncRSAEncryption.create(keygen_executor=executor)
+
+    async def inline_sign():
+        for _ in range(signatures):
+            rsa.sign(b'payload')
+
+    async def offloaded_sign():
+        for _ in range(signatures):
+            await handler.sign(b'payload')
+
+    print(f'{"scenario":<24} {"elapsed ms":>11} {"max lag ms":>11}')
+    for name, work in (
+        ('keygen inline', inline_keygen),
+        ('keygen process pool', offloaded_keygen),
+        (f'{signatures} x sign inline', inline_sign),
+        (f'{signatures} x sign thread', offloaded_sign),
+    ):
+        elapsed, lag = await measure(work)
+        print(f'{name:<24} {elapsed * 1000:>11.1f} {lag * 1000:>11.1f}')
+
+
+def main():
+    """Run the event loop lag benchmark."""
+    signatures = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIGNATURES
+    asyncio.run(run(signatures))
+
+
+if __name__ == '__main__':
+    main()
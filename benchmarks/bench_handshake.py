@@ -0,0 +1,67 @@
+"""Benchmark session setup: 4096-bit RSA key transport against X25519 + HKDF.
+
+Each handshake covers what both peers do to end up with the same AES key:
+key generation, public key serialization, key transport or agreement,
+and signing the first message.
+
+Run with: ``python -m benchmarks.bench_handshake``
+"""
+
+import time
+
+from confy_addons import (
+    AESEncryption,
+    Ed25519Signer,
+    Ed25519Verifier,
+    RSAEncryption,
+    RSAPublicEncryption,
+    X25519KeyExchange,
+    deserialize_public_key,
+)
+
+RSA_ROUNDS = 5
+X25519_ROUNDS = 500
+
+
+def rsa_handshake():
+    """Run the RSA handshake: Bob's key pair, Alice's wrapped AES key, a signature."""
+    bob = RSAEncryption()
+    bob_public = RSAPublicEncryption(deserialize_public_key(bob.base64_public_key))
+    alice_aes = AESEncryption()
+    bob_aes = AESEncryption(key=bob.decrypt(bob_public.encrypt(alice_aes.key)))
+    message = alice_aes.encrypt('first message').encode()
+    bob_public.verify(message, bob.sign(message))
+    return bob_aes
+
+
+def x25519_handshake():
+    """Run the X25519 handshake: both key pairs, the agreement and a signature."""
+    alice, bob = X25519KeyExchange(), X25519KeyExchange()
+    alice_aes = alice.derive_aes(bob.key_exchange_message())
+    bob_aes = bob.derive_aes(alice.key_exchange_message())
+    signer = Ed25519Signer()
+    message = alice_aes.encrypt('first message').encode()
+    Ed25519Verifier(signer.base64_public_key).verify(message, signer.sign(message))
+    return bob_aes
+
+
+def mean_latency(func, rounds: int) -> float:
+    """Return the mean wall time of func over rounds runs, in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    """Print the mean handshake latency of both paths."""
+    rsa_ms = mean_latency(rsa_handshake, RSA_ROUNDS)
+    x25519_ms = mean_latency(x25519_handshake, X25519_ROUNDS)
+    print(f'{"handshake":>16} {"mean ms":>10}')
+    print(f'{"RSA-4096":>16} {rsa_ms:>10.3f}')
+    print(f'{"X25519+Ed25519":>16} {x25519_ms:>10.3f}')
+    print(f'speedup: {rsa_ms / x25519_ms:,.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark the logging overhead of AES encrypt and decrypt.
+
+Times rejected decrypts, which log an error on every call, with a root
+handler writing the records (as the former import-time basicConfig did),
+with the default NullHandler only and inside quiet(). Also times a filtered
+debug call formatted eagerly with an f-string against lazy %-style
+arguments, and the successful round trip, which does not log.
+
+Run with: ``python -m benchmarks.bench_logging [iterations]``
+"""
+
+import io
+import logging
+import sys
+import timeit
+from collections.abc import Callable
+
+from confy_addons import AESEncryption, quiet
+
+DEFAULT_ITERATIONS = 20_000
+
+
+def measure(func: Callable[[], object], iterations: int) -> float:
+    """Return the best mean latency of func over 5 runs, in seconds."""
+    return min(timeit.repeat(func, number=iterations, repeat=5)) / iterations
+
+
+def main():
+    """Print the per-call latency of each logging setup."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+    aes = AESEncryption()
+    logger = logging.getLogger('confy_addons.benchmark')
+    value = object()
+
+    def rejected():
+        try:
+            aes.decrypt('')
+        except ValueError:
+            pass
+
+    handler = logging.StreamHandler(io.StringIO())
+    logging.getLogger().addHandler(handler)
+    written = measure(rejected, iterations)
+    logging.getLogger().removeHandler(handler)
+    default = measure(rejected, iterations)
+    with quiet():
+        silenced = measure(rejected, iterations)
+
+    results = (
+        ('rejected decrypt, root handler', written),
+        ('rejected decrypt, NullHandler', default),
+        ('rejected decrypt, quiet()', silenced),
+        ('filtered debug, f-string', measure(lambda: logger.debug(f'value: {value}'), iterations)),
+        ('filtered debug, %-style', measure(lambda: logger.debug('value: %s', value), iterations)),
+        ('encrypt + decrypt', measure(lambda: aes.decrypt(aes.encrypt('x' * 64)), iterations)),
+    )
+
+    print(f'{"case":<32} {"us/call":>8}')
+    for name, latency in results:
+        print(f'{name:<32} {latency * 1e6:>8.2f}')
+    print(f'\nquiet() saves {(written - silenced) * 1e6:.2f} us per rejected decrypt')
+
+
+if __name__ == '__main__':
+    main()
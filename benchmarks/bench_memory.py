@@ -0,0 +1,58 @@
+"""Benchmark the resident memory of encryption handlers per session.
+
+Creates many handler instances, as a relay keeps one per session, and
+reports the memory allocated per instance with tracemalloc, along with the
+size of the instance object itself (sys.getsizeof, which excludes the key
+material and cipher objects it references).
+
+Run with: ``python -m benchmarks.bench_memory [instances]``
+"""
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+from confy_addons import AEADEncryption, AESEncryption, RSAEncryption, RSAPublicEncryption
+
+DEFAULT_INSTANCES = 100_000
+
+
+def allocated_per_instance(factory: Callable[[], object], instances: int) -> tuple[float, int]:
+    """Return the bytes allocated per instance and the size of one instance object."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(instances)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    instance_size = sys.getsizeof(objects[0])
+    if hasattr(objects[0], '__dict__'):
+        instance_size += sys.getsizeof(objects[0].__dict__)
+
+    # The list holding the objects is not part of the per-session cost.
+    return (after - before - sys.getsizeof(objects)) / instances, instance_size
+
+
+def main():
+    """Print the memory per instance of every per-session handler."""
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_INSTANCES
+    public_key = RSAEncryption().public_key
+    key = AESEncryption().key
+    factories = {
+        'AESEncryption': AESEncryption,
+        'AESEncryption(key)': lambda: AESEncryption(key),
+        'AEADEncryption': AEADEncryption,
+        'RSAPublicEncryption': lambda: RSAPublicEncryption(public_key),
+    }
+
+    print(f'{instances} instances each')
+    print(f'{"handler":<22} {"bytes/instance":>14} {"object":>7}')
+    for name, factory in factories.items():
+        allocated, instance_size = allocated_per_instance(factory, instances)
+        print(f'{name:<22} {allocated:>14.0f} {instance_size:>7}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark the overhead of metrics on AES encrypt and decrypt.
+
+Times the same round trips with metrics never enabled, enabled with a
+MetricsRegistry and enabled then disabled again, which must match the first.
+
+Run with: ``python -m benchmarks.bench_metrics [iterations]``
+"""
+
+import sys
+import timeit
+
+from confy_addons import AESEncryption, metrics
+from confy_addons.metrics import MetricsRegistry
+
+DEFAULT_ITERATIONS = 20_000
+PAYLOAD_SIZES = (64, 4096)
+
+
+def measure(aes: AESEncryption, plaintext: str, iterations: int) -> float:
+    """Return the best mean encrypt + decrypt latency of 5 runs, in seconds."""
+    return (
+        min(
+            timeit.repeat(lambda: aes.decrypt(aes.encrypt(plaintext)), number=iterations, repeat=5)
+        )
+        / iterations
+    )
+
+
+def main():
+    """Print the round-trip latency per payload size and metrics state."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+    aes = AESEncryption()
+
+    print(f'{"payload":>8} {"state":<10} {"us/op":>7} {"overhead":>9}')
+    for size in PAYLOAD_SIZES:
+        plaintext = 'x' * size
+        baseline = measure(aes, plaintext, iterations)
+        print(f'{size:>8} {"off":<10} {baseline * 1e6:>7.2f}')
+
+        registry = MetricsRegistry()
+        metrics.enable(registry)
+        enabled = measure(aes, plaintext, iterations)
+        metrics.disable()
+        disabled = measure(aes, plaintext, iterations)
+
+        for state, latency in (('enabled', enabled), ('disabled', disabled)):
+            print(
+                f'{size:>8} {state:<10} {latency * 1e6:>7.2f} '
+                f'{(latency - baseline) * 1e6:>+7.2f}us'
+            )
+
+
+if __name__ == '__main__':
+    main()
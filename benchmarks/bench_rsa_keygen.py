@@ -0,0 +1,42 @@
+"""Benchmark RSA key generation throughput against the number of worker processes.
+
+Run with: ``python -m benchmarks.bench_rsa_keygen [keys]``
+"""
+
+import os
+import sys
+import time
+
+from confy_addons import RSAEncryption
+
+DEFAULT_KEYS = 16
+
+
+def worker_counts() -> list[int]:
+    """Return powers of two up to the CPU count, plus the CPU count itself."""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main():
+    """Print keys/sec and speedup of RSAEncryption.generate_many per worker count."""
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_KEYS
+    print(f'{keys} x 4096-bit keys on {os.cpu_count()} CPU(s)')
+    print(f'{"workers":>8} {"keys/s":>8} {"speedup":>8}')
+
+    baseline = None
+    for workers in worker_counts():
+        start = time.perf_counter()
+        RSAEncryption.generate_many(keys, workers=workers)
+        rate = keys / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f'{workers:>8} {rate:>8.2f} {rate / baseline:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
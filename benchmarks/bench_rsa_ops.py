@@ -0,0 +1,88 @@
+"""Micro-benchmark RSA operations with per-call and shared padding objects.
+
+Run with: ``python -m benchmarks.bench_rsa_ops``
+"""
+
+import timeit
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+
+from confy_addons import RSAEncryption, RSAPublicEncryption
+from confy_addons.encryption.rsa import PSS_AUTO_SHA256, PSS_DIGEST_LENGTH_SHA256
+
+REPEAT = 5
+DATA = b'A' * 32
+
+
+def oaep() -> padding.OAEP:
+    """Build an OAEP padding the way every call used to."""
+    return padding.OAEP(
+        mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None
+    )
+
+
+def pss() -> padding.PSS:
+    """Build a PSS padding the way every call used to."""
+    return padding.PSS(
+        mgf=padding.MGF1(algorithm=hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
+    )
+
+
+def calls_per_second(func, number: int) -> float:
+    """Return the best observed call rate of func over REPEAT rounds."""
+    return number / min(timeit.repeat(func, number=number, repeat=REPEAT))
+
+
+def main():
+    """Print calls/sec of each RSA operation before and after sharing paddings."""
+    rsa = RSAEncryption()
+    rsa_pub = RSAPublicEncryption(rsa.public_key)
+    private_key, public_key = rsa.private_key, rsa.public_key
+    ciphertext = rsa_pub.encrypt(DATA)
+    signature = rsa.sign(DATA)
+
+    digest_rsa = RSAEncryption.from_private_key(
+        private_key, signature_padding=PSS_DIGEST_LENGTH_SHA256
+    )
+    digest_signature = digest_rsa.sign(DATA)
+    auto_pub = RSAPublicEncryption(public_key, signature_padding=PSS_AUTO_SHA256)
+
+    cases = (
+        ('encrypt', lambda: public_key.encrypt(DATA, oaep()), lambda: rsa_pub.encrypt(DATA), 2000),
+        (
+            'decrypt',
+            lambda: private_key.decrypt(ciphertext, oaep()),
+            lambda: rsa.decrypt(ciphertext),
+            100,
+        ),
+        (
+            'sign',
+            lambda: private_key.sign(DATA, pss(), hashes.SHA256()),
+            lambda: rsa.sign(DATA),
+            100,
+        ),
+        (
+            'verify',
+            lambda: public_key.verify(signature, DATA, pss(), hashes.SHA256()),
+            lambda: rsa_pub.verify(DATA, signature),
+            2000,
+        ),
+        ('sign (digest salt)', lambda: rsa.sign(DATA), lambda: digest_rsa.sign(DATA), 100),
+        (
+            'verify (auto salt)',
+            lambda: rsa_pub.verify(DATA, signature),
+            lambda: auto_pub.verify(DATA, digest_signature),
+            2000,
+        ),
+    )
+
+    print(f'{"operation":>20} {"before/s":>10} {"after/s":>10} {"speedup":>8}')
+    for name, before_func, after_func, number in cases:
+        before = calls_per_second(before_func, number)
+        after = calls_per_second(after_func, number)
+        print(f'{name:>20} {before:>10,.0f} {after:>10,.0f} {after / before:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
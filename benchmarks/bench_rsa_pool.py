@@ -0,0 +1,44 @@
+"""Benchmark how much RSA key pool refills stall the application's threads.
+
+While a pool fills up in the background, the main thread sleeps for a fixed
+interval in a loop and records how late it wakes up; the worst delay is the
+time the application could not run Python code. Refilling on threads holds
+the GIL for each whole key generation, refilling on processes does not.
+
+Run with: ``python -m benchmarks.bench_rsa_pool [keys]``
+"""
+
+import sys
+import time
+
+from confy_addons import RSAKeyPool
+
+DEFAULT_KEYS = 4
+TICK_INTERVAL = 0.001
+
+
+def fill(keys: int, processes: bool) -> tuple[float, float]:
+    """Return (elapsed, worst lag) in seconds while a pool generates keys."""
+    worst = 0.0
+    with RSAKeyPool(target_size=keys, processes=processes) as pool:
+        start = time.perf_counter()
+        while not pool.wait_ready(timeout=0):
+            tick = time.perf_counter()
+            time.sleep(TICK_INTERVAL)
+            worst = max(worst, time.perf_counter() - tick - TICK_INTERVAL)
+        elapsed = time.perf_counter() - start
+    return elapsed, worst
+
+
+def main():
+    """Print fill time and worst main thread lag for both refill modes."""
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_KEYS
+    print(f'{keys} x 4096-bit keys')
+    print(f'{"refill":<10} {"elapsed ms":>11} {"max lag ms":>11}')
+    for name, processes in (('threads', False), ('processes', True)):
+        elapsed, lag = fill(keys, processes)
+        print(f'{name:<10} {elapsed * 1000:>11.1f} {lag * 1000:>11.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark throughput scaling of shared handlers across threads.
+
+Every thread runs encrypt + decrypt round trips on the same handler instance
+for a fixed time; the benchmark reports the aggregate throughput and the
+speedup over a single thread. On GIL builds the speedup is bounded by the
+share of time cryptography spends with the GIL released; on free-threaded
+builds (CPython 3.13t/3.14t) it should grow with the number of cores.
+
+Run with: ``python -m benchmarks.bench_threads [seconds]``
+"""
+
+import os
+import platform
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from confy_addons import AEADEncryption, AESEncryption
+
+DEFAULT_SECONDS = 1.0
+PAYLOAD_SIZE = 4096
+
+
+def throughput(func: Callable[[], object], threads: int, seconds: float) -> float:
+    """Return the aggregate calls per second of func run on every thread at once."""
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+
+    def work() -> int:
+        calls = 0
+        barrier.wait()
+        while not stop.is_set():
+            func()
+            calls += 1
+        return calls
+
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(work) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        time.sleep(seconds)
+        stop.set()
+        total = sum(future.result() for future in futures)
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+def main():
+    """Print throughput and speedup per handler and thread count."""
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SECONDS
+    cpus = os.cpu_count() or 1
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    thread_counts = sorted({1, 2, 4, 8, cpus})
+
+    aes, aead = AESEncryption(), AEADEncryption()
+    text = 'x' * PAYLOAD_SIZE
+    data = b'x' * PAYLOAD_SIZE
+    cases = {
+        'aes text': lambda: aes.decrypt(aes.encrypt(text)),
+        'aes bytes': lambda: aes.decrypt_bytes(aes.encrypt_bytes(data)),
+        'aead bytes': lambda: aead.decrypt_bytes(aead.encrypt_bytes(data)),
+    }
+
+    print(
+        f'{platform.python_implementation()} {platform.python_version()}, '
+        f'GIL {"enabled" if is_gil_enabled else "disabled"}, {cpus} CPU(s), '
+        f'{PAYLOAD_SIZE} byte payloads'
+    )
+    print(f'{"case":<12} {"threads":>7} {"ops/s":>10} {"speedup":>8}')
+    for name, func in cases.items():
+        single = None
+        for threads in thread_counts:
+            rate = throughput(func, threads, seconds)
+            single = single or rate
+            print(f'{name:<12} {threads:>7} {rate:>10.0f} {rate / single:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
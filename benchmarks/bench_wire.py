@@ -0,0 +1,51 @@
+"""Benchmark bytes and time per AES message in the text and binary wire formats.
+
+Run with: ``python -m benchmarks.bench_wire [messages]``
+"""
+
+import secrets
+import sys
+import time
+
+from confy_addons import AESEncryption
+from confy_addons.codec import MessageType, decode
+from confy_addons.prefixes import AES_PREFIX
+from confy_addons.wire import pack, unpack
+
+DEFAULT_MESSAGES = 20_000
+PAYLOAD_SIZES = (64, 1024, 16 * 1024)
+
+
+def text_round_trip(aes: AESEncryption, plaintext: bytes) -> int:
+    """Send plaintext as a text frame and return the frame size."""
+    frame = f'{AES_PREFIX}{aes.encrypt(plaintext.decode("ascii"))}'
+    aes.decrypt(str(decode(frame).payload))
+    return len(frame.encode('ascii'))
+
+
+def binary_round_trip(aes: AESEncryption, plaintext: bytes) -> int:
+    """Send plaintext as a binary frame and return the frame size."""
+    frame = pack(MessageType.AES, aes.encrypt_bytes(plaintext))
+    aes.decrypt_bytes(unpack(frame).payload)  # type: ignore[arg-type]
+    return len(frame)
+
+
+def main():
+    """Print bytes and microseconds per message for each format and payload size."""
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MESSAGES
+    aes = AESEncryption()
+
+    print(f'{"payload":>8} {"format":<7} {"bytes/msg":>10} {"us/msg":>8}')
+    for size in PAYLOAD_SIZES:
+        plaintext = secrets.token_hex(size // 2).encode('ascii')
+        for name, round_trip in (('text', text_round_trip), ('binary', binary_round_trip)):
+            count = max(messages * 64 // size, 100)
+            start = time.perf_counter()
+            for _ in range(count):
+                frame_size = round_trip(aes, plaintext)
+            elapsed = (time.perf_counter() - start) / count
+            print(f'{size:>8} {name:<7} {frame_size:>10} {elapsed * 1e6:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
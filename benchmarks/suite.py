@@ -0,0 +1,235 @@
+"""Benchmark suite for every encryption primitive with regression tracking.
+
+Each case is timed over several rounds and its median time per operation is
+saved as JSON together with the Python, cryptography and confy-addons
+versions. Given a baseline file, the run fails when any case is slower than
+its baseline by more than the threshold, so upgrades of confy-addons or
+cryptography can be checked against latency targets.
+
+Run with: ``python -m benchmarks.suite [--output FILE] [--baseline FILE]``
+
+Typical workflow::
+
+    python -m benchmarks.suite --output baseline.json    # before upgrading
+    python -m benchmarks.suite --baseline baseline.json  # after upgrading
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from importlib import metadata
+from typing import NamedTuple, Optional
+
+from confy_addons import AESEncryption, RSAEncryption, RSAPublicEncryption, deserialize_public_key
+
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_KEY_SIZES = (4096, 8192)
+PAYLOAD_SIZES = (64, 1024, 16 * 1024, 256 * 1024)
+TARGET_ROUND_SECONDS = 0.05
+
+
+class Case(NamedTuple):
+    """A benchmarked operation.
+
+    Attributes:
+        name: The unique name of the case, used as key in the JSON results.
+        func: The operation to time, called without arguments.
+        rounds: How many timed rounds to run.
+        calibrate: Whether to repeat the operation within each round until it
+            takes TARGET_ROUND_SECONDS; slow operations run once per round.
+
+    """
+
+    name: str
+    func: Callable[[], object]
+    rounds: int = 7
+    calibrate: bool = True
+
+
+def build_cases(key_sizes: tuple[int, ...], quick: bool) -> list[Case]:
+    """Return the cases covering every primitive."""
+    aes = AESEncryption()
+    rsa = RSAEncryption()
+    public = RSAPublicEncryption(rsa.public_key)
+    wrapped_key = public.encrypt(aes.key)
+    signature = rsa.sign(b'payload')
+    b64_public_key = rsa.base64_public_key
+    cases: list[Case] = []
+
+    for size in PAYLOAD_SIZES:
+        plaintext = 'x' * size
+        ciphertext = aes.encrypt(plaintext)
+        cases.extend((
+            Case(f'aes.encrypt[{size}]', partial(aes.encrypt, plaintext)),
+            Case(f'aes.decrypt[{size}]', partial(aes.decrypt, ciphertext)),
+        ))
+
+    cases.extend((
+        Case('rsa.decrypt', lambda: rsa.decrypt(wrapped_key)),
+        Case('rsa.sign', lambda: rsa.sign(b'payload')),
+        Case('rsa_public.encrypt', lambda: public.encrypt(aes.key)),
+        Case('rsa_public.verify', lambda: public.verify(b'payload', signature)),
+        Case('deserialize_public_key', lambda: deserialize_public_key(b64_public_key)),
+    ))
+
+    # Key generation time varies a lot between runs, so it gets more rounds.
+    for key_size in key_sizes:
+        rounds = max(3, 10 * 4096 // key_size)
+        cases.append(
+            Case(
+                f'rsa.generate[{key_size}]',
+                partial(RSAEncryption, key_size=key_size),
+                rounds=rounds,
+                calibrate=False,
+            )
+        )
+
+    if quick:
+        return [case._replace(rounds=min(case.rounds, 3)) for case in cases]
+    return cases
+
+
+def measure(case: Case) -> dict:
+    """Time a case and return its statistics in seconds per operation."""
+    number = 1
+    if case.calibrate:
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                case.func()
+            if time.perf_counter() - start >= TARGET_ROUND_SECONDS:
+                break
+            number *= 2
+
+    timings = []
+    for _ in range(case.rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            case.func()
+        timings.append((time.perf_counter() - start) / number)
+
+    return {
+        'median': statistics.median(timings),
+        'min': min(timings),
+        'max': max(timings),
+        'rounds': case.rounds,
+        'number': number,
+    }
+
+
+def environment() -> dict:
+    """Return the versions that the results depend on."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cryptography': metadata.version('cryptography'),
+        'confy-addons': _package_version('confy-addons'),
+    }
+
+
+def _package_version(name: str) -> Optional[str]:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[tuple[str, float, float]]:
+    """Print the comparison with the baseline and return the regressions.
+
+    Returns:
+        list[tuple[str, float, float]]: The name, baseline median and current
+            median of every case slower than baseline * (1 + threshold).
+
+    """
+    regressions = []
+    print(f'\n{"case":<28} {"baseline":>12} {"current":>12} {"change":>8}')
+    for name, current in results['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            print(f'{name:<28} {"-":>12} {_format(current["median"]):>12} {"new":>8}')
+            continue
+        change = current['median'] / previous['median'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append((name, previous['median'], current['median']))
+            flag = '  REGRESSION'
+        print(
+            f'{name:<28} {_format(previous["median"]):>12} {_format(current["median"]):>12} '
+            f'{change:>+8.1%}{flag}'
+        )
+    return regressions
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3)):
+        if seconds >= scale:
+            return f'{seconds / scale:.2f} {unit}'
+    return f'{seconds * 1e6:.1f} us'
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Return the parsed command line arguments."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='compare the results with this JSON file')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='allowed slowdown over the baseline median (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--key-sizes',
+        type=int,
+        nargs='+',
+        default=list(DEFAULT_KEY_SIZES),
+        help='RSA key sizes timed for key generation (default: %(default)s)',
+    )
+    parser.add_argument('--filter', help='only run cases whose name contains this text')
+    parser.add_argument('--quick', action='store_true', help='run fewer rounds per case')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the suite and return the process exit status."""
+    args = parse_args(argv)
+    cases = build_cases(tuple(args.key_sizes), args.quick)
+    if args.filter:
+        cases = [case for case in cases if args.filter in case.name]
+
+    results: dict = {'environment': environment(), 'results': {}}
+    print(f'{"case":<28} {"median":>12} {"min":>12}')
+    for case in cases:
+        stats = measure(case)
+        results['results'][case.name] = stats
+        print(f'{case.name:<28} {_format(stats["median"]):>12} {_format(stats["min"]):>12}')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+            file.write('\n')
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f'\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}')
+        return 1
+    print(f'\nNo regressions beyond {args.threshold:.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,110 @@
-from confy_addons.encryption import (
-    AESEncryption,
-    RSAEncryption,
-    RSAPublicEncryption,
-    deserialize_public_key,
+"""Encryption add-ons for Confy.
+
+Public names are imported on first access, so tools that only need the
+prefixes or messages constants do not pay for importing cryptography.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from confy_addons import core, encryption
+    from confy_addons.core.log import get_log_level, is_quiet, quiet, set_log_level
+    from confy_addons.core.registry import PeerSession, SessionRegistry
+    from confy_addons.encryption import (
+        AEADEncryption,
+        AESEncryption,
+        AESSession,
+        AsyncAESEncryption,
+        AsyncRSAEncryption,
+        AsyncRSAPublicEncryption,
+        Ed25519Signer,
+        Ed25519Verifier,
+        EnvelopeEncryption,
+        PublicKeyCache,
+        RSAEncryption,
+        RSAKeyPool,
+        RSAPublicEncryption,
+        SealedEnvelope,
+        X25519KeyExchange,
+        ZlibCompression,
+        deserialize_public_key,
+        open_envelope,
+    )
+
+# The module defining each public name.
+_EXPORTS: dict[str, str] = {
+    **{
+        name: 'confy_addons.core.log'
+        for name in ('get_log_level', 'is_quiet', 'quiet', 'set_log_level')
+    },
+    **{name: 'confy_addons.core.registry' for name in ('PeerSession', 'SessionRegistry')},
+    **{
+        name: 'confy_addons.encryption'
+        for name in (
+            'AEADEncryption',
+            'AESEncryption',
+            'AESSession',
+            'AsyncAESEncryption',
+            'AsyncRSAEncryption',
+            'AsyncRSAPublicEncryption',
+            'Ed25519Signer',
+            'Ed25519Verifier',
+            'EnvelopeEncryption',
+            'PublicKeyCache',
+            'RSAEncryption',
+            'RSAKeyPool',
+            'RSAPublicEncryption',
+            'SealedEnvelope',
+            'X25519KeyExchange',
+            'ZlibCompression',
+            'deserialize_public_key',
+            'open_envelope',
+        )
+    },
+}
+
+# Subpackages and submodules imported on attribute access, as
+# confy_addons.encryption.aes worked when the package imported eagerly.
+_SUBMODULES = (
+    'codec',
+    'core',
+    'encryption',
+    'http_messages',
+    'messages',
+    'metrics',
+    'prefixes',
+    'wire',
 )
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import a public name or submodule on first access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The exported object or submodule.
+
+    Raises:
+        AttributeError: If name is not exported by the package.
+
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including the names not imported yet."""
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
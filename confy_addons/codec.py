@@ -0,0 +1,179 @@
+"""Module parses and builds prefixed frames exchanged between Confy clients.
+
+Every frame starts with one of the prefixes defined in confy_addons.prefixes.
+All prefixes end with their only colon, so a frame is split once at the
+first colon and the head is looked up in a table, instead of testing each
+prefix in turn. Frames can be str or bytes; the payload keeps the type
+of the frame, so nothing is re-encoded.
+
+This file is licensed under the GNU GPL-3.0 license.
+See the LICENSE file at the root of this repository for full details.
+"""
+
+from enum import Enum
+from typing import Optional, Union
+
+from confy_addons.core.log import get_logger
+from confy_addons.prefixes import (
+    AES_KEY_PREFIX,
+    AES_PREFIX,
+    KEY_EXCHANGE_PREFIX,
+    SYSTEM_ERROR_PREFIX,
+    SYSTEM_PREFIX,
+)
+
+logger = get_logger(__name__)
+
+Frame = Union[str, bytes, bytearray]
+
+
+class MessageType(Enum):
+    """Kinds of frames, valued by their prefix."""
+
+    SYSTEM = SYSTEM_PREFIX
+    KEY_EXCHANGE = KEY_EXCHANGE_PREFIX
+    AES_KEY = AES_KEY_PREFIX
+    AES = AES_PREFIX
+    SYSTEM_ERROR = SYSTEM_ERROR_PREFIX
+
+
+# Lookup tables keyed by the prefix without its trailing colon, as returned by
+# str.partition and bytes.partition.
+_STR_PREFIXES: dict[str, MessageType] = {kind.value[:-1]: kind for kind in MessageType}
+_BYTES_PREFIXES: dict[bytes, MessageType] = {
+    kind.value[:-1].encode('ascii'): kind for kind in MessageType
+}
+_ENCODED_PREFIXES: dict[MessageType, bytes] = {
+    kind: kind.value.encode('ascii') for kind in MessageType
+}
+_MAX_PREFIX_SIZE = max(len(kind.value) for kind in MessageType)
+
+
+class Message:
+    """A frame split into its kind and payload.
+
+    Attributes:
+        kind: The kind of the frame.
+        payload: The frame without its prefix, of the same type as the frame.
+
+    """
+
+    __slots__ = ('kind', 'payload')
+
+    def __init__(self, kind: MessageType, payload: Frame):
+        """Initialize a Message.
+
+        Args:
+            kind: The kind of the frame.
+            payload: The frame content after the prefix.
+
+        """
+        self.kind = kind
+        self.payload = payload
+
+    def __repr__(self):
+        """Return a string representation of the Message instance.
+
+        Returns:
+            str: A string representation including module, class name, and fields.
+
+        """
+        class_name = type(self).__name__
+        return f'{self.__module__}.{class_name}(kind={self.kind}, payload={self.payload!r})'
+
+    def __eq__(self, other):
+        """Return whether both messages have the same kind and payload."""
+        if not isinstance(other, Message):
+            return NotImplemented
+        return self.kind is other.kind and self.payload == other.payload
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def encode(self) -> Frame:
+        """Return the message as a prefixed frame of the payload's type.
+
+        Returns:
+            Frame: The prefixed frame.
+
+        """
+        return encode(self.kind, self.payload)
+
+
+def classify(frame: Frame) -> Optional[MessageType]:
+    """Return the kind of a frame, or None if it has no known prefix.
+
+    Args:
+        frame: The str or bytes frame.
+
+    Returns:
+        Optional[MessageType]: The kind of the frame.
+
+    Raises:
+        TypeError: If frame is neither str nor bytes.
+
+    """
+    if isinstance(frame, str):
+        end = frame.find(':', 0, _MAX_PREFIX_SIZE)
+        return _STR_PREFIXES.get(frame[:end]) if end > 0 else None
+    if isinstance(frame, (bytes, bytearray)):
+        end = frame.find(b':', 0, _MAX_PREFIX_SIZE)
+        return _BYTES_PREFIXES.get(bytes(frame[:end])) if end > 0 else None
+    logger.error('Invalid frame type: %s', type(frame))
+    raise TypeError('frame must be str, bytes or bytearray')
+
+
+def decode(frame: Frame) -> Message:
+    """Split a frame into its kind and payload.
+
+    Args:
+        frame: The str or bytes frame.
+
+    Returns:
+        Message: The kind of the frame and its payload, of the frame's type.
+
+    Raises:
+        TypeError: If frame is neither str nor bytes.
+        ValueError: If the frame has no known prefix.
+
+    """
+    payload: Frame
+    if isinstance(frame, str):
+        head, separator, payload = frame.partition(':')
+        kind = _STR_PREFIXES.get(head) if separator else None
+    elif isinstance(frame, (bytes, bytearray)):
+        raw_head, raw_separator, payload = frame.partition(b':')
+        kind = _BYTES_PREFIXES.get(bytes(raw_head)) if raw_separator else None
+    else:
+        logger.error('Invalid frame type: %s', type(frame))
+        raise TypeError('frame must be str, bytes or bytearray')
+
+    if kind is None:
+        logger.error('Frame does not start with a known prefix')
+        raise ValueError('Unknown message prefix')
+
+    return Message(kind, payload)
+
+
+def encode(kind: MessageType, payload: Frame) -> Frame:
+    """Build a prefixed frame of the payload's type.
+
+    Args:
+        kind: The kind of the frame.
+        payload: The str or bytes payload.
+
+    Returns:
+        Frame: The prefix followed by the payload.
+
+    Raises:
+        TypeError: If kind is not a MessageType or payload is neither str nor bytes.
+
+    """
+    if not isinstance(kind, MessageType):
+        logger.error('Invalid kind type: %s', type(kind))
+        raise TypeError('kind must be a MessageType')
+    if isinstance(payload, str):
+        return kind.value + payload
+    if isinstance(payload, (bytes, bytearray)):
+        return _ENCODED_PREFIXES[kind] + payload
+    logger.error('Invalid payload type: %s', type(payload))
+    raise TypeError('payload must be str, bytes or bytearray')
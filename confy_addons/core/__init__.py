@@ -0,0 +1,33 @@
+"""Core building blocks of confy_addons.
+
+Submodules are imported on first access, so confy_addons.core.constants
+resolves after a plain import confy_addons.
+"""
+
+import importlib
+
+# Submodules imported on attribute access.
+_SUBMODULES = ('abstract', 'constants', 'exceptions', 'log', 'mixins', 'registry')
+
+
+def __getattr__(name: str):
+    """Import a submodule on first access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The submodule.
+
+    Raises:
+        AttributeError: If name is not a submodule of the package.
+
+    """
+    if name not in _SUBMODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return importlib.import_module(f'{__name__}.{name}')
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including the submodules not imported yet."""
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -1,8 +1,10 @@
-"""Abstract base class for encryption handlers.
+"""Abstract base classes for encryption handlers and their extension points.
 
-This module defines an abstract base class that specifies the interface
-for encryption handlers. Any concrete encryption handler must implement
-the methods defined in this abstract base class.
+This module defines abstract base classes that specify the interface
+for encryption handlers, for the compression codecs they can use and
+for the sinks receiving their metrics.
+Any concrete implementation must implement the methods defined in its
+abstract base class.
 """
 
 from abc import ABC, abstractmethod
@@ -15,6 +17,8 @@ class AESEncryptionABC(ABC):
     implementation of encryption and decryption methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def encrypt(self, plaintext: str) -> str:
         """Encrypts the given plaintext string.
@@ -40,3 +44,57 @@ class AESEncryptionABC(ABC):
 
         """
         pass  # pragma: no cover
+
+
+class CompressionCodecABC(ABC):
+    """Abstract base class for compression codecs.
+
+    This class defines the interface for codecs that compress payloads
+    before they are encrypted. A codec shared by an encryption handler is
+    called from every thread using the handler, so it must be thread-safe.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresses the given data.
+
+        Args:
+            data (bytes): The data to be compressed.
+
+        Returns:
+            bytes: The compressed data.
+
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompresses the given data.
+
+        Args:
+            data (bytes): The data to be decompressed.
+
+        Returns:
+            bytes: The decompressed data.
+
+        """
+        pass  # pragma: no cover
+
+
+class MetricsSinkABC(ABC):
+    """Abstract base class for metrics sinks.
+
+    This class defines the interface for sinks that receive a record of
+    every instrumented encryption operation while metrics are enabled.
+    """
+
+    @abstractmethod
+    def record(self, event) -> None:
+        """Record an instrumented operation.
+
+        Args:
+            event (MetricEvent): The operation name, payload size, duration
+                and whether it raised.
+
+        """
+        pass  # pragma: no cover
@@ -5,6 +5,31 @@ from typing import Final
 
 DEFAULT_RSA_KEY_SIZE: Final[int] = 4096
 RSA_PUBLIC_EXPONENT: Final[int] = 65537
+DEFAULT_RSA_POOL_SIZE: Final[int] = 4
+DEFAULT_RSA_POOL_WORKERS: Final[int] = 1
+DEFAULT_PUBLIC_KEY_CACHE_SIZE: Final[int] = 1024
+X25519_PUBLIC_KEY_SIZE: Final[int] = 32  # 256 bits
 AES_KEY_SIZE: Final[int] = 32  # 256 bits
 AES_IV_SIZE: Final[int] = 16  # 128 bits
+AES_STREAM_CHUNK_SIZE: Final[int] = 64 * 1024  # 64 KiB
+DEFAULT_RANDOM_POOL_BLOCK_SIZE: Final[int] = 4096  # 256 AES IVs per system call
+AEAD_NONCE_SIZE: Final[int] = 12  # 96 bits
+AEAD_TAG_SIZE: Final[int] = 16  # 128 bits
+AEAD_AES_256_GCM: Final[int] = 0x01  # Wire format header: version 1, AES-256-GCM
+AEAD_CHACHA20_POLY1305: Final[int] = 0x02  # Wire format header: version 1, ChaCha20-Poly1305
+DEFAULT_AEAD_ALGORITHM: Final[int] = AEAD_AES_256_GCM
+COMPRESSION_FLAG_RAW: Final[int] = 0x00
+COMPRESSION_FLAG_COMPRESSED: Final[int] = 0x01
+DEFAULT_COMPRESSION_THRESHOLD: Final[int] = 256  # bytes
+DEFAULT_ZLIB_LEVEL: Final[int] = 6
+DEFAULT_DECOMPRESSED_MAX_SIZE: Final[int] = 16 * 1024 * 1024  # 16 MiB
+WIRE_FORMAT_VERSION: Final[int] = 0x01
+SESSION_KEY_ID_SIZE: Final[int] = 4  # 32 bits
+DEFAULT_SESSION_MAX_MESSAGES: Final[int] = 100_000
+DEFAULT_SESSION_MAX_AGE: Final[float] = 3600.0  # 1 hour
+DEFAULT_SESSION_KEY_WINDOW: Final[int] = 4
+DEFAULT_SESSION_MAX_SKIP: Final[int] = 64
+DEFAULT_SESSION_REGISTRY_SIZE: Final[int] = 10_000
+DEFAULT_SESSION_REGISTRY_TTL: Final[float] = 1800.0  # 30 minutes idle
+LOGGER_NAME: Final[str] = 'confy_addons'
 LOGGER_LEVEL: Final[int] = logging.INFO
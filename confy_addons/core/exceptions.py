@@ -11,3 +11,11 @@ class EncryptionError(Exception):
 
 class DecryptionError(Exception):
     pass
+
+
+class IntegrityError(DecryptionError):
+    pass
+
+
+class SignatureVerificationError(Exception):
+    pass
@@ -0,0 +1,120 @@
+"""Logging setup of the confy_addons package.
+
+Every module logs to a child of the 'confy_addons' logger, obtained with
+get_logger, with lazy %-style arguments, so messages filtered out by the
+level are never formatted. The package logger only has a NullHandler: the
+host application decides where records go by configuring logging itself,
+as with any library.
+
+The level defaults to LOGGER_LEVEL and can be changed with set_log_level.
+Hot loops that expect failures, such as trial decryption of untrusted
+frames, can silence the package entirely with the quiet context manager,
+which skips the creation of log records:
+
+    with quiet():
+        for frame in frames:
+            try:
+                messages.append(aes.decrypt(frame))
+            except ValueError:
+                pass
+
+The level and quiet mode apply to the whole process, not only to the
+current thread.
+"""
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from confy_addons.core.constants import LOGGER_LEVEL, LOGGER_NAME
+
+# Above CRITICAL, so that no record passes the level check.
+_QUIET_LEVEL = logging.CRITICAL + 1
+
+logger = logging.getLogger(LOGGER_NAME)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(LOGGER_LEVEL)
+
+_lock = threading.Lock()
+_state = {'level': LOGGER_LEVEL, 'quiet': 0}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the logger of a confy_addons module.
+
+    Modules get their logger here rather than from logging directly, so the
+    package logger is set up whichever module is imported first.
+
+    Args:
+        name: The module name, a child of 'confy_addons'.
+
+    Returns:
+        logging.Logger: The module logger.
+
+    """
+    return logging.getLogger(name)
+
+
+def set_log_level(level: int):
+    """Set the level of the confy_addons loggers.
+
+    Args:
+        level: The logging level, such as logging.DEBUG or logging.ERROR.
+
+    Raises:
+        TypeError: If level is not an integer.
+
+    """
+    if not isinstance(level, int):
+        logger.error('Invalid level type: %s', type(level))
+        raise TypeError('level must be an integer')
+
+    with _lock:
+        _state['level'] = level
+        if not _state['quiet']:
+            logger.setLevel(level)
+
+
+def get_log_level() -> int:
+    """Return the level set with set_log_level, ignoring quiet mode.
+
+    Returns:
+        int: The logging level.
+
+    """
+    return _state['level']
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """Silence every confy_addons logger inside the block.
+
+    Blocks can be nested and entered from several threads; logging resumes
+    at the configured level when the last one exits.
+
+    Yields:
+        None
+
+    """
+    with _lock:
+        _state['quiet'] += 1
+        logger.setLevel(_QUIET_LEVEL)
+
+    try:
+        yield
+    finally:
+        with _lock:
+            _state['quiet'] -= 1
+            if not _state['quiet']:
+                logger.setLevel(_state['level'])
+
+
+def is_quiet() -> bool:
+    """Return whether the confy_addons loggers are silenced.
+
+    Returns:
+        bool: True inside a quiet block.
+
+    """
+    return _state['quiet'] > 0
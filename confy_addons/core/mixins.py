@@ -7,8 +7,13 @@ class EncryptionMixin:
     This mixin provides a common interface for encryption handler classes,
     allowing them to be identified as encryption-related classes.
 
+    It defines no instance attributes, so subclasses declaring __slots__
+    have no per-instance __dict__.
+
     """
 
+    __slots__ = ()
+
     def __delattr__(self, _):
         """Prevent deletion of attributes to enhance security.
 
@@ -0,0 +1,344 @@
+"""Registry of the crypto handles of active peer sessions.
+
+Servers keep, for every connected peer, the symmetric handler of the
+conversation and the RSA public key handler of the peer. This module
+provides a store keyed by peer ID with O(1) lookups that evicts the least
+recently used sessions beyond a size cap and the sessions idle for longer
+than a time to live, so handles of abandoned chats do not pile up. The
+symmetric keys of every session leaving the registry are wiped.
+
+max_sessions caps the number of sessions, not their memory. What a session
+costs depends on its handlers: a few hundred bytes for an AES or AEAD
+handler, more for an AESSession, which keeps window + 1 message keys, plus
+the peer public key object (see benchmarks/bench_memory.py). Size the cap
+from the handlers the application actually stores.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Union
+
+from confy_addons.core.constants import DEFAULT_SESSION_REGISTRY_SIZE, DEFAULT_SESSION_REGISTRY_TTL
+from confy_addons.core.log import get_logger
+from confy_addons.encryption.aead import AEADEncryption
+from confy_addons.encryption.aes import AESEncryption
+from confy_addons.encryption.rsa import RSAPublicEncryption
+from confy_addons.encryption.session import AESSession
+
+logger = get_logger(__name__)
+
+SymmetricHandle = Union[AESEncryption, AEADEncryption, AESSession]
+
+
+class PeerSession(NamedTuple):
+    """The crypto handles of a peer session.
+
+    Attributes:
+        aes: The symmetric handler of the conversation.
+        public: The handler of the peer RSA public key, if known.
+
+    """
+
+    aes: SymmetricHandle
+    public: Optional[RSAPublicEncryption] = None
+
+
+class SessionRegistryStats(NamedTuple):
+    """Snapshot of the metrics of a SessionRegistry.
+
+    Attributes:
+        hits: How many lookups found a session.
+        misses: How many lookups found no live session.
+        evictions: How many sessions were dropped for size.
+        expirations: How many sessions were dropped for being idle.
+        size: How many sessions the registry holds.
+        max_sessions: The maximum number of sessions.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_sessions: int
+
+
+class _Entry:
+    __slots__ = ('expires_at', 'session')
+
+    def __init__(self, session: PeerSession, expires_at: Optional[float]):
+        self.session = session
+        self.expires_at = expires_at
+
+
+class SessionRegistry:
+    """Thread-safe LRU store of peer sessions with idle expiry.
+
+    The registry owns the symmetric handlers it holds: they are wiped when
+    their session is removed, replaced, evicted or expires, and must not be
+    used afterwards.
+
+    Attributes:
+        max_sessions: The maximum number of sessions, a count rather than
+            a memory budget.
+        ttl: How long a session may stay idle, in seconds, or None.
+
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_SESSION_REGISTRY_SIZE,
+        ttl: Optional[float] = DEFAULT_SESSION_REGISTRY_TTL,
+    ):
+        """Initialize an empty registry.
+
+        Args:
+            max_sessions: The maximum number of sessions; the least recently
+                used session is evicted beyond it. This caps the count of
+                sessions, whatever memory each of them holds.
+            ttl: How long a session stays valid after it was last stored or
+                looked up, in seconds. None keeps sessions until they are
+                evicted for size.
+
+        Raises:
+            TypeError: If max_sessions is not an integer or ttl is not a number.
+            ValueError: If max_sessions or ttl are not positive.
+
+        """
+        if not isinstance(max_sessions, int):
+            logger.error('Invalid max_sessions type: %s', type(max_sessions))
+            raise TypeError('max_sessions must be an integer')
+        if max_sessions <= 0:
+            logger.error('Invalid max_sessions value: %s', max_sessions)
+            raise ValueError('max_sessions must be a positive integer')
+        if ttl is not None:
+            if not isinstance(ttl, (int, float)):
+                logger.error('Invalid ttl type: %s', type(ttl))
+                raise TypeError('ttl must be a number of seconds')
+            if ttl <= 0:
+                logger.error('Invalid ttl value: %s', ttl)
+                raise ValueError('ttl must be positive')
+
+        self._max_sessions = max_sessions
+        self._ttl = ttl
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __repr__(self):
+        """Return a string representation of the SessionRegistry instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                parameters, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(max_sessions={self._max_sessions!r}, '
+            f'ttl={self._ttl!r}) object at {hex(id(self))}'
+        )
+
+    def __len__(self):
+        """Return the number of sessions, including idle ones not purged yet."""
+        return len(self._entries)
+
+    def __contains__(self, peer_id: object) -> bool:
+        """Return whether a live session is stored for peer_id.
+
+        Unlike get, this does not refresh the session.
+        """
+        if not isinstance(peer_id, str):
+            return False
+        entry = self._entries.get(peer_id)
+        return entry is not None and not self._is_expired(entry, time.monotonic())
+
+    def put(
+        self, peer_id: str, aes: SymmetricHandle, public: Optional[RSAPublicEncryption] = None
+    ) -> PeerSession:
+        """Store the session of a peer, replacing and wiping any previous one.
+
+        Args:
+            peer_id: The ID of the peer.
+            aes: The symmetric handler of the conversation.
+            public: The handler of the peer RSA public key, if known.
+
+        Returns:
+            PeerSession: The stored session.
+
+        Raises:
+            TypeError: If peer_id is not a string or a handler has the wrong type.
+
+        """
+        _check_peer_id(peer_id)
+        if not isinstance(aes, (AESEncryption, AEADEncryption, AESSession)):
+            logger.error('Invalid aes type: %s', type(aes))
+            raise TypeError('aes must be an AESEncryption, AEADEncryption or AESSession')
+        if public is not None and not isinstance(public, RSAPublicEncryption):
+            logger.error('Invalid public type: %s', type(public))
+            raise TypeError('public must be an instance of RSAPublicEncryption')
+
+        now = time.monotonic()
+        session = PeerSession(aes, public)
+
+        with self._lock:
+            dropped = self._expire(now)
+            previous = self._entries.pop(peer_id, None)
+            if previous is not None and previous.session.aes is not aes:
+                dropped.append(previous.session)
+            self._entries[peer_id] = _Entry(session, self._expires_at(now))
+            while len(self._entries) > self._max_sessions:
+                dropped.append(self._entries.popitem(last=False)[1].session)
+                self._evictions += 1
+
+        _wipe(dropped)
+        return session
+
+    def get(self, peer_id: str) -> Optional[PeerSession]:
+        """Return the session of a peer and mark it as recently used.
+
+        Args:
+            peer_id: The ID of the peer.
+
+        Returns:
+            Optional[PeerSession]: The session, or None if there is no live
+                session for the peer.
+
+        Raises:
+            TypeError: If peer_id is not a string.
+
+        """
+        _check_peer_id(peer_id)
+        now = time.monotonic()
+
+        with self._lock:
+            dropped = self._expire(now)
+            entry = self._entries.get(peer_id)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                entry.expires_at = self._expires_at(now)
+                self._entries.move_to_end(peer_id)
+
+        _wipe(dropped)
+        return None if entry is None else entry.session
+
+    def remove(self, peer_id: str) -> bool:
+        """Remove the session of a peer and wipe its keys, as on logout.
+
+        Args:
+            peer_id: The ID of the peer.
+
+        Returns:
+            bool: Whether a session was stored for the peer.
+
+        Raises:
+            TypeError: If peer_id is not a string.
+
+        """
+        _check_peer_id(peer_id)
+
+        with self._lock:
+            entry = self._entries.pop(peer_id, None)
+
+        if entry is None:
+            return False
+        _wipe([entry.session])
+        return True
+
+    def purge(self) -> int:
+        """Remove and wipe every idle session now, instead of on the next access.
+
+        Returns:
+            int: How many sessions expired.
+
+        """
+        with self._lock:
+            dropped = self._expire(time.monotonic())
+
+        _wipe(dropped)
+        return len(dropped)
+
+    def clear(self):
+        """Remove and wipe every session, keeping the counters."""
+        with self._lock:
+            dropped = [entry.session for entry in self._entries.values()]
+            self._entries.clear()
+
+        _wipe(dropped)
+
+    def stats(self) -> SessionRegistryStats:
+        """Return a snapshot of the registry metrics.
+
+        Returns:
+            SessionRegistryStats: The hit, miss, eviction and expiration
+                counters and the current size.
+
+        """
+        with self._lock:
+            return SessionRegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_sessions=self._max_sessions,
+            )
+
+    @property
+    def max_sessions(self) -> int:
+        """Returns the maximum number of sessions.
+
+        Returns:
+            int: The maximum number of sessions.
+
+        """
+        return self._max_sessions
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Returns how long a session may stay idle, in seconds.
+
+        Returns:
+            Optional[float]: The time to live, or None for no expiry.
+
+        """
+        return self._ttl
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        return None if self._ttl is None else now + self._ttl
+
+    @staticmethod
+    def _is_expired(entry: _Entry, now: float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _expire(self, now: float) -> list[PeerSession]:
+        # Every access moves its entry to the end with a later expiry, so the
+        # idle sessions are always at the front: each one is popped only once.
+        dropped = []
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if not self._is_expired(entry, now):
+                break
+            self._entries.popitem(last=False)
+            dropped.append(entry.session)
+        self._expirations += len(dropped)
+        return dropped
+
+
+def _check_peer_id(peer_id: str):
+    if not isinstance(peer_id, str):
+        logger.error('Invalid peer_id type: %s', type(peer_id))
+        raise TypeError('peer_id must be a str')
+
+
+def _wipe(sessions: list[PeerSession]):
+    """Wipe the symmetric keys of sessions that left the registry."""
+    for session in sessions:
+        session.aes.wipe()
@@ -1,2 +1,102 @@
-from confy_addons.encryption.aes import AESEncryption
-from confy_addons.encryption.rsa import RSAEncryption, RSAPublicEncryption, deserialize_public_key
+"""Encryption handlers of confy_addons.
+
+The handlers are imported on first access, so importing the package does
+not load cryptography until a handler is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from confy_addons.encryption.aead import AEADEncryption
+    from confy_addons.encryption.aes import AESEncryption
+    from confy_addons.encryption.aio import (
+        AsyncAESEncryption,
+        AsyncRSAEncryption,
+        AsyncRSAPublicEncryption,
+    )
+    from confy_addons.encryption.cache import PublicKeyCache
+    from confy_addons.encryption.compression import ZlibCompression
+    from confy_addons.encryption.curve25519 import (
+        Ed25519Signer,
+        Ed25519Verifier,
+        X25519KeyExchange,
+    )
+    from confy_addons.encryption.envelope import EnvelopeEncryption, SealedEnvelope, open_envelope
+    from confy_addons.encryption.pool import RSAKeyPool
+    from confy_addons.encryption.rsa import (
+        RSAEncryption,
+        RSAPublicEncryption,
+        deserialize_public_key,
+    )
+    from confy_addons.encryption.session import AESSession
+
+# The module defining each public name, relative to this package.
+_EXPORTS: dict[str, str] = {
+    'AEADEncryption': '.aead',
+    'AESEncryption': '.aes',
+    'AsyncAESEncryption': '.aio',
+    'AsyncRSAEncryption': '.aio',
+    'AsyncRSAPublicEncryption': '.aio',
+    'PublicKeyCache': '.cache',
+    'ZlibCompression': '.compression',
+    'Ed25519Signer': '.curve25519',
+    'Ed25519Verifier': '.curve25519',
+    'X25519KeyExchange': '.curve25519',
+    'EnvelopeEncryption': '.envelope',
+    'SealedEnvelope': '.envelope',
+    'open_envelope': '.envelope',
+    'RSAKeyPool': '.pool',
+    'RSAEncryption': '.rsa',
+    'RSAPublicEncryption': '.rsa',
+    'deserialize_public_key': '.rsa',
+    'AESSession': '.session',
+}
+
+# Submodules imported on attribute access, as confy_addons.encryption.aes
+# worked when the package imported eagerly.
+_SUBMODULES = (
+    'aead',
+    'aes',
+    'aio',
+    'cache',
+    'compression',
+    'curve25519',
+    'entropy',
+    'envelope',
+    'pool',
+    'rsa',
+    'session',
+)
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import a public name or submodule on first access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The exported class or function, or the submodule.
+
+    Raises:
+        AttributeError: If name is not exported by the package.
+
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including the names not imported yet."""
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
@@ -0,0 +1,332 @@
+"""Authenticated encryption (AEAD) implementation using the cryptography library.
+
+This module provides an AEAD encryption handler that implements the
+AESEncryptionABC abstract base class. It supports AES-256-GCM and
+ChaCha20-Poly1305, so a single symmetric pass provides both confidentiality
+and integrity without a separate RSA signature per message.
+
+Encrypted payloads use a versioned wire format:
+
+    header (1 byte) + nonce (12 bytes) + ciphertext + tag (16 bytes)
+
+The header identifies the format version and algorithm and is authenticated
+together with the ciphertext.
+"""
+
+import base64
+import binascii
+import secrets
+from typing import Optional, Union
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+from confy_addons.core.abstract import AESEncryptionABC
+from confy_addons.core.constants import (
+    AEAD_AES_256_GCM,
+    AEAD_CHACHA20_POLY1305,
+    AEAD_NONCE_SIZE,
+    AEAD_TAG_SIZE,
+    AES_KEY_SIZE,
+    DEFAULT_AEAD_ALGORITHM,
+)
+from confy_addons.core.exceptions import DecryptionError, EncryptionError, IntegrityError
+from confy_addons.core.log import get_logger
+from confy_addons.core.mixins import EncryptionMixin
+from confy_addons.encryption.aes import BytesLike
+from confy_addons.encryption.entropy import token_bytes
+
+logger = get_logger(__name__)
+
+AEADCipher = Union[AESGCM, ChaCha20Poly1305]
+
+AEAD_ALGORITHMS: dict[int, type[AEADCipher]] = {
+    AEAD_AES_256_GCM: AESGCM,
+    AEAD_CHACHA20_POLY1305: ChaCha20Poly1305,
+}
+AEAD_HEADER_SIZE = 1
+AEAD_OVERHEAD = AEAD_HEADER_SIZE + AEAD_NONCE_SIZE + AEAD_TAG_SIZE
+
+
+class AEADEncryption(EncryptionMixin, AESEncryptionABC):
+    """Authenticated symmetric encryption handler.
+
+    This class provides encryption and decryption with AES-256-GCM or
+    ChaCha20-Poly1305 using 256-bit keys. Any tampering with an encrypted
+    payload is detected during decryption.
+
+    Thread safety: the key-bound AEAD objects never change after
+    initialization, until wipe releases them, and every call uses a fresh
+    nonce, so one instance can be shared by any number of threads without
+    locking.
+
+    Attributes:
+        key: The encryption key (32 bytes).
+        key_size: The size of the key in bytes (always 32).
+        algorithm: The wire format header of the algorithm used to encrypt.
+
+    """
+
+    __slots__ = ('_algorithm', '_ciphers', '_key', '_key_size')
+
+    def __init__(self, key: Optional[bytes] = None, algorithm: int = DEFAULT_AEAD_ALGORITHM):
+        """Initialize AEADEncryption with a key.
+
+        Args:
+            key: An optional 32-byte key. If None, a random key is generated.
+            algorithm: The algorithm used to encrypt, AEAD_AES_256_GCM or
+                AEAD_CHACHA20_POLY1305. Payloads of both algorithms can be
+                decrypted regardless of this setting.
+
+        Raises:
+            ValueError: If the provided key is not 32 bytes long or the
+                algorithm is not supported.
+            TypeError: If the provided key is not bytes or bytearray.
+
+        """
+        if algorithm not in AEAD_ALGORITHMS:
+            logger.error('Invalid AEAD algorithm: %r', algorithm)
+            raise ValueError('Unsupported AEAD algorithm')
+
+        self._key_size = AES_KEY_SIZE
+        self._algorithm = algorithm
+
+        # The key is kept in a private mutable buffer so that wipe can zero it.
+        if key is None:
+            self._key = bytearray(secrets.token_bytes(self._key_size))
+        else:
+            if not isinstance(key, (bytes, bytearray)):
+                logger.error('Invalid key type: %s', type(key))
+                raise TypeError('AEAD key must be bytes or bytearray')
+
+            key_bytes = bytearray(key)
+
+            if len(key_bytes) != self._key_size:
+                logger.error('Invalid key length: %s', len(key_bytes))
+                raise ValueError(
+                    f'AEAD key must be {self._key_size} bytes long ({self._key_size * 8} bits)'
+                )
+            self._key = key_bytes
+            logger.debug('AEAD encryption initialized with provided key')
+
+        # Build the key-bound cipher objects once; every message only needs a new nonce.
+        self._ciphers: dict[int, AEADCipher] = {
+            header: cls(self._key) for header, cls in AEAD_ALGORITHMS.items()
+        }
+
+    def wipe(self):
+        """Overwrite the key with zeros and make the handler unusable.
+
+        The key-bound cipher objects are released, which frees their copy of
+        the key, and every later encrypt or decrypt call fails.
+
+        """
+        self._ciphers.clear()
+        self._key[:] = bytes(len(self._key))
+
+    def __repr__(self):
+        """Return a string representation of the AEADEncryption instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                algorithm, key, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(key=<hidden>, algorithm={self._algorithm:#04x}) '
+            f'object at {hex(id(self))}'
+        )
+
+    def encrypt(self, plaintext: str, associated_data: Optional[bytes] = None) -> str:
+        """Encrypts and authenticates text.
+
+        Args:
+            plaintext: The text string to encrypt.
+            associated_data: Optional bytes authenticated but not encrypted,
+                which must be supplied again to decrypt.
+
+        Returns:
+            str: The base64-encoded payload (header + nonce + ciphertext + tag).
+
+        Raises:
+            EncryptionError: If an error occurs during encryption.
+            TypeError: If the plaintext is not a string.
+
+        """
+        if not isinstance(plaintext, str):
+            logger.error('Invalid plaintext type: %s', type(plaintext))
+            raise TypeError('plaintext must be a str')
+
+        payload = self.encrypt_bytes(plaintext.encode('utf-8'), associated_data)
+        return base64.b64encode(payload).decode('ascii')
+
+    def decrypt(self, b64_ciphertext: str, associated_data: Optional[bytes] = None) -> str:
+        """Decrypts and verifies base64-encoded AEAD encrypted data.
+
+        Args:
+            b64_ciphertext: The base64-encoded payload produced by encrypt.
+            associated_data: The associated data given to encrypt, if any.
+
+        Returns:
+            str: The decrypted plaintext as a string.
+
+        Raises:
+            TypeError: If the b64_ciphertext is not a string.
+            ValueError: If the base64 data is invalid, too short, or has an
+                unsupported header.
+            IntegrityError: If the payload was tampered with or the key is wrong.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        if not isinstance(b64_ciphertext, str):
+            logger.error('Invalid b64_ciphertext type: %s', type(b64_ciphertext))
+            raise TypeError('b64_ciphertext must be a base64-encoded str')
+
+        try:
+            data = base64.b64decode(b64_ciphertext)
+        except (binascii.Error, ValueError, TypeError) as e:
+            logger.error('Error occurred during base64 decoding: %s', e)
+            raise ValueError('Invalid base64 encrypted data') from e
+
+        try:
+            return self.decrypt_bytes(data, associated_data).decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.error('Error occurred during decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    def encrypt_bytes(self, data: BytesLike, associated_data: Optional[bytes] = None) -> bytes:
+        """Encrypts and authenticates raw bytes.
+
+        Args:
+            data: The bytes-like object to encrypt.
+            associated_data: Optional bytes authenticated but not encrypted.
+
+        Returns:
+            bytes: The payload (header + nonce + ciphertext + tag).
+
+        Raises:
+            TypeError: If data is not a bytes-like object.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            logger.error('Invalid data type: %s', type(data))
+            raise TypeError('data must be a bytes-like object')
+
+        header = bytes((self._algorithm,))
+        authenticated_data = _authenticated_data(header, associated_data)
+
+        try:
+            nonce = token_bytes(AEAD_NONCE_SIZE)
+            ciphertext = self._ciphers[self._algorithm].encrypt(nonce, data, authenticated_data)
+            return header + nonce + ciphertext
+        except Exception as e:
+            logger.error('Error occurred during encryption: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+    def decrypt_bytes(self, data: BytesLike, associated_data: Optional[bytes] = None) -> bytes:
+        """Decrypts and verifies a raw AEAD payload.
+
+        Args:
+            data: The payload produced by encrypt_bytes.
+            associated_data: The associated data given to encrypt_bytes, if any.
+
+        Returns:
+            bytes: The decrypted data.
+
+        Raises:
+            TypeError: If data is not a bytes-like object.
+            ValueError: If data is too short or has an unsupported header.
+            IntegrityError: If the payload was tampered with or the key is wrong.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            logger.error('Invalid data type: %s', type(data))
+            raise TypeError('data must be a bytes-like object')
+
+        view = memoryview(data)
+
+        if len(view) < AEAD_OVERHEAD:
+            logger.error('Invalid encrypted data length: %s', len(view))
+            raise ValueError('Encrypted data is too short to contain a header, nonce and tag')
+
+        cipher = self._ciphers.get(view[0])
+
+        if cipher is None:
+            if not self._ciphers:
+                logger.error('AEAD key was wiped')
+                raise DecryptionError('Decryption failed')
+            logger.error('Unsupported AEAD payload header: %#04x', view[0])
+            raise ValueError('Unsupported AEAD payload version or algorithm')
+
+        authenticated_data = _authenticated_data(view[:AEAD_HEADER_SIZE], associated_data)
+        nonce_end = AEAD_HEADER_SIZE + AEAD_NONCE_SIZE
+
+        try:
+            return cipher.decrypt(
+                view[AEAD_HEADER_SIZE:nonce_end], view[nonce_end:], authenticated_data
+            )
+        except InvalidTag as e:
+            logger.error('AEAD authentication failed')
+            raise IntegrityError('Message authentication failed') from e
+        except Exception as e:
+            logger.error('Error occurred during decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    @property
+    def key(self) -> bytes:
+        """Returns the encryption key.
+
+        Returns:
+            bytes: The 32-byte key.
+
+        """
+        return bytes(self._key)
+
+    @property
+    def key_size(self) -> int:
+        """Returns the size of the key in bytes.
+
+        Returns:
+            int: The key size in bytes (always 32).
+
+        """
+        return self._key_size
+
+    @property
+    def algorithm(self) -> int:
+        """Returns the wire format header of the algorithm used to encrypt.
+
+        Returns:
+            int: AEAD_AES_256_GCM or AEAD_CHACHA20_POLY1305.
+
+        """
+        return self._algorithm
+
+
+def _authenticated_data(
+    header: Union[bytes, memoryview], associated_data: Optional[bytes]
+) -> bytes:
+    """Return the data authenticated alongside the ciphertext.
+
+    The wire format header is always authenticated so it cannot be swapped.
+
+    Args:
+        header: The one-byte wire format header.
+        associated_data: Optional caller-supplied associated data.
+
+    Returns:
+        bytes: The header followed by the associated data.
+
+    Raises:
+        TypeError: If associated_data is neither None nor bytes.
+
+    """
+    if associated_data is None:
+        return bytes(header)
+    if not isinstance(associated_data, bytes):
+        logger.error('Invalid associated_data type: %s', type(associated_data))
+        raise TypeError('associated_data must be bytes')
+    return bytes(header) + associated_data
@@ -7,19 +7,192 @@ decryption in CFB mode with 256-bit keys.
 
 import base64
 import binascii
-import logging
 import secrets
-from typing import Optional
-
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-
-from confy_addons.core.abstract import AESEncryptionABC
-from confy_addons.core.constants import AES_IV_SIZE, AES_KEY_SIZE, LOGGER_LEVEL
+from collections.abc import Iterable
+from typing import BinaryIO, Optional, Union
+
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherContext, algorithms, modes
+
+from confy_addons.core.abstract import AESEncryptionABC, CompressionCodecABC
+from confy_addons.core.constants import (
+    AES_IV_SIZE,
+    AES_KEY_SIZE,
+    AES_STREAM_CHUNK_SIZE,
+    COMPRESSION_FLAG_COMPRESSED,
+    COMPRESSION_FLAG_RAW,
+    DEFAULT_COMPRESSION_THRESHOLD,
+)
 from confy_addons.core.exceptions import DecryptionError, EncryptionError
+from confy_addons.core.log import get_logger
 from confy_addons.core.mixins import EncryptionMixin
+from confy_addons.encryption.entropy import token_bytes
+
+logger = get_logger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _byte_view(data: BytesLike, name: str) -> memoryview:
+    """Return a flat byte view over a buffer-protocol object without copying it.
+
+    Args:
+        data: The object exposing the buffer protocol.
+        name: The argument name used in the error message.
+
+    Returns:
+        memoryview: A one-dimensional unsigned byte view over data.
+
+    Raises:
+        TypeError: If data does not expose a contiguous buffer.
+
+    """
+    try:
+        return memoryview(data).cast('B')
+    except TypeError as e:
+        logger.error('Invalid %s type: %s', name, type(data))
+        raise TypeError(f'{name} must be a contiguous bytes-like object') from e
+
+
+class AESStreamEncryptor:
+    """Incremental AES-CFB encryptor for payloads processed in chunks.
+
+    The output stream has the same layout as AESEncryption.encrypt_bytes
+    (IV + ciphertext): the IV is emitted before the first ciphertext bytes,
+    so the concatenation of every returned chunk can be decrypted in one go.
+
+    A stream holds the state of a single payload, so it must only be used by
+    one thread at a time.
+
+    """
+
+    def __init__(self, algorithm: algorithms.AES):
+        """Initialize the encryptor with a fresh random IV.
+
+        Args:
+            algorithm: The key-bound AES algorithm object.
+
+        """
+        self._iv = token_bytes(AES_IV_SIZE)
+        self._context = Cipher(algorithm, modes.CFB(self._iv)).encryptor()
+        self._header_sent = False
+
+    def _header(self) -> bytes:
+        if self._header_sent:
+            return b''
+        self._header_sent = True
+        return self._iv
+
+    def update(self, data: BytesLike) -> bytes:
+        """Encrypts the next chunk of the payload.
+
+        Args:
+            data: The next bytes-like chunk of plaintext.
+
+        Returns:
+            bytes: The ciphertext for the chunk, prefixed by the IV on the first call.
+
+        Raises:
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        try:
+            return self._header() + self._context.update(data)
+        except Exception as e:
+            logger.error('Error occurred during stream encryption: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+    def finalize(self) -> bytes:
+        """Finishes the encryption.
+
+        Returns:
+            bytes: Any remaining output, including the IV if update was never called.
+
+        Raises:
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        try:
+            return self._header() + self._context.finalize()
+        except Exception as e:
+            logger.error('Error occurred during stream encryption: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+
+class AESStreamDecryptor:
+    """Incremental AES-CFB decryptor for payloads processed in chunks.
+
+    Accepts the layout produced by AESStreamEncryptor or
+    AESEncryption.encrypt_bytes (IV + ciphertext), split at any boundary.
+
+    A stream holds the state of a single payload, so it must only be used by
+    one thread at a time.
+
+    """
 
-logging.basicConfig(level=LOGGER_LEVEL)
-logger = logging.getLogger(__name__)
+    def __init__(self, algorithm: algorithms.AES):
+        """Initialize the decryptor.
+
+        Args:
+            algorithm: The key-bound AES algorithm object.
+
+        """
+        self._algorithm = algorithm
+        self._iv = bytearray()
+        self._context: Optional[CipherContext] = None
+
+    def update(self, data: BytesLike) -> bytes:
+        """Decrypts the next chunk of the payload.
+
+        The first 16 bytes received are taken as the IV and produce no output.
+
+        Args:
+            data: The next bytes-like chunk of encrypted data.
+
+        Returns:
+            bytes: The plaintext for the chunk.
+
+        Raises:
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        view = _byte_view(data, 'data')
+
+        try:
+            if self._context is None:
+                missing = AES_IV_SIZE - len(self._iv)
+                self._iv += view[:missing]
+                view = view[missing:]
+
+                if len(self._iv) < AES_IV_SIZE:
+                    return b''
+
+                self._context = Cipher(self._algorithm, modes.CFB(bytes(self._iv))).decryptor()
+
+            return self._context.update(view)
+        except Exception as e:
+            logger.error('Error occurred during stream decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    def finalize(self) -> bytes:
+        """Finishes the decryption.
+
+        Returns:
+            bytes: Any remaining plaintext.
+
+        Raises:
+            ValueError: If the stream ended before a full IV was received.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        if self._context is None:
+            logger.error('Invalid encrypted stream length: %s', len(self._iv))
+            raise ValueError('Encrypted data is too short to contain an IV and ciphertext')
+
+        try:
+            return self._context.finalize()
+        except Exception as e:
+            logger.error('Error occurred during stream decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
 
 
 class AESEncryption(EncryptionMixin, AESEncryptionABC):
@@ -28,13 +201,36 @@ class AESEncryption(EncryptionMixin, AESEncryptionABC):
     This class provides AES encryption and decryption operations in CFB mode
     with 256-bit keys. It can generate a random key or use a provided key.
 
+    With a compression codec, encrypt, decrypt, encrypt_many and decrypt_many
+    compress the text before encrypting it and prefix it with a one-byte flag,
+    so both peers must use the same setting. The bytes and stream methods are
+    never compressed.
+
+    Thread safety: the key and settings never change after initialization and
+    every call builds its own cipher context, so one instance can be shared by
+    any number of threads without locking, including on free-threaded builds.
+    A shared compression codec must be thread-safe too, as ZlibCompression is.
+    The only exception is wipe: calls racing with it either complete under
+    the original key or fail, never encrypt under the zeroed key.
+
     Attributes:
         key: The AES encryption key (32 bytes).
         key_size: The size of the AES key in bytes (always 32 for AES-256).
+        compression: The compression codec applied before encryption, if any.
+        compression_threshold: The smallest payload compressed, in bytes.
 
     """
 
-    def __init__(self, key: Optional[bytes] = None):
+    # Relays keep one handler per session resident, so instances have no __dict__.
+    __slots__ = ('_algorithm', '_compression', '_compression_threshold', '_key', '_key_size')
+
+    def __init__(
+        self,
+        key: Optional[bytes] = None,
+        *,
+        compression: Optional[CompressionCodecABC] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ):
         """Initialize AESEncryption with a key.
 
         Creates an AES encryption handler with either a provided key or a newly
@@ -42,31 +238,89 @@ class AESEncryption(EncryptionMixin, AESEncryptionABC):
 
         Args:
             key: An optional 32-byte AES key. If None, a random key is generated.
+            compression: An optional codec, such as ZlibCompression, applied to
+                text payloads before encryption. None disables compression.
+            compression_threshold: Payloads shorter than this many bytes, or
+                that do not shrink, are sent uncompressed.
 
         Raises:
-            ValueError: If the provided key is not 32 bytes long.
-            TypeError: If the provided key is not bytes or bytearray.
+            ValueError: If the provided key is not 32 bytes long or
+                compression_threshold is negative.
+            TypeError: If the provided key is not bytes or bytearray,
+                compression is not a CompressionCodecABC, or
+                compression_threshold is not an integer.
 
         """
+        if compression is not None and not isinstance(compression, CompressionCodecABC):
+            logger.error('Invalid compression type: %s', type(compression))
+            raise TypeError('compression must be an instance of CompressionCodecABC')
+        if not isinstance(compression_threshold, int):
+            logger.error('Invalid compression_threshold type: %s', type(compression_threshold))
+            raise TypeError('compression_threshold must be an integer')
+        if compression_threshold < 0:
+            logger.error('Invalid compression_threshold value: %s', compression_threshold)
+            raise ValueError('compression_threshold must not be negative')
+
         self._key_size = AES_KEY_SIZE
+        self._compression = compression
+        self._compression_threshold = compression_threshold
 
+        # The key is kept in a private mutable buffer so that wipe can zero it.
         if key is None:
-            self._key = secrets.token_bytes(self._key_size)
+            self._key = bytearray(secrets.token_bytes(self._key_size))
         else:
             if not isinstance(key, (bytes, bytearray)):
-                logger.error(f'Invalid key type: {type(key)}')
+                logger.error('Invalid key type: %s', type(key))
                 raise TypeError('AES key must be bytes or bytearray')
 
-            key_bytes = bytes(key)
+            key_bytes = bytearray(key)
 
             if len(key_bytes) != self._key_size:
-                logger.error(f'Invalid key length: {len(key_bytes)}')
+                logger.error('Invalid key length: %s', len(key_bytes))
                 raise ValueError(
                     f'AES key must be {self._key_size} bytes long ({self._key_size * 8} bits)'
                 )
             self._key = key_bytes
             logger.debug('AES encryption initialized with provided key')
 
+        # The key never changes after initialization, so the key-bound algorithm
+        # object is built once and reused; only the IV varies per message. It
+        # shares the key buffer, so wipe sets it to None before zeroing.
+        self._algorithm: Optional[algorithms.AES] = algorithms.AES(self._key)
+
+    def wipe(self):
+        """Overwrite the key with zeros and make the handler unusable.
+
+        Called when a session ends so the key does not linger in memory.
+        Afterwards every encrypt and decrypt call fails; calls running on other
+        threads either complete under the original key or fail. Wiping is best
+        effort: copies returned by the key property and streams created before
+        the wipe are not affected.
+
+        """
+        self._algorithm = None
+        self._key[:] = bytes(len(self._key))
+        self._key.clear()
+
+    def _unwiped_algorithm(self) -> algorithms.AES:
+        algorithm = self._algorithm
+        if algorithm is None:
+            raise ValueError('AES key was wiped')
+        return algorithm
+
+    def _check_not_wiped(self, algorithm: algorithms.AES):
+        # wipe drops the algorithm before zeroing the key it shares, so cipher
+        # contexts created before this check passes hold the original key.
+        if self._algorithm is not algorithm:
+            raise ValueError('AES key was wiped')
+
+    def _context(self, iv: BytesLike, decrypt: bool = False) -> CipherContext:
+        algorithm = self._unwiped_algorithm()
+        cipher = Cipher(algorithm, modes.CFB(iv))
+        context = cipher.decryptor() if decrypt else cipher.encryptor()
+        self._check_not_wiped(algorithm)
+        return context
+
     def __repr__(self):
         """Return a string representation of the AESEncryption instance.
 
@@ -97,19 +351,19 @@ class AESEncryption(EncryptionMixin, AESEncryptionABC):
 
         """
         if not isinstance(plaintext, str):
-            logger.error(f'Invalid plaintext type: {type(plaintext)}')
+            logger.error('Invalid plaintext type: %s', type(plaintext))
             raise TypeError('plaintext must be a str')
 
         try:
-            iv = secrets.token_bytes(AES_IV_SIZE)
-            cipher = Cipher(algorithms.AES(self._key), modes.CFB(iv))
-            encryptor = cipher.encryptor()
-            ciphertext = (
-                encryptor.update(plaintext.encode(encoding='utf-8')) + encryptor.finalize()
-            )
+            payload = plaintext.encode(encoding='utf-8')
+            if self._compression is not None:
+                payload = self._compress(payload)
+            iv = token_bytes(AES_IV_SIZE)
+            encryptor = self._context(iv)
+            ciphertext = encryptor.update(payload) + encryptor.finalize()
             return base64.b64encode(iv + ciphertext).decode(encoding='ascii')
         except Exception as e:
-            logger.error(f'Error occurred during encryption: {e}')
+            logger.error('Error occurred during encryption: %s', e)
             raise EncryptionError('Error occurred during encryption') from e
 
     def decrypt(self, b64_ciphertext: str) -> str:
@@ -132,30 +386,422 @@ class AESEncryption(EncryptionMixin, AESEncryptionABC):
 
         """
         if not isinstance(b64_ciphertext, str):
-            logger.error(f'Invalid b64_ciphertext type: {type(b64_ciphertext)}')
+            logger.error('Invalid b64_ciphertext type: %s', type(b64_ciphertext))
             raise TypeError('b64_ciphertext must be a base64-encoded str')
 
         try:
             data = base64.b64decode(b64_ciphertext)
         except (binascii.Error, ValueError, TypeError) as e:
-            logger.error(f'Error occurred during base64 decoding: {e}')
+            logger.error('Error occurred during base64 decoding: %s', e)
             raise ValueError('Invalid base64 encrypted data') from e
 
         if len(data) < AES_IV_SIZE:
-            logger.error(f'Invalid encrypted data length: {len(data)}')
+            logger.error('Invalid encrypted data length: %s', len(data))
             raise ValueError('Encrypted data is too short to contain an IV and ciphertext')
 
         iv, ciphertext = data[:AES_IV_SIZE], data[AES_IV_SIZE:]
 
         try:
-            cipher = Cipher(algorithms.AES(self._key), modes.CFB(iv))
-            decryptor = cipher.decryptor()
+            decryptor = self._context(iv, decrypt=True)
             plaintext_bytes = decryptor.update(ciphertext) + decryptor.finalize()
+            if self._compression is not None:
+                plaintext_bytes = self._decompress(plaintext_bytes)
             return plaintext_bytes.decode('utf-8')
         except Exception as e:
-            logger.error(f'Error occurred during decryption: {e}')
+            logger.error('Error occurred during decryption: %s', e)
             raise DecryptionError('Decryption failed') from e
 
+    def encrypt_many(self, plaintexts: Iterable[str]) -> list[str]:
+        """Encrypts a batch of texts using AES in CFB mode.
+
+        Produces exactly the same format as the encrypt method, so every item
+        can be decrypted with decrypt. The per-message IVs are sliced from a
+        single random block and the cipher lookups are done once per batch.
+
+        Args:
+            plaintexts: An iterable of text strings to encrypt.
+
+        Returns:
+            list[str]: The base64-encoded encrypted data (IV + ciphertext),
+                in the same order as the input.
+
+        Raises:
+            EncryptionError: If an error occurs during encryption.
+            TypeError: If any of the plaintexts is not a string.
+
+        """
+        messages = list(plaintexts)
+
+        if not all(isinstance(plaintext, str) for plaintext in messages):
+            logger.error('Invalid plaintext type in batch')
+            raise TypeError('plaintexts must contain only str')
+
+        try:
+            ivs = token_bytes(AES_IV_SIZE * len(messages))
+            algorithm = self._unwiped_algorithm()
+            compress = self._compress if self._compression is not None else None
+            encrypted = []
+
+            for offset, plaintext in zip(range(0, len(ivs), AES_IV_SIZE), messages):
+                iv = ivs[offset : offset + AES_IV_SIZE]
+                payload = plaintext.encode('utf-8')
+                if compress is not None:
+                    payload = compress(payload)
+                encryptor = Cipher(algorithm, modes.CFB(iv)).encryptor()
+                ciphertext = encryptor.update(payload) + encryptor.finalize()
+                encrypted.append(iv + ciphertext)
+            self._check_not_wiped(algorithm)
+        except Exception as e:
+            logger.error('Error occurred during batch encryption: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+        b64encode = base64.b64encode
+        return [b64encode(data).decode('ascii') for data in encrypted]
+
+    def decrypt_many(self, b64_ciphertexts: Iterable[str]) -> list[str]:
+        """Decrypts a batch of base64-encoded AES encrypted data.
+
+        Accepts items in the format produced by encrypt or encrypt_many.
+
+        Args:
+            b64_ciphertexts: An iterable of base64-encoded encrypted data.
+
+        Returns:
+            list[str]: The decrypted plaintexts, in the same order as the input.
+
+        Raises:
+            TypeError: If any of the items is not a string.
+            ValueError: If any base64 item is invalid or too short.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        payloads = list(b64_ciphertexts)
+
+        if not all(isinstance(payload, str) for payload in payloads):
+            logger.error('Invalid b64_ciphertext type in batch')
+            raise TypeError('b64_ciphertexts must contain only base64-encoded str')
+
+        b64decode = base64.b64decode
+        try:
+            datas = [b64decode(payload) for payload in payloads]
+        except (binascii.Error, ValueError, TypeError) as e:
+            logger.error('Error occurred during base64 decoding: %s', e)
+            raise ValueError('Invalid base64 encrypted data') from e
+
+        if any(len(data) < AES_IV_SIZE for data in datas):
+            logger.error('Invalid encrypted data length in batch')
+            raise ValueError('Encrypted data is too short to contain an IV and ciphertext')
+
+        try:
+            algorithm = self._unwiped_algorithm()
+            decompress = self._decompress if self._compression is not None else None
+            decrypted = []
+
+            for data in datas:
+                decryptor = Cipher(algorithm, modes.CFB(data[:AES_IV_SIZE])).decryptor()
+                plaintext_bytes = decryptor.update(data[AES_IV_SIZE:]) + decryptor.finalize()
+                if decompress is not None:
+                    plaintext_bytes = decompress(plaintext_bytes)
+                decrypted.append(plaintext_bytes.decode('utf-8'))
+            self._check_not_wiped(algorithm)
+        except Exception as e:
+            logger.error('Error occurred during batch decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+        return decrypted
+
+    def encrypt_bytes(self, data: BytesLike) -> bytes:
+        """Encrypts raw bytes using AES in CFB mode.
+
+        Unlike encrypt, the input is not UTF-8 encoded and the output is not
+        base64-encoded, which avoids extra full-size copies for binary payloads.
+
+        Args:
+            data: The bytes-like object (bytes, bytearray or memoryview) to encrypt.
+
+        Returns:
+            bytes: The encrypted data (IV + ciphertext).
+
+        Raises:
+            TypeError: If data is not a contiguous bytes-like object.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        view = _byte_view(data, 'data')
+
+        try:
+            iv = token_bytes(AES_IV_SIZE)
+            encryptor = self._context(iv)
+            # CFB is a stream mode, so finalize returns nothing and the IV
+            # concatenation is the only copy of the ciphertext.
+            return iv + encryptor.update(view) + encryptor.finalize()
+        except Exception as e:
+            logger.error('Error occurred during encryption: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+    def encrypt_into(self, data: BytesLike, buffer: Union[bytearray, memoryview]) -> int:
+        """Encrypts raw bytes straight into a caller-supplied buffer.
+
+        The IV is written to the start of the buffer and the ciphertext right
+        after it, without intermediate copies.
+
+        Args:
+            data: The bytes-like object to encrypt.
+            buffer: A writable buffer of at least len(data) + 16 bytes.
+
+        Returns:
+            int: The number of bytes written to the buffer (IV + ciphertext).
+
+        Raises:
+            TypeError: If data or buffer are not contiguous bytes-like objects,
+                or if buffer is read-only.
+            ValueError: If the buffer is too small.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        view = _byte_view(data, 'data')
+        out = _byte_view(buffer, 'buffer')
+        size = AES_IV_SIZE + view.nbytes
+
+        if out.readonly:
+            logger.error('Read-only buffer supplied for encryption')
+            raise TypeError('buffer must be writable')
+        if out.nbytes < size:
+            logger.error('Invalid buffer length: %s', out.nbytes)
+            raise ValueError(f'buffer must be at least {size} bytes long')
+
+        try:
+            iv = token_bytes(AES_IV_SIZE)
+            out[:AES_IV_SIZE] = iv
+            encryptor = self._context(iv)
+            written = encryptor.update_into(view, out[AES_IV_SIZE:size])
+            encryptor.finalize()
+            return AES_IV_SIZE + written
+        except Exception as e:
+            logger.error('Error occurred during encryption: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+    def decrypt_bytes(self, data: BytesLike) -> bytes:
+        """Decrypts raw AES encrypted bytes.
+
+        The encrypted data must be in the format produced by encrypt_bytes
+        or encrypt_into (IV + ciphertext).
+
+        Args:
+            data: The bytes-like object holding IV + ciphertext.
+
+        Returns:
+            bytes: The decrypted data.
+
+        Raises:
+            TypeError: If data is not a contiguous bytes-like object.
+            ValueError: If data is too short to contain an IV.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        view = _byte_view(data, 'data')
+
+        if view.nbytes < AES_IV_SIZE:
+            logger.error('Invalid encrypted data length: %s', view.nbytes)
+            raise ValueError('Encrypted data is too short to contain an IV and ciphertext')
+
+        try:
+            decryptor = self._context(view[:AES_IV_SIZE], decrypt=True)
+            # Adding the empty bytes returned by finalize does not copy.
+            return decryptor.update(view[AES_IV_SIZE:]) + decryptor.finalize()
+        except Exception as e:
+            logger.error('Error occurred during decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    def decrypt_into(self, data: BytesLike, buffer: Union[bytearray, memoryview]) -> int:
+        """Decrypts raw AES encrypted bytes straight into a caller-supplied buffer.
+
+        Args:
+            data: The bytes-like object holding IV + ciphertext.
+            buffer: A writable buffer of at least len(data) - 16 bytes.
+
+        Returns:
+            int: The number of plaintext bytes written to the buffer.
+
+        Raises:
+            TypeError: If data or buffer are not contiguous bytes-like objects,
+                or if buffer is read-only.
+            ValueError: If data is too short or the buffer is too small.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        view = _byte_view(data, 'data')
+        out = _byte_view(buffer, 'buffer')
+
+        if view.nbytes < AES_IV_SIZE:
+            logger.error('Invalid encrypted data length: %s', view.nbytes)
+            raise ValueError('Encrypted data is too short to contain an IV and ciphertext')
+
+        size = view.nbytes - AES_IV_SIZE
+
+        if out.readonly:
+            logger.error('Read-only buffer supplied for decryption')
+            raise TypeError('buffer must be writable')
+        if out.nbytes < size:
+            logger.error('Invalid buffer length: %s', out.nbytes)
+            raise ValueError(f'buffer must be at least {size} bytes long')
+
+        try:
+            decryptor = self._context(view[:AES_IV_SIZE], decrypt=True)
+            written = decryptor.update_into(view[AES_IV_SIZE:], out[:size])
+            decryptor.finalize()
+            return written
+        except Exception as e:
+            logger.error('Error occurred during decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    def encryptor(self) -> AESStreamEncryptor:
+        """Return an incremental encryptor bound to this key.
+
+        Returns:
+            AESStreamEncryptor: A new encryptor with a fresh random IV.
+
+        Raises:
+            EncryptionError: If the key was wiped.
+
+        """
+        try:
+            algorithm = self._unwiped_algorithm()
+            encryptor = AESStreamEncryptor(algorithm)
+            self._check_not_wiped(algorithm)
+            return encryptor
+        except Exception as e:
+            logger.error('Error occurred while creating stream encryptor: %s', e)
+            raise EncryptionError('Error occurred during encryption') from e
+
+    def decryptor(self) -> AESStreamDecryptor:
+        """Return an incremental decryptor bound to this key.
+
+        Returns:
+            AESStreamDecryptor: A new decryptor expecting IV + ciphertext.
+
+        Raises:
+            DecryptionError: If the key was wiped.
+
+        """
+        try:
+            # The decryptor builds its context once the IV arrives, possibly
+            # after a wipe, so it gets an algorithm over its own key copy.
+            algorithm = self._unwiped_algorithm()
+            copy = algorithms.AES(bytes(self._key))
+            self._check_not_wiped(algorithm)
+            return AESStreamDecryptor(copy)
+        except Exception as e:
+            logger.error('Error occurred while creating stream decryptor: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    def encrypt_stream(
+        self, src: BinaryIO, dst: BinaryIO, chunk_size: int = AES_STREAM_CHUNK_SIZE
+    ) -> int:
+        """Encrypts a binary file-like object into another one.
+
+        Writes the IV first and then the ciphertext of each chunk read from src,
+        so memory usage is bounded by chunk_size regardless of the payload size.
+        The output has the same layout as encrypt_bytes.
+
+        Args:
+            src: A readable binary file-like object with the plaintext.
+            dst: A writable binary file-like object for the encrypted data.
+            chunk_size: How many bytes to read from src at a time.
+
+        Returns:
+            int: The number of bytes written to dst.
+
+        Raises:
+            TypeError: If chunk_size is not an integer.
+            ValueError: If chunk_size is not positive.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        return self._process_stream(self.encryptor(), src, dst, chunk_size)
+
+    def decrypt_stream(
+        self, src: BinaryIO, dst: BinaryIO, chunk_size: int = AES_STREAM_CHUNK_SIZE
+    ) -> int:
+        """Decrypts a binary file-like object into another one.
+
+        Accepts the output of encrypt_stream or encrypt_bytes, reading src in
+        chunks so memory usage is bounded by chunk_size.
+
+        Args:
+            src: A readable binary file-like object with IV + ciphertext.
+            dst: A writable binary file-like object for the plaintext.
+            chunk_size: How many bytes to read from src at a time.
+
+        Returns:
+            int: The number of bytes written to dst.
+
+        Raises:
+            TypeError: If chunk_size is not an integer.
+            ValueError: If chunk_size is not positive or src is too short.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        return self._process_stream(self.decryptor(), src, dst, chunk_size)
+
+    @staticmethod
+    def _process_stream(
+        context: Union[AESStreamEncryptor, AESStreamDecryptor],
+        src: BinaryIO,
+        dst: BinaryIO,
+        chunk_size: int,
+    ) -> int:
+        if not isinstance(chunk_size, int):
+            logger.error('Invalid chunk_size type: %s', type(chunk_size))
+            raise TypeError('chunk_size must be an integer')
+        if chunk_size <= 0:
+            logger.error('Invalid chunk_size value: %s', chunk_size)
+            raise ValueError('chunk_size must be a positive integer')
+
+        written = 0
+
+        while chunk := src.read(chunk_size):
+            written += dst.write(context.update(chunk))
+
+        return written + dst.write(context.finalize())
+
+    def _compress(self, data: bytes) -> bytes:
+        """Return data prefixed with its compression flag, compressed if worthwhile.
+
+        Args:
+            data: The plaintext bytes.
+
+        Returns:
+            bytes: The flag byte followed by the compressed or raw data.
+
+        """
+        if len(data) >= self._compression_threshold:
+            compressed = self._compression.compress(data)  # type: ignore[union-attr]
+            if len(compressed) < len(data):
+                return bytes((COMPRESSION_FLAG_COMPRESSED,)) + compressed
+        return bytes((COMPRESSION_FLAG_RAW,)) + data
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Return the plaintext of a payload produced by _compress.
+
+        Args:
+            data: The flag byte followed by the compressed or raw data.
+
+        Returns:
+            bytes: The plaintext bytes.
+
+        Raises:
+            ValueError: If the flag is missing or unknown, or decompression fails.
+
+        """
+        if not data:
+            raise ValueError('Payload is missing its compression flag')
+        if data[0] == COMPRESSION_FLAG_RAW:
+            return data[1:]
+        if data[0] == COMPRESSION_FLAG_COMPRESSED:
+            return self._compression.decompress(data[1:])  # type: ignore[union-attr]
+        raise ValueError(f'Unknown compression flag: {data[0]:#04x}')
+
     @property
     def key(self) -> bytes:
         """Returns the AES encryption key.
@@ -164,7 +810,7 @@ class AESEncryption(EncryptionMixin, AESEncryptionABC):
             bytes: The 32-byte AES key.
 
         """
-        return self._key
+        return bytes(self._key)
 
     @property
     def key_size(self) -> int:
@@ -175,3 +821,23 @@ class AESEncryption(EncryptionMixin, AESEncryptionABC):
 
         """
         return self._key_size
+
+    @property
+    def compression(self) -> Optional[CompressionCodecABC]:
+        """Returns the compression codec applied before encryption.
+
+        Returns:
+            Optional[CompressionCodecABC]: The codec, or None if disabled.
+
+        """
+        return self._compression
+
+    @property
+    def compression_threshold(self) -> int:
+        """Returns the smallest payload compressed, in bytes.
+
+        Returns:
+            int: The compression threshold.
+
+        """
+        return self._compression_threshold
@@ -0,0 +1,376 @@
+"""asyncio-friendly wrappers that offload CPU-heavy work to an executor.
+
+RSA key generation, decryption and signing take from milliseconds to
+seconds and hold the interpreter while they run, which stalls every other
+connection served by the same event loop. The classes in this module run
+those calls on an executor and return awaitables instead.
+
+Operations on an existing key pair run on a thread executor, since the
+handler objects cannot be sent to another process. Key generation only
+exchanges serialized keys, so it can also run on a
+concurrent.futures.ProcessPoolExecutor, which keeps the event loop
+responsive even when the backend does not release the GIL.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Optional
+
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+
+from confy_addons.core.constants import DEFAULT_RSA_KEY_SIZE
+from confy_addons.core.log import get_logger
+from confy_addons.core.mixins import EncryptionMixin
+from confy_addons.encryption.aes import AESEncryption
+from confy_addons.encryption.pool import generate_private_key_der, load_private_key_der
+from confy_addons.encryption.rsa import RSAEncryption, RSAPublicEncryption
+
+logger = get_logger(__name__)
+
+
+def _check_executor(executor: Optional[Executor]):
+    """Validate an executor argument.
+
+    Args:
+        executor: The executor to validate, or None for the loop's default.
+
+    Raises:
+        TypeError: If executor is neither None nor an Executor.
+
+    """
+    if executor is not None and not isinstance(executor, Executor):
+        logger.error('Invalid executor type: %s', type(executor))
+        raise TypeError('executor must be an instance of concurrent.futures.Executor')
+
+
+class AsyncRSAEncryption(EncryptionMixin):
+    """Asynchronous wrapper around RSAEncryption.
+
+    Attributes:
+        rsa: The wrapped RSAEncryption handler.
+        public_key: The RSA public key.
+        base64_public_key: The public key in base64-encoded PEM format.
+
+    """
+
+    def __init__(self, rsa: RSAEncryption, executor: Optional[Executor] = None):
+        """Initialize AsyncRSAEncryption around an existing handler.
+
+        Args:
+            rsa: The RSAEncryption handler to wrap.
+            executor: The thread executor used for decrypt and sign. None uses
+                the event loop's default executor.
+
+        Raises:
+            TypeError: If rsa is not an RSAEncryption or executor is not an Executor.
+
+        """
+        if not isinstance(rsa, RSAEncryption):
+            logger.error('Invalid rsa type: %s', type(rsa))
+            raise TypeError('rsa must be an instance of RSAEncryption')
+        _check_executor(executor)
+
+        self._rsa = rsa
+        self._executor = executor
+
+    def __repr__(self):
+        """Return a string representation of the AsyncRSAEncryption instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                parameters, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(key_size={self._rsa.key_size!r}) '
+            f'object at {hex(id(self))}'
+        )
+
+    @classmethod
+    async def create(
+        cls,
+        key_size: int = DEFAULT_RSA_KEY_SIZE,
+        executor: Optional[Executor] = None,
+        keygen_executor: Optional[Executor] = None,
+    ) -> 'AsyncRSAEncryption':
+        """Generate a new key pair without blocking the event loop.
+
+        Args:
+            key_size: The size of the RSA key in bits. Defaults to 4096.
+            executor: The thread executor used for decrypt and sign. None uses
+                the event loop's default executor.
+            keygen_executor: The executor used for key generation. A
+                ProcessPoolExecutor is recommended. None runs key generation
+                on the event loop's default thread executor, which it then
+                shares with every other blocking call offloaded there.
+
+        Returns:
+            AsyncRSAEncryption: A handler holding the new key pair.
+
+        Raises:
+            TypeError: If key_size is not an integer or the executors are not Executors.
+            ValueError: If key_size is less than the recommended minimum for security.
+            RuntimeError: If key pair generation fails.
+
+        """
+        if not isinstance(key_size, int):
+            logger.error('Invalid key_size type: %s', type(key_size))
+            raise TypeError('key_size must be an integer')
+        if key_size < DEFAULT_RSA_KEY_SIZE:
+            logger.error('Invalid key_size value: %s', key_size)
+            raise ValueError(f'key_size must be at least {DEFAULT_RSA_KEY_SIZE} bits for security')
+        _check_executor(executor)
+        _check_executor(keygen_executor)
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            der = await loop.run_in_executor(keygen_executor, generate_private_key_der, key_size)
+            private_key = await loop.run_in_executor(executor, load_private_key_der, der)
+        except Exception as e:
+            logger.error('Error occurred while generating RSA key pair: %s', e)
+            raise RuntimeError('Failed to generate RSA key pair') from e
+
+        return cls(RSAEncryption.from_private_key(private_key), executor)
+
+    async def decrypt(self, encrypted_data: bytes) -> bytes:
+        """Decrypts data using the private key on the executor.
+
+        Args:
+            encrypted_data: The encrypted bytes to decrypt.
+
+        Returns:
+            bytes: The decrypted data.
+
+        Raises:
+            TypeError: If encrypted_data is not bytes.
+            ValueError: If encrypted_data is empty.
+            DecryptionError: If decryption fails.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._rsa.decrypt, encrypted_data)
+
+    async def sign(self, data: bytes) -> bytes:
+        """Signs the data using the private key on the executor.
+
+        Args:
+            data: The bytes to be signed.
+
+        Returns:
+            bytes: The signature.
+
+        Raises:
+            TypeError: If the data is not bytes.
+            ValueError: If the data is empty.
+            RuntimeError: If the signature fails.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._rsa.sign, data)
+
+    @property
+    def rsa(self) -> RSAEncryption:
+        """Returns the wrapped RSAEncryption handler.
+
+        Returns:
+            RSAEncryption: The synchronous handler.
+
+        """
+        return self._rsa
+
+    @property
+    def public_key(self) -> RSAPublicKey:
+        """Returns the RSA public key.
+
+        Returns:
+            RSAPublicKey: The public key object.
+
+        """
+        return self._rsa.public_key
+
+    @property
+    def base64_public_key(self) -> str:
+        """Returns the public key in base64-encoded PEM format.
+
+        Returns:
+            str: The base64-encoded PEM representation of the public key.
+
+        """
+        return self._rsa.base64_public_key
+
+
+class AsyncRSAPublicEncryption(EncryptionMixin):
+    """Asynchronous wrapper around RSAPublicEncryption.
+
+    Attributes:
+        rsa: The wrapped RSAPublicEncryption handler.
+
+    """
+
+    def __init__(self, rsa: RSAPublicEncryption, executor: Optional[Executor] = None):
+        """Initialize AsyncRSAPublicEncryption around an existing handler.
+
+        Args:
+            rsa: The RSAPublicEncryption handler to wrap.
+            executor: The thread executor used for encrypt and verify. None
+                uses the event loop's default executor.
+
+        Raises:
+            TypeError: If rsa is not an RSAPublicEncryption or executor is not
+                an Executor.
+
+        """
+        if not isinstance(rsa, RSAPublicEncryption):
+            logger.error('Invalid rsa type: %s', type(rsa))
+            raise TypeError('rsa must be an instance of RSAPublicEncryption')
+        _check_executor(executor)
+
+        self._rsa = rsa
+        self._executor = executor
+
+    def __repr__(self):
+        """Return a string representation of the AsyncRSAPublicEncryption instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                key, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return f'{self.__module__}.{class_name}(key={self._rsa.key!r}) object at {hex(id(self))}'
+
+    async def encrypt(self, data: bytes) -> bytes:
+        """Encrypts data using the public key on the executor.
+
+        Args:
+            data: The bytes to encrypt.
+
+        Returns:
+            bytes: The encrypted data.
+
+        Raises:
+            TypeError: If the provided data is not bytes.
+            EncryptionError: If encryption fails.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._rsa.encrypt, data)
+
+    async def verify(self, data: bytes, signature: bytes):
+        """Verify the signature of the data on the executor.
+
+        Args:
+            data: The original data that was signed.
+            signature: The received signature.
+
+        Raises:
+            TypeError: If the data or signature are not bytes.
+            SignatureVerificationError: If the signature is invalid.
+
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._rsa.verify, data, signature)
+
+    @property
+    def rsa(self) -> RSAPublicEncryption:
+        """Returns the wrapped RSAPublicEncryption handler.
+
+        Returns:
+            RSAPublicEncryption: The synchronous handler.
+
+        """
+        return self._rsa
+
+
+class AsyncAESEncryption(EncryptionMixin):
+    """Asynchronous batch wrapper around AESEncryption.
+
+    Single small messages are cheap enough to encrypt on the event loop with
+    the wrapped handler; batches are offloaded to the executor.
+
+    Attributes:
+        aes: The wrapped AESEncryption handler.
+
+    """
+
+    def __init__(self, aes: Optional[AESEncryption] = None, executor: Optional[Executor] = None):
+        """Initialize AsyncAESEncryption around a handler.
+
+        Args:
+            aes: The AESEncryption handler to wrap. If None, a handler with a
+                random key is created.
+            executor: The thread executor used for batches. None uses the
+                event loop's default executor.
+
+        Raises:
+            TypeError: If aes is not an AESEncryption or executor is not an Executor.
+
+        """
+        if aes is None:
+            aes = AESEncryption()
+        elif not isinstance(aes, AESEncryption):
+            logger.error('Invalid aes type: %s', type(aes))
+            raise TypeError('aes must be an instance of AESEncryption')
+        _check_executor(executor)
+
+        self._aes = aes
+        self._executor = executor
+
+    def __repr__(self):
+        """Return a string representation of the AsyncAESEncryption instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                key, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return f'{self.__module__}.{class_name}(key=<hidden>) object at {hex(id(self))}'
+
+    async def encrypt_many(self, plaintexts: Iterable[str]) -> list[str]:
+        """Encrypts a batch of texts on the executor.
+
+        Args:
+            plaintexts: An iterable of text strings to encrypt.
+
+        Returns:
+            list[str]: The base64-encoded encrypted data, in input order.
+
+        Raises:
+            EncryptionError: If an error occurs during encryption.
+            TypeError: If any of the plaintexts is not a string.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._aes.encrypt_many, plaintexts)
+
+    async def decrypt_many(self, b64_ciphertexts: Iterable[str]) -> list[str]:
+        """Decrypts a batch of base64-encoded AES encrypted data on the executor.
+
+        Args:
+            b64_ciphertexts: An iterable of base64-encoded encrypted data.
+
+        Returns:
+            list[str]: The decrypted plaintexts, in input order.
+
+        Raises:
+            TypeError: If any of the items is not a string.
+            ValueError: If any base64 item is invalid or too short.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._aes.decrypt_many, b64_ciphertexts)
+
+    @property
+    def aes(self) -> AESEncryption:
+        """Returns the wrapped AESEncryption handler.
+
+        Returns:
+            AESEncryption: The synchronous handler.
+
+        """
+        return self._aes
@@ -0,0 +1,230 @@
+"""Bounded LRU cache of deserialized public keys.
+
+Servers relay the same peer public keys over and over, on reconnects and on
+every key exchange message. This module provides a cache keyed by the
+base64-encoded key string, so each key is decoded and parsed only once
+while it stays in use.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+
+from confy_addons.core.constants import DEFAULT_PUBLIC_KEY_CACHE_SIZE
+from confy_addons.core.log import get_logger
+from confy_addons.encryption.rsa import RSAPublicEncryption, deserialize_public_key
+
+logger = get_logger(__name__)
+
+
+class PublicKeyCacheStats(NamedTuple):
+    """Snapshot of the metrics of a PublicKeyCache.
+
+    Attributes:
+        hits: How many lookups were served from the cache.
+        misses: How many lookups had to deserialize the key.
+        evictions: How many entries were dropped for size or expiry.
+        size: How many entries the cache holds.
+        max_size: The maximum number of entries.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class _Entry:
+    __slots__ = ('encryption', 'expires_at', 'public_key')
+
+    def __init__(self, public_key: PublicKeyTypes, expires_at: Optional[float]):
+        self.public_key = public_key
+        self.expires_at = expires_at
+        self.encryption: Optional[RSAPublicEncryption] = None
+
+
+class PublicKeyCache:
+    """Thread-safe LRU cache of public keys keyed by their base64 string.
+
+    Attributes:
+        max_size: The maximum number of cached keys.
+        ttl: How long an entry stays valid, in seconds, or None for no expiry.
+
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PUBLIC_KEY_CACHE_SIZE, ttl: Optional[float] = None):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: The maximum number of cached keys; the least recently
+                used key is evicted beyond it.
+            ttl: How long an entry stays valid after being loaded, in seconds.
+                None keeps entries until they are evicted for size.
+
+        Raises:
+            TypeError: If max_size is not an integer or ttl is not a number.
+            ValueError: If max_size or ttl are not positive.
+
+        """
+        if not isinstance(max_size, int):
+            logger.error('Invalid max_size type: %s', type(max_size))
+            raise TypeError('max_size must be an integer')
+        if max_size <= 0:
+            logger.error('Invalid max_size value: %s', max_size)
+            raise ValueError('max_size must be a positive integer')
+        if ttl is not None:
+            if not isinstance(ttl, (int, float)):
+                logger.error('Invalid ttl type: %s', type(ttl))
+                raise TypeError('ttl must be a number of seconds')
+            if ttl <= 0:
+                logger.error('Invalid ttl value: %s', ttl)
+                raise ValueError('ttl must be positive')
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self):
+        """Return a string representation of the PublicKeyCache instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                parameters, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(max_size={self._max_size!r}, ttl={self._ttl!r}) '
+            f'object at {hex(id(self))}'
+        )
+
+    def __len__(self):
+        """Return the number of cached keys."""
+        return len(self._entries)
+
+    def deserialize(self, b64_key: str) -> PublicKeyTypes:
+        """Return the public key for a base64-encoded key string.
+
+        Equivalent to deserialize_public_key, but parses each key only once
+        while it stays in the cache.
+
+        Args:
+            b64_key: The base64-encoded PEM or DER representation of the key.
+
+        Returns:
+            PublicKeyTypes: The deserialized public key object.
+
+        Raises:
+            TypeError: If b64_key is not a string.
+            ValueError: If the base64 decoding fails or the key cannot be loaded.
+
+        """
+        return self._entry(b64_key).public_key
+
+    def public_encryption(self, b64_key: str) -> RSAPublicEncryption:
+        """Return a ready RSAPublicEncryption for a base64-encoded key string.
+
+        The wrapper is created once per cached key and shared by later calls.
+
+        Args:
+            b64_key: The base64-encoded PEM or DER representation of an RSA key.
+
+        Returns:
+            RSAPublicEncryption: The encryption handler for the key.
+
+        Raises:
+            TypeError: If b64_key is not a string or not an RSA public key.
+            ValueError: If the base64 decoding fails or the key cannot be loaded.
+
+        """
+        entry = self._entry(b64_key)
+        if entry.encryption is None:
+            entry.encryption = RSAPublicEncryption(entry.public_key)  # type: ignore[arg-type]
+        return entry.encryption
+
+    def invalidate(self, b64_key: str):
+        """Remove a key from the cache, if present.
+
+        Args:
+            b64_key: The base64-encoded key string to remove.
+
+        """
+        with self._lock:
+            self._entries.pop(b64_key, None)
+
+    def clear(self):
+        """Remove every key from the cache, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> PublicKeyCacheStats:
+        """Return a snapshot of the cache metrics.
+
+        Returns:
+            PublicKeyCacheStats: The hit, miss and eviction counters and the
+                current size.
+
+        """
+        with self._lock:
+            return PublicKeyCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    @property
+    def max_size(self) -> int:
+        """Returns the maximum number of cached keys.
+
+        Returns:
+            int: The maximum number of entries.
+
+        """
+        return self._max_size
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Returns how long an entry stays valid, in seconds.
+
+        Returns:
+            Optional[float]: The time to live, or None for no expiry.
+
+        """
+        return self._ttl
+
+    def _entry(self, b64_key: str) -> _Entry:
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(b64_key)
+            if entry is not None:
+                if entry.expires_at is None or entry.expires_at > now:
+                    self._hits += 1
+                    self._entries.move_to_end(b64_key)
+                    return entry
+                del self._entries[b64_key]
+                self._evictions += 1
+            self._misses += 1
+
+        # Parse outside the lock so a slow key does not block other lookups.
+        public_key = deserialize_public_key(b64_key)
+        expires_at = None if self._ttl is None else now + self._ttl
+
+        with self._lock:
+            entry = self._entries.setdefault(b64_key, _Entry(public_key, expires_at))
+            self._entries.move_to_end(b64_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return entry
@@ -0,0 +1,140 @@
+"""Compression codecs applied to payloads before encryption.
+
+Ciphertext is indistinguishable from random data and cannot be compressed,
+so payloads are compressed before they are encrypted. This module provides
+a zlib codec implementing the CompressionCodecABC abstract base class;
+other algorithms can be plugged in by implementing the same interface.
+
+Compressed length depends on the content, so compressing secrets together
+with attacker-controlled data can leak them through the ciphertext length.
+Only enable compression for payloads where that is acceptable.
+"""
+
+import zlib
+
+from confy_addons.core.abstract import CompressionCodecABC
+from confy_addons.core.constants import (
+    DEFAULT_DECOMPRESSED_MAX_SIZE,
+    DEFAULT_ZLIB_LEVEL,
+)
+from confy_addons.core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class ZlibCompression(CompressionCodecABC):
+    """zlib compression codec with a bound on the decompressed size.
+
+    Attributes:
+        level: The zlib compression level, from 0 to 9.
+        max_size: The largest decompressed payload accepted, in bytes.
+
+    """
+
+    def __init__(
+        self, level: int = DEFAULT_ZLIB_LEVEL, max_size: int = DEFAULT_DECOMPRESSED_MAX_SIZE
+    ):
+        """Initialize ZlibCompression.
+
+        Args:
+            level: The zlib compression level, from 0 (none) to 9 (best).
+            max_size: The largest decompressed payload accepted, in bytes, so
+                a small malicious payload cannot expand without bound.
+
+        Raises:
+            TypeError: If level or max_size are not integers.
+            ValueError: If level is out of range or max_size is not positive.
+
+        """
+        if not isinstance(level, int):
+            logger.error('Invalid level type: %s', type(level))
+            raise TypeError('level must be an integer')
+        if not 0 <= level <= zlib.Z_BEST_COMPRESSION:
+            logger.error('Invalid level value: %s', level)
+            raise ValueError('level must be between 0 and 9')
+        if not isinstance(max_size, int):
+            logger.error('Invalid max_size type: %s', type(max_size))
+            raise TypeError('max_size must be an integer')
+        if max_size <= 0:
+            logger.error('Invalid max_size value: %s', max_size)
+            raise ValueError('max_size must be a positive integer')
+
+        self._level = level
+        self._max_size = max_size
+
+    def __repr__(self):
+        """Return a string representation of the ZlibCompression instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                parameters, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(level={self._level!r}, '
+            f'max_size={self._max_size!r}) object at {hex(id(self))}'
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses data with zlib.
+
+        Args:
+            data: The data to compress.
+
+        Returns:
+            bytes: The compressed data.
+
+        """
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompresses zlib data.
+
+        Args:
+            data: The compressed data.
+
+        Returns:
+            bytes: The decompressed data.
+
+        Raises:
+            ValueError: If the data is not valid zlib data or expands beyond
+                max_size.
+
+        """
+        decompressor = zlib.decompressobj()
+
+        try:
+            decompressed = decompressor.decompress(data, self._max_size)
+        except zlib.error as e:
+            logger.error('Error occurred during decompression: %s', e)
+            raise ValueError('Invalid compressed data') from e
+
+        if decompressor.unconsumed_tail:
+            logger.error('Decompressed data exceeds %s bytes', self._max_size)
+            raise ValueError(f'Decompressed data exceeds {self._max_size} bytes')
+        if not decompressor.eof:
+            logger.error('Compressed data is truncated')
+            raise ValueError('Invalid compressed data')
+
+        return decompressed
+
+    @property
+    def level(self) -> int:
+        """Returns the zlib compression level.
+
+        Returns:
+            int: The compression level.
+
+        """
+        return self._level
+
+    @property
+    def max_size(self) -> int:
+        """Returns the largest decompressed payload accepted.
+
+        Returns:
+            int: The maximum size in bytes.
+
+        """
+        return self._max_size
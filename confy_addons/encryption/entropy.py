@@ -0,0 +1,140 @@
+"""Buffered source of random IVs and nonces.
+
+Every message needs a fresh random IV (AES-CFB) or nonce (AEAD), and reading
+each one with its own os.urandom call costs a system call per message. This
+module reads randomness from the operating system in blocks and hands out
+slices of it, so a block of 4 KiB serves 256 AES IVs with one system call.
+
+Buffered bytes must never be handed out twice, so every pool drops its
+buffer in the child process after os.fork(); the child reads fresh
+randomness on its next call.
+
+The pools only serve IVs and nonces, which are sent in clear next to the
+ciphertext. Keys are still read directly with secrets.token_bytes, so no
+future key material sits in a buffer.
+"""
+
+import os
+import weakref
+
+from confy_addons.core.constants import DEFAULT_RANDOM_POOL_BLOCK_SIZE
+from confy_addons.core.log import get_logger
+
+logger = get_logger(__name__)
+
+_MIN_TOKENS_PER_BLOCK = 64
+
+
+class RandomPool:
+    """Thread-safe buffer of operating system randomness.
+
+    Each block read from the operating system is cut into tokens of the
+    requested size, and every call pops one token. Popping from a list is
+    atomic, so concurrent calls never share a token and need no lock;
+    threads that find the list empty at the same time each read a block.
+
+    Attributes:
+        block_size: How many bytes are read from the operating system at once.
+
+    """
+
+    def __init__(self, block_size: int = DEFAULT_RANDOM_POOL_BLOCK_SIZE):
+        """Initialize an empty pool.
+
+        Args:
+            block_size: How many bytes to read from the operating system at
+                once. Requests of more than block_size / 64 bytes are read
+                directly, so every block serves at least 64 tokens.
+
+        Raises:
+            TypeError: If block_size is not an integer.
+            ValueError: If block_size is not positive.
+
+        """
+        if not isinstance(block_size, int):
+            logger.error('Invalid block_size type: %s', type(block_size))
+            raise TypeError('block_size must be an integer')
+        if block_size <= 0:
+            logger.error('Invalid block_size value: %s', block_size)
+            raise ValueError('block_size must be a positive integer')
+
+        self._block_size = block_size
+        self._max_token_size = block_size // _MIN_TOKENS_PER_BLOCK
+        self._tokens: dict[int, list[bytes]] = {}
+        _pools.add(self)
+
+    def __repr__(self):
+        """Return a string representation of the RandomPool instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                block size, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(block_size={self._block_size!r}) '
+            f'object at {hex(id(self))}'
+        )
+
+    def token_bytes(self, size: int) -> bytes:
+        """Return random bytes that were never returned before.
+
+        Args:
+            size: The number of bytes.
+
+        Returns:
+            bytes: size random bytes.
+
+        """
+        try:
+            return self._tokens[size].pop()
+        except (KeyError, IndexError):
+            if size > self._max_token_size or size <= 0:
+                return os.urandom(size)
+
+        block = os.urandom(self._block_size - self._block_size % size)
+        tokens = [block[start : start + size] for start in range(size, len(block), size)]
+        self._tokens.setdefault(size, []).extend(tokens)
+        return block[:size]
+
+    def reset(self):
+        """Drop the buffered bytes, so the next call reads fresh randomness."""
+        self._tokens = {}
+
+    @property
+    def block_size(self) -> int:
+        """Returns how many bytes are read from the operating system at once.
+
+        Returns:
+            int: The block size in bytes.
+
+        """
+        return self._block_size
+
+
+_pools: weakref.WeakSet[RandomPool] = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for pool in list(_pools):
+        pool.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+_default_pool = RandomPool()
+
+
+def token_bytes(size: int) -> bytes:
+    """Return random bytes for an IV or nonce from the process-wide pool.
+
+    Args:
+        size: The number of bytes.
+
+    Returns:
+        bytes: size random bytes, never returned before in any process.
+
+    """
+    return _default_pool.token_bytes(size)
@@ -0,0 +1,314 @@
+"""Hybrid envelope encryption combining RSA and AES.
+
+This module wraps the hybrid flow used by Confy clients in a single object:
+a payload is encrypted once with a fresh AES data key, and the data key is
+wrapped with RSA for each recipient. Sending to N recipients therefore costs
+one symmetric pass plus N RSA wraps instead of N full encryptions.
+
+The key and message strings produced here use the AES_KEY_PREFIX and
+AES_PREFIX prefixes, as in the manual handshake.
+"""
+
+import base64
+import binascii
+from collections.abc import Mapping
+from typing import NamedTuple, Optional
+
+from confy_addons.core.log import get_logger
+from confy_addons.core.mixins import EncryptionMixin
+from confy_addons.encryption.aes import AESEncryption
+from confy_addons.encryption.rsa import RSAEncryption, RSAPublicEncryption
+from confy_addons.prefixes import AES_KEY_PREFIX, AES_PREFIX
+
+logger = get_logger(__name__)
+
+
+class SealedEnvelope(NamedTuple):
+    """A payload encrypted once and its data key wrapped per recipient.
+
+    Attributes:
+        ciphertext: The base64-encoded AES encrypted payload.
+        wrapped_keys: The base64-encoded RSA wrapped data key, by recipient ID.
+
+    """
+
+    ciphertext: str
+    wrapped_keys: dict[str, str]
+
+
+class EnvelopeEncryption(EncryptionMixin):
+    """Hybrid encryption handler holding an AES data key.
+
+    The data key encrypts payloads and is shared with recipients by wrapping
+    it with their RSA public keys.
+
+    Attributes:
+        aes: The AES encryption handler holding the data key.
+
+    """
+
+    def __init__(self, aes: Optional[AESEncryption] = None):
+        """Initialize EnvelopeEncryption with a data key.
+
+        Args:
+            aes: An optional AES handler holding the data key. If None, a
+                handler with a random key is created.
+
+        Raises:
+            TypeError: If aes is not an instance of AESEncryption.
+
+        """
+        if aes is None:
+            aes = AESEncryption()
+        elif not isinstance(aes, AESEncryption):
+            logger.error('Invalid aes type: %s', type(aes))
+            raise TypeError('aes must be an instance of AESEncryption')
+
+        self._aes = aes
+
+    def __repr__(self):
+        """Return a string representation of the EnvelopeEncryption instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                key, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return f'{self.__module__}.{class_name}(key=<hidden>) object at {hex(id(self))}'
+
+    @classmethod
+    def from_wrapped_key(cls, wrapped_key: str, rsa: RSAEncryption) -> 'EnvelopeEncryption':
+        """Create an EnvelopeEncryption instance by unwrapping a data key.
+
+        Args:
+            wrapped_key: The base64-encoded RSA wrapped data key.
+            rsa: The recipient's RSA handler holding the private key.
+
+        Returns:
+            EnvelopeEncryption: An instance holding the unwrapped data key.
+
+        Raises:
+            TypeError: If wrapped_key is not a string.
+            ValueError: If wrapped_key is not valid base64 or the unwrapped
+                key has an invalid length.
+            DecryptionError: If RSA decryption of the data key fails.
+
+        """
+        if not isinstance(wrapped_key, str):
+            logger.error('Invalid wrapped_key type: %s', type(wrapped_key))
+            raise TypeError('wrapped_key must be a base64-encoded str')
+
+        try:
+            encrypted_key = base64.b64decode(wrapped_key, validate=True)
+        except (binascii.Error, ValueError) as e:
+            logger.error('Error occurred during base64 decoding: %s', e)
+            raise ValueError('Invalid base64 wrapped key') from e
+
+        return cls(AESEncryption(key=rsa.decrypt(encrypted_key)))
+
+    @classmethod
+    def from_key_message(cls, message: str, rsa: RSAEncryption) -> 'EnvelopeEncryption':
+        """Create an EnvelopeEncryption instance from an AES_KEY_PREFIX message.
+
+        Args:
+            message: The key message produced by key_message.
+            rsa: The recipient's RSA handler holding the private key.
+
+        Returns:
+            EnvelopeEncryption: An instance holding the unwrapped data key.
+
+        Raises:
+            TypeError: If message is not a string.
+            ValueError: If message does not start with AES_KEY_PREFIX or the
+                wrapped key is invalid.
+            DecryptionError: If RSA decryption of the data key fails.
+
+        """
+        return cls.from_wrapped_key(_strip_prefix(message, AES_KEY_PREFIX), rsa)
+
+    def wrap_key(self, recipient: RSAPublicEncryption) -> str:
+        """Wrap the data key for a recipient.
+
+        Args:
+            recipient: The recipient's RSA public key handler.
+
+        Returns:
+            str: The base64-encoded RSA encrypted data key.
+
+        Raises:
+            TypeError: If recipient is not an instance of RSAPublicEncryption.
+            EncryptionError: If RSA encryption fails.
+
+        """
+        if not isinstance(recipient, RSAPublicEncryption):
+            logger.error('Invalid recipient type: %s', type(recipient))
+            raise TypeError('recipient must be an instance of RSAPublicEncryption')
+
+        return base64.b64encode(recipient.encrypt(self._aes.key)).decode('ascii')
+
+    def key_message(self, recipient: RSAPublicEncryption) -> str:
+        """Wrap the data key for a recipient as an AES_KEY_PREFIX message.
+
+        Args:
+            recipient: The recipient's RSA public key handler.
+
+        Returns:
+            str: The key message to send to the recipient.
+
+        Raises:
+            TypeError: If recipient is not an instance of RSAPublicEncryption.
+            EncryptionError: If RSA encryption fails.
+
+        """
+        return f'{AES_KEY_PREFIX}{self.wrap_key(recipient)}'
+
+    @classmethod
+    def seal(cls, plaintext: str, recipients: Mapping[str, RSAPublicEncryption]) -> SealedEnvelope:
+        """Encrypt a payload once under a fresh data key wrapped for every recipient.
+
+        Every call draws a new data key, so the recipients of one envelope
+        cannot open any other envelope. The data key of an instance, shared
+        through key_message, is only used by encrypt and encrypt_message.
+
+        Args:
+            plaintext: The text string to encrypt.
+            recipients: The recipients' RSA public key handlers, by recipient ID.
+
+        Returns:
+            SealedEnvelope: The encrypted payload and the wrapped keys.
+
+        Raises:
+            TypeError: If the plaintext is not a string or a recipient is not an
+                instance of RSAPublicEncryption.
+            EncryptionError: If AES or RSA encryption fails.
+
+        """
+        envelope = cls()
+        ciphertext = envelope.encrypt(plaintext)
+        wrapped_keys = {
+            recipient_id: envelope.wrap_key(recipient)
+            for recipient_id, recipient in recipients.items()
+        }
+        return SealedEnvelope(ciphertext, wrapped_keys)
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt text with the data key.
+
+        Args:
+            plaintext: The text string to encrypt.
+
+        Returns:
+            str: The base64-encoded encrypted data.
+
+        Raises:
+            TypeError: If the plaintext is not a string.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        return self._aes.encrypt(plaintext)
+
+    def decrypt(self, b64_ciphertext: str) -> str:
+        """Decrypt text encrypted with the data key.
+
+        Args:
+            b64_ciphertext: The base64-encoded encrypted data.
+
+        Returns:
+            str: The decrypted plaintext.
+
+        Raises:
+            TypeError: If the b64_ciphertext is not a string.
+            ValueError: If the base64 data is invalid or too short.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        return self._aes.decrypt(b64_ciphertext)
+
+    def encrypt_message(self, plaintext: str) -> str:
+        """Encrypt text as an AES_PREFIX message.
+
+        Args:
+            plaintext: The text string to encrypt.
+
+        Returns:
+            str: The encrypted message to send.
+
+        Raises:
+            TypeError: If the plaintext is not a string.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        return f'{AES_PREFIX}{self._aes.encrypt(plaintext)}'
+
+    def decrypt_message(self, message: str) -> str:
+        """Decrypt an AES_PREFIX message.
+
+        Args:
+            message: The message produced by encrypt_message.
+
+        Returns:
+            str: The decrypted plaintext.
+
+        Raises:
+            TypeError: If message is not a string.
+            ValueError: If message does not start with AES_PREFIX or its
+                payload is invalid.
+            DecryptionError: If an error occurs during decryption.
+
+        """
+        return self._aes.decrypt(_strip_prefix(message, AES_PREFIX))
+
+    @property
+    def aes(self) -> AESEncryption:
+        """Returns the AES handler holding the data key.
+
+        Returns:
+            AESEncryption: The AES encryption handler.
+
+        """
+        return self._aes
+
+
+def open_envelope(ciphertext: str, wrapped_key: str, rsa: RSAEncryption) -> str:
+    """Decrypt a sealed payload with the recipient's wrapped key.
+
+    Args:
+        ciphertext: The base64-encoded encrypted payload of the envelope.
+        wrapped_key: The recipient's entry in the envelope's wrapped keys.
+        rsa: The recipient's RSA handler holding the private key.
+
+    Returns:
+        str: The decrypted plaintext.
+
+    Raises:
+        TypeError: If ciphertext or wrapped_key are not strings.
+        ValueError: If the base64 data is invalid.
+        DecryptionError: If RSA or AES decryption fails.
+
+    """
+    return EnvelopeEncryption.from_wrapped_key(wrapped_key, rsa).decrypt(ciphertext)
+
+
+def _strip_prefix(message: str, prefix: str) -> str:
+    """Return the payload of a prefixed message.
+
+    Args:
+        message: The prefixed message.
+        prefix: The expected prefix.
+
+    Returns:
+        str: The message without the prefix.
+
+    Raises:
+        TypeError: If message is not a string.
+        ValueError: If message does not start with prefix.
+
+    """
+    if not isinstance(message, str):
+        logger.error('Invalid message type: %s', type(message))
+        raise TypeError('message must be a str')
+    if not message.startswith(prefix):
+        logger.error('Message does not start with the expected prefix')
+        raise ValueError(f'message must start with {prefix!r}')
+    return message[len(prefix) :]
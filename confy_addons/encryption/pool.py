@@ -0,0 +1,530 @@
+"""Background pre-generation of RSA key pairs.
+
+Generating a 4096-bit RSA key pair takes from hundreds of milliseconds to
+seconds. This module provides a pool that keeps a configurable number of
+ready private keys, refilled in the background, so that new sessions can take
+a key pair immediately instead of generating one on the connect path.
+
+Key generation holds the GIL for its whole duration, so by default the keys
+are generated in worker processes and moved back in serialized form; a
+thread refilling the pool would stall every other thread of the application
+for each key it generates. The worker processes are started with forkserver,
+or spawn where it is unavailable, since forking a process that runs threads
+can deadlock the child.
+"""
+
+import multiprocessing
+import os
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import NamedTuple, Optional, cast
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+from confy_addons.core.constants import (
+    DEFAULT_RSA_KEY_SIZE,
+    DEFAULT_RSA_POOL_SIZE,
+    DEFAULT_RSA_POOL_WORKERS,
+    RSA_PUBLIC_EXPONENT,
+)
+from confy_addons.core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds a worker waits before retrying after a failed generation.
+_RETRY_DELAY = 1.0
+
+# The process that imported this module, the only one that can use its forkserver.
+_import_pid = os.getpid()
+
+
+def _default_mp_context() -> BaseContext:
+    # The pool refills from threads, and forking while they run can deadlock
+    # the worker on a lock copied in its held state (Python 3.12 warns about
+    # it), so the workers never start with fork. A forked child cannot use
+    # the forkserver of its parent, so it falls back to spawn.
+    if os.getpid() == _import_pid and 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _check_mp_context(mp_context: Optional[BaseContext]):
+    if mp_context is not None and not isinstance(mp_context, BaseContext):
+        logger.error('Invalid mp_context type: %s', type(mp_context))
+        raise TypeError('mp_context must be a multiprocessing context')
+
+
+class RSAKeyPoolStats(NamedTuple):
+    """Snapshot of the metrics of an RSAKeyPool.
+
+    Attributes:
+        hits: How many keys were served from the pool.
+        misses: How many keys had to be generated on the caller's thread.
+        generated: How many keys were generated by the background workers.
+        available: How many keys are ready in the pool.
+        target_size: How many keys the workers try to keep ready.
+
+    """
+
+    hits: int
+    misses: int
+    generated: int
+    available: int
+    target_size: int
+
+
+class RSAKeyPool:
+    """Pool of pre-generated RSA private keys refilled in the background.
+
+    Keys are handed out once and never reused. When the pool is empty, the
+    key is generated on demand and counted as a miss; the calling thread
+    waits for it, on a worker process while the pool is running.
+
+    After os.fork() the child process gets an empty, stopped pool, so parent
+    and child never hand out the same key; call start in the child to refill
+    it there. The shared pools of get_default_pool are recreated and started
+    on first use in the child.
+
+    Attributes:
+        key_size: The size of the generated RSA keys in bits.
+        target_size: How many keys the workers try to keep ready.
+
+    """
+
+    def __init__(
+        self,
+        key_size: int = DEFAULT_RSA_KEY_SIZE,
+        target_size: int = DEFAULT_RSA_POOL_SIZE,
+        workers: int = DEFAULT_RSA_POOL_WORKERS,
+        processes: bool = True,
+        mp_context: Optional[BaseContext] = None,
+    ):
+        """Initialize the pool without starting the workers.
+
+        Args:
+            key_size: The size of the RSA keys in bits. Defaults to 4096.
+            target_size: How many keys to keep ready.
+            workers: How many keys are generated at once.
+            processes: Whether to generate the keys in worker processes. With
+                False the keys are generated on background threads, which
+                avoids starting processes but holds the GIL, stalling the
+                other threads for the whole generation of each key (about
+                300 ms per 4096-bit key).
+            mp_context: The multiprocessing context used to start the worker
+                processes. Defaults to forkserver, or spawn where forkserver
+                is unavailable.
+
+        Raises:
+            TypeError: If key_size, target_size or workers are not integers, or
+                mp_context is not a multiprocessing context.
+            ValueError: If key_size is less than the recommended minimum for
+                security, or target_size or workers are not positive.
+
+        """
+        for name, value in (
+            ('key_size', key_size),
+            ('target_size', target_size),
+            ('workers', workers),
+        ):
+            if not isinstance(value, int):
+                logger.error('Invalid %s type: %s', name, type(value))
+                raise TypeError(f'{name} must be an integer')
+
+        if key_size < DEFAULT_RSA_KEY_SIZE:
+            logger.error('Invalid key_size value: %s', key_size)
+            raise ValueError(f'key_size must be at least {DEFAULT_RSA_KEY_SIZE} bits for security')
+        if target_size <= 0:
+            logger.error('Invalid target_size value: %s', target_size)
+            raise ValueError('target_size must be a positive integer')
+        if workers <= 0:
+            logger.error('Invalid workers value: %s', workers)
+            raise ValueError('workers must be a positive integer')
+        _check_mp_context(mp_context)
+
+        self._key_size = key_size
+        self._target_size = target_size
+        self._workers = workers
+        self._processes = processes
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._keys: deque[RSAPrivateKey] = deque()
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._running = False
+        self._pending = 0
+        self._hits = 0
+        self._misses = 0
+        self._generated = 0
+        _pools.add(self)
+
+    def __repr__(self):
+        """Return a string representation of the RSAKeyPool instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                parameters, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(key_size={self._key_size!r}, '
+            f'target_size={self._target_size!r}) object at {hex(id(self))}'
+        )
+
+    def __enter__(self):
+        """Start the workers when entering a with block.
+
+        Returns:
+            RSAKeyPool: The started pool.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        """Stop the workers when leaving a with block."""
+        self.stop()
+
+    def start(self):
+        """Start the background workers that refill the pool.
+
+        Calling start on a running pool has no effect.
+
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            if self._processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers, mp_context=self._mp_context or _default_mp_context()
+                )
+            self._threads = [
+                threading.Thread(target=self._refill, name=f'confy-rsa-pool-{index}', daemon=True)
+                for index in range(self._workers)
+            ]
+
+        for thread in self._threads:
+            thread.start()
+
+        logger.debug('RSA key pool started with %s worker(s)', self._workers)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background workers.
+
+        Keys already in the pool remain available to acquire. A worker in the
+        middle of generating a key finishes that key before exiting.
+
+        Args:
+            timeout: How long to wait for each worker, in seconds. None waits
+                until they exit, worker processes included.
+
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            threads, self._threads = self._threads, []
+            executor, self._executor = self._executor, None
+
+        for thread in threads:
+            thread.join(timeout)
+
+        if executor is not None:
+            # Without waiting, a process exiting right after stop() can orphan
+            # worker processes blocked on the call queue forever.
+            executor.shutdown(wait=timeout is None)
+
+        logger.debug('RSA key pool stopped')
+
+    def acquire(self) -> RSAPrivateKey:
+        """Take a private key from the pool.
+
+        Returns immediately when a key is ready; otherwise generates one and
+        waits for it.
+
+        Returns:
+            RSAPrivateKey: A private key that is not handed out again.
+
+        Raises:
+            RuntimeError: If key pair generation fails.
+
+        """
+        with self._condition:
+            if self._keys:
+                self._hits += 1
+                self._condition.notify_all()
+                return self._keys.popleft()
+            self._misses += 1
+
+        logger.debug('RSA key pool miss, generating key pair synchronously')
+        return self._generate()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the pool holds target_size keys.
+
+        Args:
+            timeout: How long to wait, in seconds. None waits indefinitely.
+
+        Returns:
+            bool: True if the pool is full, False if the timeout expired.
+
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._keys) >= self._target_size, timeout)
+
+    def stats(self) -> RSAKeyPoolStats:
+        """Return a snapshot of the pool metrics.
+
+        Returns:
+            RSAKeyPoolStats: The hit, miss and generation counters and the
+                number of keys available.
+
+        """
+        with self._condition:
+            return RSAKeyPoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                generated=self._generated,
+                available=len(self._keys),
+                target_size=self._target_size,
+            )
+
+    @property
+    def key_size(self) -> int:
+        """Returns the size of the generated RSA keys in bits.
+
+        Returns:
+            int: The key size in bits.
+
+        """
+        return self._key_size
+
+    @property
+    def target_size(self) -> int:
+        """Returns how many keys the workers try to keep ready.
+
+        Returns:
+            int: The target number of ready keys.
+
+        """
+        return self._target_size
+
+    def _generate(self) -> RSAPrivateKey:
+        executor = self._executor
+        try:
+            if executor is None:
+                return rsa.generate_private_key(
+                    public_exponent=RSA_PUBLIC_EXPONENT, key_size=self._key_size
+                )
+            # Waiting on the future releases the GIL; only the fast DER load
+            # runs in this process.
+            return load_private_key_der(
+                executor.submit(generate_private_key_der, self._key_size).result()
+            )
+        except Exception as e:
+            logger.error('Error occurred while generating RSA key pair: %s', e)
+            raise RuntimeError('Failed to generate RSA key pair') from e
+
+    def _refill(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: (
+                        not self._running or len(self._keys) + self._pending < self._target_size
+                    )
+                )
+                if not self._running:
+                    return
+                self._pending += 1
+
+            try:
+                key = self._generate()
+            except RuntimeError:
+                with self._condition:
+                    self._pending -= 1
+                    self._condition.wait_for(lambda: not self._running, _RETRY_DELAY)
+                continue
+
+            with self._condition:
+                self._pending -= 1
+                self._keys.append(key)
+                self._generated += 1
+                self._condition.notify_all()
+
+    def _after_fork_in_child(self):
+        # The worker threads do not exist in the child and may have held the
+        # condition when the process forked, so all the state is replaced.
+        self._condition = threading.Condition()
+        self._keys = deque()
+        self._threads = []
+        self._running = False
+        self._pending = 0
+        self._executor = None
+
+
+_pools: weakref.WeakSet[RSAKeyPool] = weakref.WeakSet()
+_default_pools_lock = threading.RLock()
+_default_pools: dict[int, RSAKeyPool] = {}
+
+
+def _after_fork_in_child():
+    for pool in list(_pools):
+        pool._after_fork_in_child()
+    _default_pools.clear()
+    _default_pools_lock.release()
+
+
+if hasattr(os, 'register_at_fork'):
+    # The lock of the shared pools is held across the fork, so the child
+    # never inherits it locked by a thread that only exists in the parent.
+    os.register_at_fork(
+        before=_default_pools_lock.acquire,
+        after_in_parent=_default_pools_lock.release,
+        after_in_child=_after_fork_in_child,
+    )
+
+
+def get_default_pool(key_size: int = DEFAULT_RSA_KEY_SIZE) -> RSAKeyPool:
+    """Return the shared, started key pool for the given key size.
+
+    The pool is created and started on first use.
+
+    Args:
+        key_size: The size of the RSA keys in bits. Defaults to 4096.
+
+    Returns:
+        RSAKeyPool: The shared pool for key_size.
+
+    """
+    with _default_pools_lock:
+        pool = _default_pools.get(key_size)
+        if pool is None:
+            pool = _default_pools[key_size] = RSAKeyPool(key_size=key_size)
+            pool.start()
+        return pool
+
+
+def generate_private_key_der(key_size: int) -> bytes:
+    """Generate a private key and return it in serialized form.
+
+    Meant to run in a worker process, so the key is sent back as unencrypted
+    PKCS#8 DER bytes through the process pool's pipe to the parent process only.
+
+    Args:
+        key_size: The size of the RSA key in bits.
+
+    Returns:
+        bytes: The private key in PKCS#8 DER format.
+
+    """
+    private_key = rsa.generate_private_key(public_exponent=RSA_PUBLIC_EXPONENT, key_size=key_size)
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def load_private_key_der(der: bytes) -> RSAPrivateKey:
+    """Load a private key serialized by generate_private_key_der.
+
+    This is the counterpart of generate_private_key_der, shared by RSAKeyPool,
+    generate_private_keys and AsyncRSAEncryption.create. It is internal to
+    confy_addons and not exported by the package.
+
+    The RSA key validation is skipped, so this must never be given DER that
+    did not come from generate_private_key_der in this application. Use
+    cryptography's load_der_private_key for keys from any other source.
+
+    Args:
+        der: The private key in PKCS#8 DER format.
+
+    Returns:
+        RSAPrivateKey: The loaded private key.
+
+    """
+    # The key comes from generate_private_key_der in a worker process of this
+    # application, so the primality checks, which take about 200 ms for a
+    # 4096-bit key while holding the GIL, are skipped.
+    return cast(
+        RSAPrivateKey,
+        serialization.load_der_private_key(
+            der, password=None, unsafe_skip_rsa_key_validation=True
+        ),
+    )
+
+
+def generate_private_keys(
+    count: int,
+    key_size: int = DEFAULT_RSA_KEY_SIZE,
+    workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> list[RSAPrivateKey]:
+    """Generate several RSA private keys in parallel across processes.
+
+    Key generation is CPU-bound, so it is spread over a process pool to use
+    every core. With a single worker the keys are generated in the calling
+    process without starting a pool.
+
+    Args:
+        count: How many keys to generate.
+        key_size: The size of the RSA keys in bits. Defaults to 4096.
+        workers: How many worker processes to use. Defaults to the number
+            of CPUs, capped at count.
+        mp_context: The multiprocessing context used to start the worker
+            processes. Defaults to forkserver, or spawn where forkserver is
+            unavailable.
+
+    Returns:
+        list[RSAPrivateKey]: The generated private keys.
+
+    Raises:
+        TypeError: If count, key_size or workers are not integers, or
+            mp_context is not a multiprocessing context.
+        ValueError: If count is negative, workers is not positive, or
+            key_size is less than the recommended minimum for security.
+        RuntimeError: If key pair generation fails.
+
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    for name, value in (('count', count), ('key_size', key_size), ('workers', workers)):
+        if not isinstance(value, int):
+            logger.error('Invalid %s type: %s', name, type(value))
+            raise TypeError(f'{name} must be an integer')
+
+    if count < 0:
+        logger.error('Invalid count value: %s', count)
+        raise ValueError('count must not be negative')
+    if key_size < DEFAULT_RSA_KEY_SIZE:
+        logger.error('Invalid key_size value: %s', key_size)
+        raise ValueError(f'key_size must be at least {DEFAULT_RSA_KEY_SIZE} bits for security')
+    if workers <= 0:
+        logger.error('Invalid workers value: %s', workers)
+        raise ValueError('workers must be a positive integer')
+    _check_mp_context(mp_context)
+
+    workers = min(workers, count)
+
+    try:
+        if workers <= 1:
+            serialized = [generate_private_key_der(key_size) for _ in range(count)]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=mp_context or _default_mp_context()
+            ) as executor:
+                serialized = list(executor.map(generate_private_key_der, [key_size] * count))
+
+        keys = [load_private_key_der(der) for der in serialized]
+    except Exception as e:
+        logger.error('Error occurred while generating RSA key pairs: %s', e)
+        raise RuntimeError('Failed to generate RSA key pair') from e
+
+    logger.debug('Generated %s RSA key pair(s) with %s worker(s)', count, workers)
+    return keys
@@ -8,22 +8,77 @@ operations using RSA with OAEP padding.
 
 import base64
 import binascii
-import logging
+from typing import Optional
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
 
-from confy_addons.core.constants import DEFAULT_RSA_KEY_SIZE, LOGGER_LEVEL, RSA_PUBLIC_EXPONENT
+from confy_addons.core.constants import DEFAULT_RSA_KEY_SIZE, RSA_PUBLIC_EXPONENT
 from confy_addons.core.exceptions import (
     DecryptionError,
     EncryptionError,
+    SignatureVerificationError,
 )
+from confy_addons.core.log import get_logger
 from confy_addons.core.mixins import EncryptionMixin
+from confy_addons.encryption.pool import RSAKeyPool, generate_private_keys, get_default_pool
 
-logging.basicConfig(level=LOGGER_LEVEL)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+PEM_HEADER = b'-----BEGIN'
+
+# Padding profiles are immutable, so they are built once and shared by every
+# instance instead of being rebuilt on each encrypt, decrypt, sign or verify.
+SHA256 = hashes.SHA256()
+OAEP_SHA256 = padding.OAEP(mgf=padding.MGF1(algorithm=SHA256), algorithm=SHA256, label=None)
+PSS_MAX_LENGTH_SHA256 = padding.PSS(
+    mgf=padding.MGF1(algorithm=SHA256), salt_length=padding.PSS.MAX_LENGTH
+)
+PSS_DIGEST_LENGTH_SHA256 = padding.PSS(
+    mgf=padding.MGF1(algorithm=SHA256), salt_length=padding.PSS.DIGEST_LENGTH
+)
+# Verification only: accepts signatures made with any salt length.
+PSS_AUTO_SHA256 = padding.PSS(mgf=padding.MGF1(algorithm=SHA256), salt_length=padding.PSS.AUTO)
+DEFAULT_ENCRYPTION_PADDING = OAEP_SHA256
+DEFAULT_SIGNATURE_PADDING = PSS_MAX_LENGTH_SHA256
+
+
+def _check_paddings(
+    encryption_padding: padding.OAEP, signature_padding: padding.PSS, *, signing: bool = False
+):
+    """Validate the padding profiles given to an RSA handler.
+
+    Signatures are always hashed with SHA256, so the PSS profile must use MGF1
+    with SHA256 as well. PSS.AUTO only works when verifying, so it is rejected
+    for the profiles used to sign.
+
+    Args:
+        encryption_padding: The padding used to encrypt and decrypt.
+        signature_padding: The padding used to sign and verify.
+        signing: Whether signature_padding will be used to sign.
+
+    Raises:
+        TypeError: If the paddings are not OAEP and PSS instances.
+        ValueError: If signature_padding does not use MGF1 with SHA256, or uses
+            an automatic salt length for signing.
+
+    """
+    if not isinstance(encryption_padding, padding.OAEP):
+        logger.error('Invalid encryption_padding type: %s', type(encryption_padding))
+        raise TypeError('encryption_padding must be an instance of OAEP')
+    if not isinstance(signature_padding, padding.PSS):
+        logger.error('Invalid signature_padding type: %s', type(signature_padding))
+        raise TypeError('signature_padding must be an instance of PSS')
+    # cryptography exposes neither the MGF1 hash nor the salt length publicly.
+    mgf = signature_padding.mgf
+    if not isinstance(mgf, padding.MGF1) or not isinstance(mgf._algorithm, hashes.SHA256):
+        logger.error('Invalid signature_padding mask generation: %r', mgf)
+        raise ValueError('signature_padding must use MGF1 with SHA256')
+    if signing and signature_padding._salt_length is padding.PSS.AUTO:
+        logger.error('Invalid signature_padding salt length for signing: AUTO')
+        raise ValueError('signature_padding with an AUTO salt length can only verify')
 
 
 class RSAEncryption(EncryptionMixin):
@@ -33,6 +88,11 @@ class RSAEncryption(EncryptionMixin):
     and decryption operations. It provides convenient access to both private
     and public keys, as well as serialized forms of the public key.
 
+    Thread safety: the key pair never changes after initialization, so one
+    instance can be shared by any number of threads without locking. The
+    serialized public key forms are computed on first use; concurrent first
+    calls may each compute them, but always store and return equal values.
+
     Attributes:
         key_size: The size of the RSA key in bits.
         public_key: The RSA public key.
@@ -42,7 +102,25 @@ class RSAEncryption(EncryptionMixin):
 
     """
 
-    def __init__(self, key_size: int = DEFAULT_RSA_KEY_SIZE):
+    __slots__ = (
+        '_base64_public_key',
+        '_der_public_key',
+        '_encryption_padding',
+        '_key_size',
+        '_private_key',
+        '_public_exponent',
+        '_public_key',
+        '_serialized_public_key',
+        '_signature_padding',
+    )
+
+    def __init__(
+        self,
+        key_size: int = DEFAULT_RSA_KEY_SIZE,
+        *,
+        encryption_padding: padding.OAEP = DEFAULT_ENCRYPTION_PADDING,
+        signature_padding: padding.PSS = DEFAULT_SIGNATURE_PADDING,
+    ):
         """Initialize RSAEncryption with a new key pair.
 
         Generates a new RSA key pair with the specified key size and public
@@ -50,32 +128,184 @@ class RSAEncryption(EncryptionMixin):
 
         Args:
             key_size: The size of the RSA key in bits. Defaults to 4096.
+            encryption_padding: The OAEP padding used to decrypt. Defaults to
+                OAEP with SHA256.
+            signature_padding: The PSS padding used to sign, with MGF1 and
+                SHA256. Defaults to PSS with SHA256 and maximum salt length.
 
         Raises:
-            TypeError: If key_size is not an integer.
-            ValueError: If key_size is less than the recommended minimum for security.
+            TypeError: If key_size is not an integer or the paddings are not
+                OAEP and PSS instances.
+            ValueError: If key_size is less than the recommended minimum for
+                security or signature_padding cannot sign with SHA256.
             RuntimeError: If key pair generation fails.
 
         """
         if not isinstance(key_size, int):
-            logger.error(f'Invalid key_size type: {type(key_size)}')
+            logger.error('Invalid key_size type: %s', type(key_size))
             raise TypeError('key_size must be an integer')
         if key_size < DEFAULT_RSA_KEY_SIZE:
-            logger.error(f'Invalid key_size value: {key_size}')
+            logger.error('Invalid key_size value: %s', key_size)
             raise ValueError(f'key_size must be at least {DEFAULT_RSA_KEY_SIZE} bits for security')
 
+        _check_paddings(encryption_padding, signature_padding, signing=True)
+
         self._key_size = key_size
         self._public_exponent = RSA_PUBLIC_EXPONENT
+        self._encryption_padding = encryption_padding
+        self._signature_padding = signature_padding
 
         try:
-            self._private_key = rsa.generate_private_key(
+            private_key = rsa.generate_private_key(
                 public_exponent=self._public_exponent, key_size=self._key_size
             )
         except Exception as e:
             logger.error('Error occurred while generating RSA key pair: %s', e)
             raise RuntimeError('Failed to generate RSA key pair') from e
 
-        logger.debug(f'RSA key pair generated with key size: {self._key_size} bits')
+        self._set_private_key(private_key)
+
+        logger.debug('RSA key pair generated with key size: %s bits', self._key_size)
+
+    @classmethod
+    def from_private_key(
+        cls,
+        private_key: RSAPrivateKey,
+        *,
+        encryption_padding: padding.OAEP = DEFAULT_ENCRYPTION_PADDING,
+        signature_padding: padding.PSS = DEFAULT_SIGNATURE_PADDING,
+    ) -> 'RSAEncryption':
+        """Create an RSAEncryption instance from an existing private key.
+
+        Args:
+            private_key: The RSA private key to use.
+            encryption_padding: The OAEP padding used to decrypt. Defaults to
+                OAEP with SHA256.
+            signature_padding: The PSS padding used to sign, with MGF1 and
+                SHA256. Defaults to PSS with SHA256 and maximum salt length.
+
+        Returns:
+            RSAEncryption: An instance holding the given key pair.
+
+        Raises:
+            TypeError: If private_key is not an instance of RSAPrivateKey or the
+                paddings are not OAEP and PSS instances.
+            ValueError: If the key is smaller than the recommended minimum for
+                security or does not use the standard public exponent, or
+                signature_padding cannot sign with SHA256.
+
+        """
+        if not isinstance(private_key, RSAPrivateKey):
+            logger.error('Invalid private_key type: %s', type(private_key))
+            raise TypeError('private_key must be an instance of RSAPrivateKey')
+        if private_key.key_size < DEFAULT_RSA_KEY_SIZE:
+            logger.error('Invalid key_size value: %s', private_key.key_size)
+            raise ValueError(f'key_size must be at least {DEFAULT_RSA_KEY_SIZE} bits for security')
+        if private_key.public_key().public_numbers().e != RSA_PUBLIC_EXPONENT:
+            logger.error('Invalid public exponent for provided private key')
+            raise ValueError(f'public exponent must be {RSA_PUBLIC_EXPONENT}')
+
+        _check_paddings(encryption_padding, signature_padding, signing=True)
+
+        instance = cls.__new__(cls)
+        instance._key_size = private_key.key_size
+        instance._public_exponent = RSA_PUBLIC_EXPONENT
+        instance._encryption_padding = encryption_padding
+        instance._signature_padding = signature_padding
+        instance._set_private_key(private_key)
+        return instance
+
+    @classmethod
+    def from_pool(
+        cls,
+        pool: Optional[RSAKeyPool] = None,
+        *,
+        encryption_padding: padding.OAEP = DEFAULT_ENCRYPTION_PADDING,
+        signature_padding: padding.PSS = DEFAULT_SIGNATURE_PADDING,
+    ) -> 'RSAEncryption':
+        """Create an RSAEncryption instance with a pre-generated key pair.
+
+        Returns immediately when the pool has a key ready; otherwise the key
+        pair is generated synchronously, as in the regular constructor.
+
+        Args:
+            pool: The key pool to take the key pair from. Defaults to the shared
+                pool for 4096-bit keys, started on first use.
+            encryption_padding: The OAEP padding used to decrypt. Defaults to
+                OAEP with SHA256.
+            signature_padding: The PSS padding used to sign, with MGF1 and
+                SHA256. Defaults to PSS with SHA256 and maximum salt length.
+
+        Returns:
+            RSAEncryption: An instance holding a fresh key pair.
+
+        Raises:
+            TypeError: If the paddings are not OAEP and PSS instances.
+            ValueError: If signature_padding cannot sign with SHA256.
+            RuntimeError: If key pair generation fails.
+
+        """
+        _check_paddings(encryption_padding, signature_padding, signing=True)
+        if pool is None:
+            pool = get_default_pool()
+        return cls.from_private_key(
+            pool.acquire(),
+            encryption_padding=encryption_padding,
+            signature_padding=signature_padding,
+        )
+
+    @classmethod
+    def generate_many(
+        cls,
+        count: int,
+        key_size: int = DEFAULT_RSA_KEY_SIZE,
+        workers: Optional[int] = None,
+        *,
+        encryption_padding: padding.OAEP = DEFAULT_ENCRYPTION_PADDING,
+        signature_padding: padding.PSS = DEFAULT_SIGNATURE_PADDING,
+    ) -> list['RSAEncryption']:
+        """Create several RSAEncryption instances, generating keys in parallel.
+
+        Key generation is spread across a process pool; the private keys are
+        moved back to the calling process in serialized form.
+
+        Args:
+            count: How many instances to create.
+            key_size: The size of the RSA keys in bits. Defaults to 4096.
+            workers: How many worker processes to use. Defaults to the number of CPUs.
+            encryption_padding: The OAEP padding used to decrypt. Defaults to
+                OAEP with SHA256.
+            signature_padding: The PSS padding used to sign, with MGF1 and
+                SHA256. Defaults to PSS with SHA256 and maximum salt length.
+
+        Returns:
+            list[RSAEncryption]: The new instances, each with its own key pair.
+
+        Raises:
+            TypeError: If count, key_size or workers are not integers, or the
+                paddings are not OAEP and PSS instances.
+            ValueError: If count is negative, workers is not positive,
+                key_size is less than the recommended minimum for security, or
+                signature_padding cannot sign with SHA256.
+            RuntimeError: If key pair generation fails.
+
+        """
+        _check_paddings(encryption_padding, signature_padding, signing=True)
+        return [
+            cls.from_private_key(
+                key, encryption_padding=encryption_padding, signature_padding=signature_padding
+            )
+            for key in generate_private_keys(count, key_size, workers)
+        ]
+
+    def _set_private_key(self, private_key: RSAPrivateKey):
+        # The key pair never changes afterwards, so the public key object is kept
+        # and its serialized forms are computed once, on first access.
+        self._private_key = private_key
+        self._public_key = private_key.public_key()
+        self._serialized_public_key: Optional[bytes] = None
+        self._der_public_key: Optional[bytes] = None
+        self._base64_public_key: Optional[str] = None
 
     def __repr__(self):
         """Return a string representation of the RSAEncryption instance.
@@ -92,8 +322,8 @@ class RSAEncryption(EncryptionMixin):
     def decrypt(self, encrypted_data: bytes) -> bytes:
         """Decrypts data using the private key.
 
-        Decrypts the provided encrypted data using RSA with OAEP padding
-        and SHA256 hashing algorithm.
+        Decrypts the provided encrypted data using RSA with the configured
+        OAEP padding (SHA256 by default).
 
         Args:
             encrypted_data: The encrypted bytes to decrypt.
@@ -108,28 +338,21 @@ class RSAEncryption(EncryptionMixin):
 
         """
         if not isinstance(encrypted_data, bytes):
-            logger.error(f'Invalid encrypted_data type: {type(encrypted_data)}')
+            logger.error('Invalid encrypted_data type: %s', type(encrypted_data))
             raise TypeError('encrypted_data must be bytes')
         if len(encrypted_data) == 0:
             logger.error('Invalid encrypted_data value: %s', encrypted_data)
             raise ValueError('encrypted_data is empty')
 
         try:
-            decrypted_data = self._private_key.decrypt(
-                encrypted_data,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None,
-                ),
-            )
+            decrypted_data = self._private_key.decrypt(encrypted_data, self._encryption_padding)
             return decrypted_data
         except Exception as e:
             logger.error('Decryption failed: %s', e)
             raise DecryptionError('RSA decryption failed') from e
 
     def sign(self, data: bytes) -> bytes:
-        """Signs the data using the private key with PSS padding.
+        """Signs the SHA256 digest of the data using the private key with PSS padding.
 
         Args:
             data: The bytes to be signed.
@@ -144,21 +367,14 @@ class RSAEncryption(EncryptionMixin):
 
         """
         if not isinstance(data, bytes):
-            logger.error(f'Invalid data type for signing: {type(data)}')
+            logger.error('Invalid data type for signing: %s', type(data))
             raise TypeError('data must be bytes')
         if len(data) == 0:
             logger.error('Invalid data value for signing: empty')
             raise ValueError('data is empty')
 
         try:
-            return self._private_key.sign(
-                data,
-                padding.PSS(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
+            return self._private_key.sign(data, self._signature_padding, SHA256)
         except Exception as e:
             logger.exception('Signing failed: %s', e)
             raise RuntimeError('RSA signing failed') from e
@@ -182,7 +398,27 @@ class RSAEncryption(EncryptionMixin):
                 for encryption operations.
 
         """
-        return self._private_key.public_key()
+        return self._public_key
+
+    @property
+    def encryption_padding(self) -> padding.OAEP:
+        """Returns the OAEP padding profile used for encryption.
+
+        Returns:
+            padding.OAEP: The shared, immutable padding object.
+
+        """
+        return self._encryption_padding
+
+    @property
+    def signature_padding(self) -> padding.PSS:
+        """Returns the PSS padding profile used for signatures.
+
+        Returns:
+            padding.PSS: The shared, immutable padding object.
+
+        """
+        return self._signature_padding
 
     @property
     def private_key(self) -> RSAPrivateKey:
@@ -200,34 +436,54 @@ class RSAEncryption(EncryptionMixin):
         """Returns the public key in PEM format.
 
         Serializes the public key to PEM format with SubjectPublicKeyInfo
-        structure, suitable for transmission or storage.
+        structure, suitable for transmission or storage. The result is
+        computed once and reused.
 
         Returns:
             bytes: The public key in PEM-encoded bytes.
 
         """
-        return self._private_key.public_key().public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
+        if self._serialized_public_key is None:
+            self._serialized_public_key = self._public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        return self._serialized_public_key
+
+    @property
+    def der_public_key(self) -> bytes:
+        """Returns the public key in DER format.
+
+        DER is the binary form of the SubjectPublicKeyInfo structure, about
+        25% smaller than PEM. It is accepted by deserialize_public_key once
+        base64-encoded. The result is computed once and reused.
+
+        Returns:
+            bytes: The public key in DER-encoded bytes.
+
+        """
+        if self._der_public_key is None:
+            self._der_public_key = self._public_key.public_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        return self._der_public_key
 
     @property
     def base64_public_key(self) -> str:
         """Returns the public key in base64-encoded PEM format.
 
         Provides the public key as a base64-encoded string, which is convenient
-        for transmission over text-based protocols.
+        for transmission over text-based protocols. The result is computed once
+        and reused.
 
         Returns:
             str: The base64-encoded PEM representation of the public key.
 
         """
-        serialized_public_key = self._private_key.public_key().public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-
-        return base64.b64encode(serialized_public_key).decode()
+        if self._base64_public_key is None:
+            self._base64_public_key = base64.b64encode(self.serialized_public_key).decode()
+        return self._base64_public_key
 
 
 class RSAPublicEncryption(EncryptionMixin):
@@ -237,25 +493,47 @@ class RSAPublicEncryption(EncryptionMixin):
     It is intended for encrypting data that will be decrypted by the holder
     of the corresponding private key.
 
+    Thread safety: the public key never changes after initialization, so one
+    instance can be shared by any number of threads without locking.
+
     Attributes:
         key: The RSA public key used for encryption.
 
     """
 
-    def __init__(self, key: RSAPublicKey):
+    __slots__ = ('_encryption_padding', '_key', '_signature_padding')
+
+    def __init__(
+        self,
+        key: RSAPublicKey,
+        *,
+        encryption_padding: padding.OAEP = DEFAULT_ENCRYPTION_PADDING,
+        signature_padding: padding.PSS = DEFAULT_SIGNATURE_PADDING,
+    ):
         """Initialize RSAPublicEncryption with a public key.
 
         Args:
             key: An RSA public key object to use for encryption operations.
+            encryption_padding: The OAEP padding used to encrypt. Defaults to
+                OAEP with SHA256.
+            signature_padding: The PSS padding used to verify, with MGF1 and
+                SHA256. Defaults to PSS with SHA256 and maximum salt length;
+                PSS_AUTO_SHA256 accepts signatures made with any salt length.
 
         Raises:
-            TypeError: If the provided key is not an instance of RSAPublicKey.
+            TypeError: If the provided key is not an instance of RSAPublicKey,
+                or the paddings are not OAEP and PSS instances.
+            ValueError: If signature_padding does not use MGF1 with SHA256.
 
         """
         if not isinstance(key, RSAPublicKey):
             raise TypeError('key must be an instance of RSAPublicKey')
 
+        _check_paddings(encryption_padding, signature_padding)
+
         self._key = key
+        self._encryption_padding = encryption_padding
+        self._signature_padding = signature_padding
 
     def __repr__(self):
         """Return a string representation of the RSAPublicEncryption instance.
@@ -271,8 +549,8 @@ class RSAPublicEncryption(EncryptionMixin):
     def encrypt(self, data: bytes) -> bytes:
         """Encrypts data using the public key.
 
-        Encrypts the provided data using RSA with OAEP padding and SHA256
-        hashing algorithm for secure encryption.
+        Encrypts the provided data using RSA with the configured OAEP padding
+        (SHA256 by default) for secure encryption.
 
         Args:
             data: The bytes to encrypt.
@@ -286,17 +564,10 @@ class RSAPublicEncryption(EncryptionMixin):
 
         """
         if not isinstance(data, bytes):
-            logger.error(f'Invalid data type: {type(data)}')
+            logger.error('Invalid data type: %s', type(data))
             raise TypeError('data must be bytes')
         try:
-            return self._key.encrypt(
-                data,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None,
-                ),
-            )
+            return self._key.encrypt(data, self._encryption_padding)
         except Exception as e:
             logger.exception('Encryption failed: %s', e)
             raise EncryptionError('RSA encryption failed') from e
@@ -317,20 +588,33 @@ class RSAPublicEncryption(EncryptionMixin):
             raise TypeError('data and signature must be bytes')
 
         try:
-            self._key.verify(
-                signature,
-                data,
-                padding.PSS(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256(),
-            )
+            self._key.verify(signature, data, self._signature_padding, SHA256)
             # Se chegar aqui, a verificação foi bem-sucedida
             logger.debug('Signature verification successful')
 
         except Exception as e:
-            logger.error(f'An unexpected error occurred during verification: {e}')
-            raise Exception(f'Verification error: {e}') from e
+            logger.error('An unexpected error occurred during verification: %s', e)
+            raise SignatureVerificationError(f'Verification error: {e}') from e
+
+    @property
+    def encryption_padding(self) -> padding.OAEP:
+        """Returns the OAEP padding profile used for encryption.
+
+        Returns:
+            padding.OAEP: The shared, immutable padding object.
+
+        """
+        return self._encryption_padding
+
+    @property
+    def signature_padding(self) -> padding.PSS:
+        """Returns the PSS padding profile used for signatures.
+
+        Returns:
+            padding.PSS: The shared, immutable padding object.
+
+        """
+        return self._signature_padding
 
     @property
     def key(self) -> RSAPublicKey:
@@ -347,10 +631,11 @@ def deserialize_public_key(b64_key: str) -> PublicKeyTypes:
     """Deserializes a base64-encoded PEM string back to an RSA public key object.
 
     Decodes a base64-encoded PEM string and loads it as an RSA public key object
-    that can be used for encryption operations.
+    that can be used for encryption operations. The base64-encoded DER form
+    (see RSAEncryption.der_public_key) is accepted as well.
 
     Args:
-        b64_key (str): The base64-encoded PEM representation of the public key.
+        b64_key (str): The base64-encoded PEM or DER representation of the public key.
 
     Returns:
         PublicKeyTypes: The deserialized RSA public key object.
@@ -361,16 +646,23 @@ def deserialize_public_key(b64_key: str) -> PublicKeyTypes:
 
     """
     if not isinstance(b64_key, str):
-        logger.error(f'Invalid b64_key type: {type(b64_key)}')
+        logger.error('Invalid b64_key type: %s', type(b64_key))
         raise TypeError('b64_key must be a base64-encoded string')
     try:
         key_bytes = base64.b64decode(b64_key.encode('ascii'), validate=True)
     except (binascii.Error, ValueError) as e:
-        logger.error(f'Error occurred while decoding base64 key: {e}')
+        logger.error('Error occurred while decoding base64 key: %s', e)
         raise ValueError('Invalid base64 public key') from e
 
+    if not key_bytes.startswith(PEM_HEADER):
+        try:
+            return serialization.load_der_public_key(key_bytes)
+        except Exception as e:
+            logger.error('Error occurred while loading public key from DER: %s', e)
+            raise ValueError('Failed to load public key from DER') from e
+
     try:
         return serialization.load_pem_public_key(key_bytes)
     except Exception as e:
-        logger.error(f'Error occurred while loading public key from PEM: {e}')
+        logger.error('Error occurred while loading public key from PEM: %s', e)
         raise ValueError('Failed to load public key from PEM') from e
@@ -0,0 +1,484 @@
+"""Long-lived AES sessions with automatic key rotation.
+
+A session derives successive AES keys from a root secret with an HKDF
+ratchet: each step turns the current chain key into the next chain key and
+a message key, and the old chain key is discarded. Both peers start from the
+same root secret (for example the key agreed in an RSA or X25519 handshake)
+and rotate without another key exchange.
+
+Message keys encrypt with AES-256-GCM, and every payload is tagged with the
+ID of the key that encrypted it:
+
+    key ID (4 bytes, big-endian) + AEAD payload (header + nonce + ciphertext + tag)
+
+The key ID is authenticated as associated data. A receiver that sees a newer
+key ID ratchets forward to it only once the payload verifies, so forged
+frames cannot move the session, and a small window of previous keys is kept
+so messages still in flight decrypt. A key ID is accepted at most max_skip
+keys ahead, which bounds the HKDF steps a forged frame costs before it fails
+to verify.
+"""
+
+import base64
+import binascii
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from confy_addons.core.constants import (
+    AES_KEY_SIZE,
+    DEFAULT_SESSION_KEY_WINDOW,
+    DEFAULT_SESSION_MAX_AGE,
+    DEFAULT_SESSION_MAX_MESSAGES,
+    DEFAULT_SESSION_MAX_SKIP,
+    SESSION_KEY_ID_SIZE,
+)
+from confy_addons.core.exceptions import DecryptionError, EncryptionError
+from confy_addons.core.log import get_logger
+from confy_addons.core.mixins import EncryptionMixin
+from confy_addons.encryption.aead import AEAD_OVERHEAD, AEADEncryption
+from confy_addons.encryption.aes import AESEncryption, BytesLike, _byte_view
+
+logger = get_logger(__name__)
+
+HKDF_INFO = b'confy-addons aes-256 session ratchet'
+SESSION_MAX_KEY_ID = (1 << (SESSION_KEY_ID_SIZE * 8)) - 1
+
+
+def _ratchet(chain_key: bytes) -> tuple[bytes, bytes]:
+    """Derive the next chain key and a message key from a chain key.
+
+    Args:
+        chain_key: The current 32-byte chain key.
+
+    Returns:
+        tuple[bytes, bytes]: The next chain key and the message key.
+
+    """
+    output = HKDF(
+        algorithm=hashes.SHA256(), length=2 * AES_KEY_SIZE, salt=None, info=HKDF_INFO
+    ).derive(chain_key)
+    return output[:AES_KEY_SIZE], output[AES_KEY_SIZE:]
+
+
+def _derive(chain_key: bytes, steps: int) -> tuple[bytes, list[bytes]]:
+    """Ratchet a chain key forward without touching any session state.
+
+    Args:
+        chain_key: The chain key to start from.
+        steps: How many times to ratchet.
+
+    Returns:
+        tuple[bytes, list[bytes]]: The final chain key and the message key of
+            every step, oldest first.
+
+    """
+    message_keys = []
+    for _ in range(steps):
+        chain_key, message_key = _ratchet(chain_key)
+        message_keys.append(message_key)
+    return chain_key, message_keys
+
+
+class AESSession(EncryptionMixin):
+    """AES session handler rotating its key after N messages or T seconds.
+
+    Attributes:
+        key_id: The ID of the key currently used to encrypt.
+        max_messages: How many messages are encrypted before rotating.
+        max_age: How many seconds a key is used before rotating.
+        window: How many previous keys are kept for decryption.
+        max_skip: How many keys ahead of the current one a received key ID
+            may be.
+
+    """
+
+    def __init__(
+        self,
+        root_secret: bytes,
+        max_messages: Optional[int] = DEFAULT_SESSION_MAX_MESSAGES,
+        max_age: Optional[float] = DEFAULT_SESSION_MAX_AGE,
+        window: int = DEFAULT_SESSION_KEY_WINDOW,
+        max_skip: int = DEFAULT_SESSION_MAX_SKIP,
+    ):
+        """Initialize AESSession from a root secret shared by both peers.
+
+        Args:
+            root_secret: The secret both peers agreed on, at least 32 bytes.
+            max_messages: How many messages are encrypted with a key before
+                rotating. None disables rotation by message count.
+            max_age: How many seconds a key is used to encrypt before
+                rotating. None disables rotation by age.
+            window: How many previous keys are kept so messages encrypted
+                before a rotation still decrypt.
+            max_skip: How many keys ahead of the current one a received key ID
+                may be. Each skipped key costs one HKDF step before the frame
+                is authenticated, so keep it close to how many rotations a
+                peer can make between two messages received here.
+
+        Raises:
+            TypeError: If root_secret is not bytes or bytearray, or if a limit
+                has the wrong type.
+            ValueError: If root_secret is shorter than 32 bytes or a limit is
+                not positive.
+
+        """
+        if not isinstance(root_secret, (bytes, bytearray)):
+            logger.error('Invalid root_secret type: %s', type(root_secret))
+            raise TypeError('root_secret must be bytes or bytearray')
+        if len(root_secret) < AES_KEY_SIZE:
+            logger.error('Invalid root_secret length: %s', len(root_secret))
+            raise ValueError(f'root_secret must be at least {AES_KEY_SIZE} bytes long')
+        if max_messages is not None:
+            if not isinstance(max_messages, int):
+                logger.error('Invalid max_messages type: %s', type(max_messages))
+                raise TypeError('max_messages must be an integer or None')
+            if max_messages <= 0:
+                logger.error('Invalid max_messages value: %s', max_messages)
+                raise ValueError('max_messages must be a positive integer')
+        if max_age is not None:
+            if not isinstance(max_age, (int, float)):
+                logger.error('Invalid max_age type: %s', type(max_age))
+                raise TypeError('max_age must be a number or None')
+            if max_age <= 0:
+                logger.error('Invalid max_age value: %s', max_age)
+                raise ValueError('max_age must be positive')
+        if not isinstance(window, int):
+            logger.error('Invalid window type: %s', type(window))
+            raise TypeError('window must be an integer')
+        if window < 0:
+            logger.error('Invalid window value: %s', window)
+            raise ValueError('window must not be negative')
+        if not isinstance(max_skip, int):
+            logger.error('Invalid max_skip type: %s', type(max_skip))
+            raise TypeError('max_skip must be an integer')
+        if max_skip <= 0:
+            logger.error('Invalid max_skip value: %s', max_skip)
+            raise ValueError('max_skip must be a positive integer')
+
+        self._max_messages = max_messages
+        self._max_age = max_age
+        self._window = window
+        self._max_skip = max_skip
+        self._lock = threading.Lock()
+        self._keys: OrderedDict[int, AEADEncryption] = OrderedDict()
+
+        chain_key, message_key = _ratchet(bytes(root_secret))
+        self._chain_key = bytearray(chain_key)
+        self._wiped = False
+        self._key_id = 0
+        self._keys[0] = AEADEncryption(key=message_key)
+        self._messages = 0
+        self._rotated_at = time.monotonic()
+
+    def __repr__(self):
+        """Return a string representation of the AESSession instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                key ID, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(key=<hidden>, key_id={self._key_id}) '
+            f'object at {hex(id(self))}'
+        )
+
+    @classmethod
+    def from_aes(cls, aes: AESEncryption, **kwargs) -> 'AESSession':
+        """Create an AESSession rooted in the key of an AES handler.
+
+        Args:
+            aes: The AES handler obtained from a key exchange.
+            **kwargs: The rotation settings accepted by AESSession.
+
+        Returns:
+            AESSession: A session whose root secret is the handler's key.
+
+        Raises:
+            TypeError: If aes is not an instance of AESEncryption.
+
+        """
+        if not isinstance(aes, AESEncryption):
+            logger.error('Invalid aes type: %s', type(aes))
+            raise TypeError('aes must be an instance of AESEncryption')
+        return cls(aes.key, **kwargs)
+
+    def rotate(self) -> int:
+        """Ratchet to the next key immediately.
+
+        Returns:
+            int: The ID of the new key.
+
+        Raises:
+            RuntimeError: If all key IDs have been used.
+
+        """
+        with self._lock:
+            self._advance(self._key_id + 1)
+            return self._key_id
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypts text with the current session key.
+
+        Args:
+            plaintext: The text string to encrypt.
+
+        Returns:
+            str: The base64-encoded encrypted data (key ID + AEAD payload).
+
+        Raises:
+            TypeError: If the plaintext is not a string.
+            EncryptionError: If an error occurs during encryption.
+
+        """
+        if not isinstance(plaintext, str):
+            logger.error('Invalid plaintext type: %s', type(plaintext))
+            raise TypeError('plaintext must be a str')
+
+        payload = self.encrypt_bytes(plaintext.encode('utf-8'))
+        return base64.b64encode(payload).decode('ascii')
+
+    def decrypt(self, b64_ciphertext: str) -> str:
+        """Decrypts base64-encoded session encrypted data.
+
+        Args:
+            b64_ciphertext: The base64-encoded data produced by encrypt.
+
+        Returns:
+            str: The decrypted plaintext as a string.
+
+        Raises:
+            TypeError: If the b64_ciphertext is not a string.
+            ValueError: If the base64 data is invalid or too short.
+            IntegrityError: If the payload or its key ID was tampered with.
+            DecryptionError: If the session was wiped, the key ID is unknown or
+                expired, or an error occurs during decryption.
+
+        """
+        if not isinstance(b64_ciphertext, str):
+            logger.error('Invalid b64_ciphertext type: %s', type(b64_ciphertext))
+            raise TypeError('b64_ciphertext must be a base64-encoded str')
+
+        try:
+            data = base64.b64decode(b64_ciphertext)
+        except (binascii.Error, ValueError, TypeError) as e:
+            logger.error('Error occurred during base64 decoding: %s', e)
+            raise ValueError('Invalid base64 encrypted data') from e
+
+        try:
+            return self.decrypt_bytes(data).decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.error('Error occurred during decryption: %s', e)
+            raise DecryptionError('Decryption failed') from e
+
+    def encrypt_bytes(self, data: BytesLike) -> bytes:
+        """Encrypts raw bytes with the current session key.
+
+        Args:
+            data: The bytes-like object to encrypt.
+
+        Returns:
+            bytes: The encrypted data (key ID + AEAD payload).
+
+        Raises:
+            TypeError: If data is not a contiguous bytes-like object.
+            EncryptionError: If the session was wiped or an error occurs during
+                encryption.
+
+        """
+        view = _byte_view(data, 'data')
+
+        with self._lock:
+            if self._wiped:
+                logger.error('Encryption with a wiped session')
+                raise EncryptionError('Session was wiped')
+            if self._should_rotate():
+                self._advance(self._key_id + 1)
+            self._messages += 1
+            key_id, aead = self._key_id, self._keys[self._key_id]
+
+        header = key_id.to_bytes(SESSION_KEY_ID_SIZE, 'big')
+        return header + aead.encrypt_bytes(view, associated_data=header)
+
+    def decrypt_bytes(self, data: BytesLike) -> bytes:
+        """Decrypts raw session encrypted bytes.
+
+        A key ID newer than the current one ratchets the session forward once
+        the payload verifies, so this side also encrypts with the newer key
+        from then on. Frames that fail to verify leave the session unchanged.
+
+        Args:
+            data: The bytes-like object holding key ID + AEAD payload.
+
+        Returns:
+            bytes: The decrypted data.
+
+        Raises:
+            TypeError: If data is not a contiguous bytes-like object.
+            ValueError: If data is too short to contain a key ID and an AEAD
+                payload.
+            IntegrityError: If the payload or its key ID was tampered with.
+            DecryptionError: If the key ID is unknown or expired, or an error
+                occurs during decryption.
+
+        """
+        view = _byte_view(data, 'data')
+
+        if view.nbytes < SESSION_KEY_ID_SIZE + AEAD_OVERHEAD:
+            logger.error('Invalid encrypted data length: %s', view.nbytes)
+            raise ValueError('Encrypted data is too short to contain a key ID and an AEAD payload')
+
+        header = bytes(view[:SESSION_KEY_ID_SIZE])
+        key_id = int.from_bytes(header, 'big')
+
+        with self._lock:
+            if self._wiped:
+                logger.error('Decryption with a wiped session')
+                raise DecryptionError('Session was wiped')
+            base_id, chain_key = self._key_id, bytes(self._chain_key)
+            aead = self._keys.get(key_id)
+
+        if key_id <= base_id:
+            if aead is None:
+                logger.error('Expired session key ID: %s', key_id)
+                raise DecryptionError('Session key expired')
+            return aead.decrypt_bytes(view[SESSION_KEY_ID_SIZE:], associated_data=header)
+
+        if key_id - base_id > self._max_skip:
+            logger.error('Session key ID too far ahead: %s', key_id)
+            raise DecryptionError('Unknown session key')
+
+        # Derive the newer keys outside the lock and only adopt them once the
+        # payload, whose key ID is authenticated, verifies under the last one.
+        chain_key, message_keys = _derive(chain_key, key_id - base_id)
+        aead = AEADEncryption(key=message_keys[-1])
+        try:
+            plaintext = aead.decrypt_bytes(view[SESSION_KEY_ID_SIZE:], associated_data=header)
+        finally:
+            # _install keeps keys of its own, so this one is never reused.
+            aead.wipe()
+
+        with self._lock:
+            if not self._wiped:
+                if self._key_id == base_id:
+                    self._install(chain_key, message_keys)
+                elif self._key_id < key_id:
+                    self._advance(key_id)
+        return plaintext
+
+    def wipe(self):
+        """Overwrite the chain key and every window key with zeros.
+
+        Called when the session ends so its keys do not linger in memory.
+        Afterwards every encrypt and decrypt call fails.
+
+        """
+        with self._lock:
+            self._wiped = True
+            self._chain_key[:] = bytes(len(self._chain_key))
+            for aes in self._keys.values():
+                aes.wipe()
+            self._keys.clear()
+
+    def _should_rotate(self) -> bool:
+        """Return whether the current key reached its message or age limit."""
+        if self._max_messages is not None and self._messages >= self._max_messages:
+            return True
+        return self._max_age is not None and time.monotonic() - self._rotated_at >= self._max_age
+
+    def _advance(self, key_id: int):
+        """Ratchet forward to key_id, keeping the window of previous keys.
+
+        Must be called with the lock held.
+
+        Args:
+            key_id: The ID of the new current key, greater than the current one.
+
+        Raises:
+            RuntimeError: If key_id does not fit in the key ID field.
+
+        """
+        if key_id > SESSION_MAX_KEY_ID:
+            logger.error('Session key IDs exhausted')
+            raise RuntimeError('Session key IDs exhausted, perform a new key exchange')
+
+        self._install(*_derive(bytes(self._chain_key), key_id - self._key_id))
+
+    def _install(self, chain_key: bytes, message_keys: list[bytes]):
+        """Adopt derived keys as the newest ones, keeping the window.
+
+        Must be called with the lock held.
+
+        Args:
+            chain_key: The chain key following the last message key.
+            message_keys: The message keys following the current key, oldest
+                first.
+
+        """
+        self._chain_key[:] = chain_key
+        for message_key in message_keys:
+            self._key_id += 1
+            self._keys[self._key_id] = AEADEncryption(key=message_key)
+            while len(self._keys) > self._window + 1:
+                _, evicted = self._keys.popitem(last=False)
+                evicted.wipe()
+
+        self._messages = 0
+        self._rotated_at = time.monotonic()
+        logger.debug('Session key rotated to key ID %s', self._key_id)
+
+    @property
+    def key_id(self) -> int:
+        """Returns the ID of the key currently used to encrypt.
+
+        Returns:
+            int: The current key ID.
+
+        """
+        return self._key_id
+
+    @property
+    def max_messages(self) -> Optional[int]:
+        """Returns how many messages are encrypted before rotating.
+
+        Returns:
+            Optional[int]: The message limit, or None if disabled.
+
+        """
+        return self._max_messages
+
+    @property
+    def max_age(self) -> Optional[float]:
+        """Returns how many seconds a key is used before rotating.
+
+        Returns:
+            Optional[float]: The age limit, or None if disabled.
+
+        """
+        return self._max_age
+
+    @property
+    def window(self) -> int:
+        """Returns how many previous keys are kept for decryption.
+
+        Returns:
+            int: The number of previous keys.
+
+        """
+        return self._window
+
+    @property
+    def max_skip(self) -> int:
+        """Returns how many keys ahead of the current one a received key ID may be.
+
+        Returns:
+            int: The largest accepted distance between key IDs.
+
+        """
+        return self._max_skip
@@ -0,0 +1,559 @@
+"""Module provides opt-in metrics for encryption operations.
+
+While metrics are enabled, every encrypt, decrypt, sign, verify, key
+generation and public key deserialization is counted, its payload size is
+added up and its duration is recorded in a latency histogram, then passed to
+the configured sinks:
+
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+    ...
+    registry.snapshot()                  # in-memory statistics
+    PrometheusExporter(registry).render()  # Prometheus text format
+
+enable() installs timing wrappers on the instrumented methods and disable()
+puts the original methods back, so disabled metrics add no overhead at all.
+Functions imported by name before enable() was called, such as
+``from confy_addons import deserialize_public_key``, keep the original
+function and are not measured.
+
+This file is licensed under the GNU GPL-3.0 license.
+See the LICENSE file at the root of this repository for full details.
+"""
+
+import functools
+import importlib
+import inspect
+import sys
+import threading
+import time
+import types
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any, NamedTuple, Optional, Union
+
+from confy_addons.core.abstract import MetricsSinkABC
+from confy_addons.core.log import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MetricEvent(NamedTuple):
+    """A single instrumented operation.
+
+    Attributes:
+        operation: The operation name, such as 'aes.encrypt'.
+        size: The length of the input payload in bytes, UTF-8 encoded for text.
+        duration: How long the operation took, in seconds.
+        error: Whether the operation raised an exception.
+
+    """
+
+    operation: str
+    size: int
+    duration: float
+    error: bool
+
+
+class OperationMetrics(NamedTuple):
+    """Snapshot of the metrics of one operation.
+
+    Attributes:
+        calls: How many times the operation ran.
+        errors: How many of those runs raised an exception.
+        bytes: The total input payload length.
+        duration_sum: The total time spent, in seconds.
+        buckets: How many runs took at most each LATENCY_BUCKETS bound,
+            cumulative, followed by the total calls for +Inf.
+
+    """
+
+    calls: int
+    errors: int
+    bytes: int
+    duration_sum: float
+    buckets: tuple[int, ...]
+
+
+class MetricsRegistry(MetricsSinkABC):
+    """Thread-safe in-memory sink aggregating events per operation."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._operations: dict[str, list] = {}
+
+    def __repr__(self):
+        """Return a string representation of the MetricsRegistry instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                number of operations, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(operations={len(self._operations)}) '
+            f'object at {hex(id(self))}'
+        )
+
+    def record(self, event: MetricEvent) -> None:
+        """Add an event to the statistics of its operation.
+
+        Args:
+            event: The instrumented operation.
+
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, event.duration)
+
+        with self._lock:
+            stats = self._operations.get(event.operation)
+            if stats is None:
+                stats = [0, 0, 0, 0.0, [0] * (len(LATENCY_BUCKETS) + 1)]
+                self._operations[event.operation] = stats
+            stats[0] += 1
+            stats[1] += event.error
+            stats[2] += event.size
+            stats[3] += event.duration
+            stats[4][bucket] += 1
+
+    def snapshot(self) -> dict[str, OperationMetrics]:
+        """Return the current statistics of every operation.
+
+        Returns:
+            dict[str, OperationMetrics]: The statistics, by operation name.
+
+        """
+        with self._lock:
+            items = [
+                (operation, stats[:4], list(stats[4]))
+                for operation, stats in self._operations.items()
+            ]
+
+        snapshot = {}
+        for operation, (count, errors, size, duration_sum), counts in sorted(items):
+            cumulative, total = [], 0
+            for bucket_count in counts:
+                total += bucket_count
+                cumulative.append(total)
+            snapshot[operation] = OperationMetrics(
+                count, errors, size, duration_sum, tuple(cumulative)
+            )
+        return snapshot
+
+    def reset(self):
+        """Discard all statistics."""
+        with self._lock:
+            self._operations.clear()
+
+
+class PrometheusExporter:
+    """Renders a MetricsRegistry in the Prometheus text exposition format.
+
+    Attributes:
+        registry: The registry being exported.
+        namespace: The prefix of every metric name.
+
+    """
+
+    def __init__(self, registry: MetricsRegistry, namespace: str = 'confy_addons'):
+        """Initialize a PrometheusExporter.
+
+        Args:
+            registry: The registry to export.
+            namespace: The prefix of every metric name.
+
+        Raises:
+            TypeError: If registry is not a MetricsRegistry or namespace is not a string.
+
+        """
+        if not isinstance(registry, MetricsRegistry):
+            logger.error('Invalid registry type: %s', type(registry))
+            raise TypeError('registry must be an instance of MetricsRegistry')
+        if not isinstance(namespace, str):
+            logger.error('Invalid namespace type: %s', type(namespace))
+            raise TypeError('namespace must be a str')
+
+        self._registry = registry
+        self._namespace = namespace
+
+    def __repr__(self):
+        """Return a string representation of the PrometheusExporter instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                namespace, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(namespace={self._namespace!r}) '
+            f'object at {hex(id(self))}'
+        )
+
+    def render(self) -> str:
+        """Return the registry statistics in the Prometheus text format.
+
+        Returns:
+            str: The exposition text, ending with a newline.
+
+        """
+        snapshot = self._registry.snapshot()
+        prefix = self._namespace
+        bounds = [_format_bound(bound) for bound in LATENCY_BUCKETS] + ['+Inf']
+        lines: list[str] = []
+
+        for name, help_text, field in (
+            ('operations_total', 'Encryption operations performed.', 'calls'),
+            ('operation_errors_total', 'Encryption operations that raised.', 'errors'),
+            ('operation_bytes_total', 'Input payload length processed.', 'bytes'),
+        ):
+            lines.extend((
+                f'# HELP {prefix}_{name} {help_text}',
+                f'# TYPE {prefix}_{name} counter',
+            ))
+            lines.extend(
+                f'{prefix}_{name}{{operation="{operation}"}} {getattr(stats, field)}'
+                for operation, stats in snapshot.items()
+            )
+
+        histogram = f'{prefix}_operation_duration_seconds'
+        lines.extend((
+            f'# HELP {histogram} Duration of encryption operations.',
+            f'# TYPE {histogram} histogram',
+        ))
+        for operation, stats in snapshot.items():
+            lines.extend(
+                f'{histogram}_bucket{{operation="{operation}",le="{bound}"}} {count}'
+                for bound, count in zip(bounds, stats.buckets)
+            )
+            lines.extend((
+                f'{histogram}_sum{{operation="{operation}"}} {stats.duration_sum!r}',
+                f'{histogram}_count{{operation="{operation}"}} {stats.calls}',
+            ))
+
+        return '\n'.join(lines) + '\n'
+
+    @property
+    def registry(self) -> MetricsRegistry:
+        """Returns the registry being exported.
+
+        Returns:
+            MetricsRegistry: The exported registry.
+
+        """
+        return self._registry
+
+    @property
+    def namespace(self) -> str:
+        """Returns the prefix of every metric name.
+
+        Returns:
+            str: The namespace.
+
+        """
+        return self._namespace
+
+
+class CallbackSink(MetricsSinkABC):
+    """Sink passing every event to a callable."""
+
+    def __init__(self, callback: Callable[[MetricEvent], Any]):
+        """Initialize a CallbackSink.
+
+        Args:
+            callback: Called with each MetricEvent, on the thread that ran the
+                operation. It must be fast and must not raise.
+
+        Raises:
+            TypeError: If callback is not callable.
+
+        """
+        if not callable(callback):
+            logger.error('Invalid callback type: %s', type(callback))
+            raise TypeError('callback must be callable')
+
+        self._callback = callback
+
+    def __repr__(self):
+        """Return a string representation of the CallbackSink instance.
+
+        Returns:
+            str: A detailed string representation including module, class name,
+                callback, and memory address.
+
+        """
+        class_name = type(self).__name__
+        return (
+            f'{self.__module__}.{class_name}(callback={self._callback!r}) '
+            f'object at {hex(id(self))}'
+        )
+
+    def record(self, event: MetricEvent) -> None:
+        """Pass an event to the callback.
+
+        Args:
+            event: The instrumented operation.
+
+        """
+        self._callback(event)
+
+
+def _format_bound(bound: float) -> str:
+    return repr(bound) if bound < 1 else f'{bound:.1f}'
+
+
+# The operations instrumented by enable(), by module and class (None for
+# module functions): the attribute, the operation name and the argument whose
+# length is recorded (None to record no size). rsa.keygen times the calls that
+# actually generate a key pair: the constructor, pool refills and misses, and
+# AsyncRSAEncryption.create awaiting its executor. generate_private_keys,
+# behind RSAEncryption.generate_many, is timed as one batch.
+_TARGETS: dict[tuple[str, Optional[str]], tuple[tuple[str, str, Optional[str]], ...]] = {
+    ('confy_addons.encryption.aes', 'AESEncryption'): (
+        ('encrypt', 'aes.encrypt', 'plaintext'),
+        ('decrypt', 'aes.decrypt', 'b64_ciphertext'),
+        ('encrypt_many', 'aes.encrypt_many', 'plaintexts'),
+        ('decrypt_many', 'aes.decrypt_many', 'b64_ciphertexts'),
+        ('encrypt_bytes', 'aes.encrypt', 'data'),
+        ('decrypt_bytes', 'aes.decrypt', 'data'),
+        ('encrypt_into', 'aes.encrypt', 'data'),
+        ('decrypt_into', 'aes.decrypt', 'data'),
+    ),
+    ('confy_addons.encryption.aead', 'AEADEncryption'): (
+        ('encrypt_bytes', 'aead.encrypt', 'data'),
+        ('decrypt_bytes', 'aead.decrypt', 'data'),
+    ),
+    ('confy_addons.encryption.rsa', 'RSAEncryption'): (
+        ('__init__', 'rsa.keygen', None),
+        ('decrypt', 'rsa.decrypt', 'encrypted_data'),
+        ('sign', 'rsa.sign', 'data'),
+    ),
+    ('confy_addons.encryption.rsa', 'RSAPublicEncryption'): (
+        ('encrypt', 'rsa.encrypt', 'data'),
+        ('verify', 'rsa.verify', 'data'),
+    ),
+    ('confy_addons.encryption.rsa', None): (
+        ('deserialize_public_key', 'rsa.deserialize', 'b64_key'),
+    ),
+    ('confy_addons.encryption.pool', 'RSAKeyPool'): (('_generate', 'rsa.keygen', None),),
+    ('confy_addons.encryption.pool', None): (('generate_private_keys', 'rsa.keygen_many', None),),
+    ('confy_addons.encryption.aio', 'AsyncRSAEncryption'): (('create', 'rsa.keygen', None),),
+}
+
+_lock = threading.Lock()
+_sinks: list[MetricsSinkABC] = []
+_originals: dict[tuple[Any, str], Any] = {}
+
+
+def _payload_size(value: Any) -> int:
+    """Return the length in bytes of a payload, or the total of a batch."""
+    if isinstance(value, str):
+        # Text is measured as UTF-8; isascii() is constant time in CPython.
+        return len(value) if value.isascii() else len(value.encode('utf-8'))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, list):
+        return sum(_payload_size(item) for item in value if not isinstance(item, list))
+    return 0
+
+
+def _instrument(func: Callable, operation: str, position: int, name: Optional[str]):
+    """Return func wrapped to time it and send a MetricEvent to every sink.
+
+    Coroutine functions get a coroutine wrapper, so the time spent awaiting
+    them is measured.
+
+    Args:
+        func: The function or method to wrap.
+        operation: The operation name of the events.
+        position: The position of the measured argument in the call.
+        name: The name of the measured argument, or None to record no size.
+
+    Returns:
+        Callable: The wrapper.
+
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            args, size = _measure(args, kwargs, position, name)
+            error = True
+            start = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                _emit(MetricEvent(operation, size, time.perf_counter() - start, error))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        args, size = _measure(args, kwargs, position, name)
+        error = True
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            error = False
+            return result
+        finally:
+            _emit(MetricEvent(operation, size, time.perf_counter() - start, error))
+
+    return wrapper
+
+
+def _measure(args: tuple, kwargs: dict, position: int, name: Optional[str]) -> tuple[tuple, int]:
+    """Return the call arguments and the size in bytes of the measured argument."""
+    if name is None:
+        return args, 0
+    if position < len(args):
+        value = args[position]
+        if not isinstance(value, (str, bytes, bytearray, memoryview, list)):
+            # Batch methods accept any iterable; materialize it once so it can
+            # be measured and still be consumed by the wrapped function.
+            value = list(value)
+            args = (*args[:position], value, *args[position + 1 :])
+        return args, _payload_size(value)
+    if name in kwargs:
+        return args, _payload_size(kwargs[name])
+    return args, 0
+
+
+def _emit(event: MetricEvent):
+    """Pass an event to every sink."""
+    for sink in _sinks:
+        _send(sink, event)
+
+
+def _send(sink: MetricsSinkABC, event: MetricEvent):
+    """Pass an event to a sink; a failing sink must not fail the operation."""
+    try:
+        sink.record(event)
+    except Exception as e:
+        logger.error('Metrics sink %r failed: %s', sink, e)
+
+
+def enable(*sinks: MetricsSinkABC):
+    """Start sending metrics of every instrumented operation to the sinks.
+
+    Calling enable again replaces the sinks.
+
+    Args:
+        *sinks: The sinks receiving every MetricEvent, such as MetricsRegistry
+            or CallbackSink.
+
+    Raises:
+        TypeError: If any sink is not a MetricsSinkABC.
+        ValueError: If no sink is given.
+
+    """
+    if not sinks:
+        logger.error('No metrics sink given')
+        raise ValueError('at least one sink is required')
+    if not all(isinstance(sink, MetricsSinkABC) for sink in sinks):
+        logger.error('Invalid metrics sink type')
+        raise TypeError('sinks must be instances of MetricsSinkABC')
+
+    with _lock:
+        _sinks[:] = sinks
+        if _originals:
+            return
+
+        for (module_name, class_name), targets in _TARGETS.items():
+            module = importlib.import_module(module_name)
+            owner = getattr(module, class_name) if class_name else module
+            position = 1 if class_name else 0
+
+            for attribute, operation, argument in targets:
+                # Read class attributes without binding them, so that the
+                # classmethod descriptor itself is restored by disable().
+                original = vars(owner)[attribute] if class_name else getattr(owner, attribute)
+                wrapper: Union[Callable, classmethod]
+                if isinstance(original, classmethod):
+                    wrapper = classmethod(
+                        _instrument(original.__func__, operation, position, argument)
+                    )
+                else:
+                    wrapper = _instrument(original, operation, position, argument)
+                _originals[owner, attribute] = original
+                setattr(owner, attribute, wrapper)
+
+                if class_name is None:
+                    _rebind_reexports(module, attribute, original, wrapper)
+
+    logger.debug('Metrics enabled')
+
+
+def _rebind_reexports(
+    module, attribute: str, original: Callable, wrapper: Union[Callable, classmethod]
+):
+    """Point the package modules that re-export a function at its wrapper."""
+    for name, other in list(sys.modules.items()):
+        if (
+            name.startswith('confy_addons')
+            and other is not module
+            # vars() does not trigger the lazy __getattr__ of the packages.
+            and vars(other).get(attribute) is original
+        ):
+            _originals[other, attribute] = original
+            setattr(other, attribute, wrapper)
+
+
+def disable():
+    """Stop collecting metrics and restore the original methods."""
+    with _lock:
+        wrappers = {}
+        for (owner, attribute), original in _originals.items():
+            if isinstance(owner, types.ModuleType):
+                wrappers[attribute] = (getattr(owner, attribute), original)
+            setattr(owner, attribute, original)
+        _originals.clear()
+        _sinks.clear()
+
+        # Lazy packages resolving a function while metrics were enabled cached
+        # its wrapper; point them back at the original too.
+        for name, module in list(sys.modules.items()):
+            if not name.startswith('confy_addons'):
+                continue
+            for attribute, (wrapper, original) in wrappers.items():
+                if vars(module).get(attribute) is wrapper:
+                    setattr(module, attribute, original)
+
+    logger.debug('Metrics disabled')
+
+
+def is_enabled() -> bool:
+    """Return whether metrics are being collected.
+
+    Returns:
+        bool: True between enable() and disable().
+
+    """
+    return bool(_originals)
@@ -0,0 +1,189 @@
+"""Module defines the compact binary wire format for binary websocket frames.
+
+The text format sends every frame as a prefix followed by base64 text, which
+adds a third to each payload and costs an encode and a decode on every hop.
+Binary frames carry the same messages as raw bytes:
+
+    version (1 byte) + type tag (1 byte) + body
+
+The body of each message type is:
+
+    AES           IV + ciphertext, as returned by AESEncryption.encrypt_bytes
+    AES_KEY       the RSA wrapped AES key
+    KEY_EXCHANGE  the DER public key (RSA) or the raw 32-byte key (X25519)
+    SYSTEM,       the UTF-8 encoded text
+    SYSTEM_ERROR
+
+AEAD payloads already carry their nonce and tag, so they are sent as AES
+bodies unchanged. to_binary and to_text convert frames between both formats,
+so peers on either format can talk through a relay.
+
+This file is licensed under the GNU GPL-3.0 license.
+See the LICENSE file at the root of this repository for full details.
+"""
+
+import base64
+import binascii
+from typing import cast
+
+from cryptography.hazmat.primitives import serialization
+
+from confy_addons.codec import Message, MessageType, decode, encode
+from confy_addons.core.constants import WIRE_FORMAT_VERSION, X25519_PUBLIC_KEY_SIZE
+from confy_addons.core.log import get_logger
+from confy_addons.encryption.aes import BytesLike, _byte_view
+from confy_addons.encryption.rsa import PEM_HEADER
+
+logger = get_logger(__name__)
+
+WIRE_HEADER_SIZE = 2
+
+TYPE_TAGS: dict[MessageType, int] = {
+    MessageType.SYSTEM: 0x01,
+    MessageType.KEY_EXCHANGE: 0x02,
+    MessageType.AES_KEY: 0x03,
+    MessageType.AES: 0x04,
+    MessageType.SYSTEM_ERROR: 0x05,
+}
+_TAG_TYPES: dict[int, MessageType] = {tag: kind for kind, tag in TYPE_TAGS.items()}
+_TEXT_TYPES = frozenset((MessageType.SYSTEM, MessageType.SYSTEM_ERROR))
+
+
+def pack(kind: MessageType, body: BytesLike) -> bytes:
+    """Build a binary frame.
+
+    Args:
+        kind: The type of the message.
+        body: The raw message body.
+
+    Returns:
+        bytes: The binary frame (version + type tag + body).
+
+    Raises:
+        TypeError: If kind is not a MessageType or body is not a contiguous
+            bytes-like object.
+
+    """
+    if not isinstance(kind, MessageType):
+        logger.error('Invalid kind type: %s', type(kind))
+        raise TypeError('kind must be a MessageType')
+
+    return bytes((WIRE_FORMAT_VERSION, TYPE_TAGS[kind])) + _byte_view(body, 'body')
+
+
+def unpack(frame: BytesLike) -> Message:
+    """Split a binary frame into its type and body.
+
+    Args:
+        frame: The binary frame.
+
+    Returns:
+        Message: The type of the message and its raw body as bytes.
+
+    Raises:
+        TypeError: If frame is not a contiguous bytes-like object.
+        ValueError: If the frame is too short, has an unsupported version or
+            an unknown type tag.
+
+    """
+    view = _byte_view(frame, 'frame')
+
+    if view.nbytes < WIRE_HEADER_SIZE:
+        logger.error('Invalid binary frame length: %s', view.nbytes)
+        raise ValueError('Binary frame is too short to contain a version and a type tag')
+    if view[0] != WIRE_FORMAT_VERSION:
+        logger.error('Unsupported wire format version: %#04x', view[0])
+        raise ValueError('Unsupported wire format version')
+
+    kind = _TAG_TYPES.get(view[1])
+
+    if kind is None:
+        logger.error('Unknown wire format type tag: %#04x', view[1])
+        raise ValueError('Unknown wire format type tag')
+
+    return Message(kind, bytes(view[WIRE_HEADER_SIZE:]))
+
+
+def to_binary(frame: str) -> bytes:
+    """Convert a text frame to a binary frame.
+
+    Args:
+        frame: The prefixed text frame.
+
+    Returns:
+        bytes: The equivalent binary frame.
+
+    Raises:
+        TypeError: If frame is not a string.
+        ValueError: If the frame has no known prefix or its payload is not
+            valid base64 or a valid public key.
+
+    """
+    if not isinstance(frame, str):
+        logger.error('Invalid frame type: %s', type(frame))
+        raise TypeError('frame must be a str')
+
+    message = decode(frame)
+    payload = cast(str, message.payload)
+
+    if message.kind in _TEXT_TYPES:
+        return pack(message.kind, payload.encode('utf-8'))
+
+    try:
+        body = base64.b64decode(payload, validate=True)
+    except (binascii.Error, ValueError) as e:
+        logger.error('Error occurred during base64 decoding: %s', e)
+        raise ValueError('Invalid base64 payload') from e
+
+    if message.kind is MessageType.KEY_EXCHANGE and body.startswith(PEM_HEADER):
+        try:
+            body = serialization.load_pem_public_key(body).public_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        except Exception as e:
+            logger.error('Error occurred while loading public key from PEM: %s', e)
+            raise ValueError('Failed to load public key from PEM') from e
+
+    return pack(message.kind, body)
+
+
+def to_text(frame: BytesLike) -> str:
+    """Convert a binary frame to a text frame.
+
+    RSA public keys are converted back to base64-encoded PEM, as produced by
+    RSAEncryption.base64_public_key.
+
+    Args:
+        frame: The binary frame.
+
+    Returns:
+        str: The equivalent prefixed text frame.
+
+    Raises:
+        TypeError: If frame is not a contiguous bytes-like object.
+        ValueError: If the frame is malformed, a text body is not valid UTF-8
+            or a public key body cannot be loaded.
+
+    """
+    message = unpack(frame)
+    body = cast(bytes, message.payload)
+
+    if message.kind in _TEXT_TYPES:
+        try:
+            return cast(str, encode(message.kind, body.decode('utf-8')))
+        except UnicodeDecodeError as e:
+            logger.error('Error occurred while decoding text body: %s', e)
+            raise ValueError('Text body is not valid UTF-8') from e
+
+    if message.kind is MessageType.KEY_EXCHANGE and len(body) != X25519_PUBLIC_KEY_SIZE:
+        try:
+            body = serialization.load_der_public_key(body).public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        except Exception as e:
+            logger.error('Error occurred while loading public key from DER: %s', e)
+            raise ValueError('Failed to load public key from DER') from e
+
+    return cast(str, encode(message.kind, base64.b64encode(body).decode('ascii')))
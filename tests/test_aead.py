@@ -0,0 +1,201 @@
+import base64
+import os
+
+import pytest
+
+from confy_addons import AEADEncryption
+from confy_addons.core.constants import (
+    AEAD_AES_256_GCM,
+    AEAD_CHACHA20_POLY1305,
+    AEAD_NONCE_SIZE,
+    AEAD_TAG_SIZE,
+)
+from confy_addons.core.exceptions import DecryptionError, EncryptionError, IntegrityError
+
+ALGORITHMS = [AEAD_AES_256_GCM, AEAD_CHACHA20_POLY1305]
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_aead_encrypt_decrypt_cycle(algorithm):
+    aead = AEADEncryption(algorithm=algorithm)
+    original_data = 'Olá, 世界! 🌍 authenticated message'
+    assert aead.decrypt(aead.encrypt(original_data)) == original_data
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_aead_payload_starts_with_algorithm_header(algorithm):
+    aead = AEADEncryption(algorithm=algorithm)
+    payload = base64.b64decode(aead.encrypt('header'))
+    assert payload[0] == algorithm
+    assert len(payload) == 1 + AEAD_NONCE_SIZE + len('header') + AEAD_TAG_SIZE
+
+
+def test_aead_decrypts_any_supported_algorithm_with_same_key():
+    key = os.urandom(32)
+    gcm = AEADEncryption(key=key, algorithm=AEAD_AES_256_GCM)
+    chacha = AEADEncryption(key=key, algorithm=AEAD_CHACHA20_POLY1305)
+    assert gcm.decrypt(chacha.encrypt('from chacha')) == 'from chacha'
+    assert chacha.decrypt(gcm.encrypt('from gcm')) == 'from gcm'
+
+
+def test_aead_encrypt_empty_string():
+    aead = AEADEncryption()
+    assert not aead.decrypt(aead.encrypt(''))
+
+
+def test_aead_encrypt_different_cipher_texts():
+    aead = AEADEncryption()
+    assert aead.encrypt('same') != aead.encrypt('same')
+
+
+def test_aead_bytes_cycle_with_memoryview():
+    aead = AEADEncryption()
+    data = os.urandom(4096)
+    payload = aead.encrypt_bytes(memoryview(data))
+    assert aead.decrypt_bytes(bytearray(payload)) == data
+
+
+def test_aead_associated_data_is_authenticated():
+    aead = AEADEncryption()
+    encrypted = aead.encrypt('bound', associated_data=b'alice->bob')
+    assert aead.decrypt(encrypted, associated_data=b'alice->bob') == 'bound'
+    with pytest.raises(IntegrityError, match='Message authentication failed'):
+        aead.decrypt(encrypted, associated_data=b'mallory->bob')
+
+
+def test_aead_detects_tampered_ciphertext():
+    aead = AEADEncryption()
+    payload = bytearray(aead.encrypt_bytes(b'do not touch'))
+    payload[-1] ^= 0x01
+    with pytest.raises(IntegrityError, match='Message authentication failed'):
+        aead.decrypt_bytes(payload)
+
+
+def test_aead_detects_swapped_header():
+    key = os.urandom(32)
+    aead = AEADEncryption(key=key)
+    payload = bytearray(aead.encrypt_bytes(b'header is authenticated'))
+    payload[0] = AEAD_CHACHA20_POLY1305
+    with pytest.raises(IntegrityError):
+        aead.decrypt_bytes(payload)
+
+
+def test_aead_wrong_key_raises_integrity_error():
+    encrypted = AEADEncryption().encrypt('secret')
+    with pytest.raises(IntegrityError):
+        AEADEncryption().decrypt(encrypted)
+
+
+def test_aead_integrity_error_is_decryption_error():
+    assert issubclass(IntegrityError, DecryptionError)
+
+
+def test_aead_unsupported_header_raises():
+    aead = AEADEncryption()
+    payload = bytearray(aead.encrypt_bytes(b'data'))
+    payload[0] = 0xFF
+    with pytest.raises(ValueError, match='Unsupported AEAD payload version or algorithm'):
+        aead.decrypt_bytes(payload)
+
+
+def test_aead_data_too_short_raises():
+    aead = AEADEncryption()
+    with pytest.raises(ValueError, match='too short to contain a header, nonce and tag'):
+        aead.decrypt_bytes(b'\x01' * (AEAD_NONCE_SIZE + AEAD_TAG_SIZE))
+
+
+def test_aead_invalid_base64_raises():
+    aead = AEADEncryption()
+    with pytest.raises(ValueError, match='Invalid base64 encrypted data'):
+        aead.decrypt('not base64!')
+
+
+def test_aead_init_invalid_algorithm_raises():
+    with pytest.raises(ValueError, match='Unsupported AEAD algorithm'):
+        AEADEncryption(algorithm=0x7F)
+
+
+def test_aead_init_invalid_key_type_raises():
+    with pytest.raises(TypeError, match='AEAD key must be bytes or bytearray'):
+        AEADEncryption(key='not-bytes')
+
+
+def test_aead_init_invalid_key_length_raises():
+    with pytest.raises(ValueError, match='AEAD key must be 32 bytes'):
+        AEADEncryption(key=os.urandom(16))
+
+
+def test_aead_encrypt_invalid_plaintext_type_raises():
+    with pytest.raises(TypeError, match='plaintext must be a str'):
+        AEADEncryption().encrypt(b'not-a-str')
+
+
+def test_aead_decrypt_invalid_b64_type_raises():
+    with pytest.raises(TypeError, match='b64_ciphertext must be a base64-encoded str'):
+        AEADEncryption().decrypt(b'not-a-str')
+
+
+def test_aead_encrypt_bytes_invalid_type_raises():
+    with pytest.raises(TypeError, match='data must be a bytes-like object'):
+        AEADEncryption().encrypt_bytes('not-bytes')
+
+
+def test_aead_decrypt_bytes_invalid_type_raises():
+    with pytest.raises(TypeError, match='data must be a bytes-like object'):
+        AEADEncryption().decrypt_bytes('not-bytes')
+
+
+def test_aead_invalid_associated_data_type_raises():
+    with pytest.raises(TypeError, match='associated_data must be bytes'):
+        AEADEncryption().encrypt('text', associated_data='not-bytes')
+
+
+def test_aead_decrypt_invalid_utf8_raises_decryption_error():
+    aead = AEADEncryption()
+    encrypted = base64.b64encode(aead.encrypt_bytes(b'\xff\xfe')).decode('ascii')
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aead.decrypt(encrypted)
+
+
+def test_aead_encrypt_raises_encryption_error_on_cipher_failure():
+    aead = AEADEncryption()
+
+    class BadCipher:
+        @staticmethod
+        def encrypt(*args, **kwargs):
+            raise RuntimeError('cipher failure')
+
+    aead._ciphers[AEAD_AES_256_GCM] = BadCipher()
+
+    with pytest.raises(EncryptionError, match='Error occurred during encryption'):
+        aead.encrypt('test')
+
+
+def test_aead_decrypt_raises_decryption_error_on_cipher_failure():
+    aead = AEADEncryption()
+    payload = aead.encrypt_bytes(b'test')
+
+    class BadCipher:
+        @staticmethod
+        def decrypt(*args, **kwargs):
+            raise RuntimeError('cipher failure')
+
+    aead._ciphers[AEAD_AES_256_GCM] = BadCipher()
+
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aead.decrypt_bytes(payload)
+
+
+def test_repr_aead_encryption():
+    repr_str = repr(AEADEncryption())
+    assert 'AEADEncryption' in repr_str
+    assert 'key=<hidden>' in repr_str
+    assert 'algorithm=0x01' in repr_str
+
+
+def test_aead_properties():
+    key = os.urandom(32)
+    aead = AEADEncryption(key=key, algorithm=AEAD_CHACHA20_POLY1305)
+    assert aead.key == key
+    assert aead.key_size == 32
+    assert aead.algorithm == AEAD_CHACHA20_POLY1305
@@ -1,10 +1,11 @@
 import base64
 import binascii
+import io
 import os
 
 import pytest
 
-from confy_addons import AESEncryption
+from confy_addons import AESEncryption, ZlibCompression
 from confy_addons.core.constants import AES_IV_SIZE
 from confy_addons.core.exceptions import DecryptionError, EncryptionError
 
@@ -190,3 +191,380 @@ def test_aes_decrypt_raises_decryption_error_on_cipher_failure(monkeypatch):
 
     with pytest.raises(DecryptionError, match='Decryption failed'):
         aes.decrypt(b64)
+
+
+def test_aes_algorithm_is_built_once_per_instance(monkeypatch):
+    aes = AESEncryption()
+
+    def fail_on_rebuild(*args, **kwargs):
+        raise AssertionError('AES algorithm object rebuilt on the hot path')
+
+    monkeypatch.setattr('confy_addons.encryption.aes.algorithms.AES', fail_on_rebuild)
+
+    encrypted = aes.encrypt('cached algorithm')
+    assert aes.decrypt(encrypted) == 'cached algorithm'
+
+
+def test_aes_encrypt_many_decrypt_many_cycle():
+    aes = AESEncryption()
+    messages = ['first', '', 'Olá, 世界! 🌍', 'A' * 4096]
+    encrypted = aes.encrypt_many(messages)
+    assert len(encrypted) == len(messages)
+    assert aes.decrypt_many(encrypted) == messages
+
+
+def test_aes_encrypt_many_is_compatible_with_single_calls():
+    aes = AESEncryption()
+    messages = ['one', 'two', 'three']
+    assert [aes.decrypt(item) for item in aes.encrypt_many(messages)] == messages
+    assert aes.decrypt_many(aes.encrypt(item) for item in messages) == messages
+
+
+def test_aes_encrypt_many_uses_distinct_ivs():
+    aes = AESEncryption()
+    encrypted = aes.encrypt_many(['same message'] * 8)
+    ivs = {base64.b64decode(item)[:AES_IV_SIZE] for item in encrypted}
+    assert len(ivs) == 8
+
+
+def test_aes_encrypt_many_empty_batch():
+    aes = AESEncryption()
+    assert not aes.encrypt_many([])
+    assert not aes.decrypt_many([])
+
+
+def test_aes_encrypt_many_invalid_item_type_raises():
+    aes = AESEncryption()
+    with pytest.raises(TypeError, match='plaintexts must contain only str'):
+        aes.encrypt_many(['ok', b'not-a-str'])
+
+
+def test_aes_decrypt_many_invalid_item_type_raises():
+    aes = AESEncryption()
+    with pytest.raises(TypeError, match='b64_ciphertexts must contain only base64-encoded str'):
+        aes.decrypt_many([aes.encrypt('ok'), b'not-a-str'])
+
+
+def test_aes_decrypt_many_invalid_base64_raises():
+    aes = AESEncryption()
+    with pytest.raises(ValueError, match='Invalid base64 encrypted data'):
+        aes.decrypt_many([aes.encrypt('ok'), 'not base64!'])
+
+
+def test_aes_decrypt_many_data_too_short_raises():
+    aes = AESEncryption()
+    short = base64.b64encode(b'\x00' * (AES_IV_SIZE - 1)).decode('ascii')
+    with pytest.raises(ValueError, match='too short to contain an IV'):
+        aes.decrypt_many([short])
+
+
+def test_aes_decrypt_many_raises_decryption_error_on_cipher_failure(monkeypatch):
+    aes = AESEncryption()
+    payload = base64.b64encode(b'\x00' * AES_IV_SIZE + b'\x01').decode('ascii')
+
+    class DummyCipher:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        @staticmethod
+        def decryptor():
+            raise RuntimeError('decryptor failure')
+
+    monkeypatch.setattr('confy_addons.encryption.aes.Cipher', DummyCipher)
+
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aes.decrypt_many([payload])
+
+
+def test_aes_encrypt_many_raises_encryption_error_on_cipher_failure(monkeypatch):
+    aes = AESEncryption()
+
+    class DummyCipher:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        @staticmethod
+        def encryptor():
+            raise RuntimeError('encryptor failure')
+
+    monkeypatch.setattr('confy_addons.encryption.aes.Cipher', DummyCipher)
+
+    with pytest.raises(EncryptionError, match='Error occurred during encryption'):
+        aes.encrypt_many(['test'])
+
+
+@pytest.mark.parametrize('data', [b'', b'binary\x00payload', bytearray(os.urandom(4096))])
+def test_aes_encrypt_bytes_decrypt_bytes_cycle(data):
+    aes = AESEncryption()
+    encrypted = aes.encrypt_bytes(data)
+    assert isinstance(encrypted, bytes)
+    assert len(encrypted) == AES_IV_SIZE + len(data)
+    decrypted = aes.decrypt_bytes(encrypted)
+    assert type(decrypted) is bytes
+    assert decrypted == data
+
+
+def test_aes_encrypt_bytes_accepts_memoryview():
+    aes = AESEncryption()
+    data = os.urandom(1024)
+    encrypted = aes.encrypt_bytes(memoryview(data)[256:512])
+    assert aes.decrypt_bytes(memoryview(encrypted)) == data[256:512]
+
+
+def test_aes_encrypt_bytes_is_compatible_with_str_api():
+    aes = AESEncryption()
+    text = 'Olá, 世界! 🌍'
+    encrypted = aes.encrypt_bytes(text.encode('utf-8'))
+    assert aes.decrypt(base64.b64encode(encrypted).decode('ascii')) == text
+    assert aes.decrypt_bytes(base64.b64decode(aes.encrypt(text))) == text.encode('utf-8')
+
+
+def test_aes_encrypt_into_decrypt_into_cycle():
+    aes = AESEncryption()
+    data = os.urandom(2048)
+    encrypted = bytearray(AES_IV_SIZE + len(data) + 8)
+    written = aes.encrypt_into(data, encrypted)
+    assert written == AES_IV_SIZE + len(data)
+
+    decrypted = bytearray(len(data))
+    assert aes.decrypt_into(memoryview(encrypted)[:written], decrypted) == len(data)
+    assert decrypted == data
+
+
+def test_aes_encrypt_into_buffer_too_small_raises():
+    aes = AESEncryption()
+    with pytest.raises(ValueError, match='buffer must be at least 20 bytes long'):
+        aes.encrypt_into(b'data', bytearray(19))
+
+
+def test_aes_encrypt_into_read_only_buffer_raises():
+    aes = AESEncryption()
+    with pytest.raises(TypeError, match='buffer must be writable'):
+        aes.encrypt_into(b'data', bytes(32))
+
+
+def test_aes_decrypt_into_buffer_too_small_raises():
+    aes = AESEncryption()
+    encrypted = aes.encrypt_bytes(b'data')
+    with pytest.raises(ValueError, match='buffer must be at least 4 bytes long'):
+        aes.decrypt_into(encrypted, bytearray(3))
+
+
+def test_aes_decrypt_into_read_only_buffer_raises():
+    aes = AESEncryption()
+    encrypted = aes.encrypt_bytes(b'data')
+    with pytest.raises(TypeError, match='buffer must be writable'):
+        aes.decrypt_into(encrypted, memoryview(bytes(4)))
+
+
+def test_aes_encrypt_bytes_invalid_type_raises():
+    aes = AESEncryption()
+    with pytest.raises(TypeError, match='data must be a contiguous bytes-like object'):
+        aes.encrypt_bytes('not-bytes')
+
+
+def test_aes_decrypt_bytes_data_too_short_raises():
+    aes = AESEncryption()
+    with pytest.raises(ValueError, match='too short to contain an IV'):
+        aes.decrypt_bytes(b'\x00' * (AES_IV_SIZE - 1))
+
+
+def test_aes_encrypt_bytes_raises_encryption_error_on_cipher_failure(monkeypatch):
+    aes = AESEncryption()
+
+    class DummyCipher:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        @staticmethod
+        def encryptor():
+            raise RuntimeError('encryptor failure')
+
+    monkeypatch.setattr('confy_addons.encryption.aes.Cipher', DummyCipher)
+
+    with pytest.raises(EncryptionError, match='Error occurred during encryption'):
+        aes.encrypt_bytes(b'test')
+
+
+def test_aes_decrypt_bytes_raises_decryption_error_on_cipher_failure(monkeypatch):
+    aes = AESEncryption()
+
+    class DummyCipher:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        @staticmethod
+        def decryptor():
+            raise RuntimeError('decryptor failure')
+
+    monkeypatch.setattr('confy_addons.encryption.aes.Cipher', DummyCipher)
+
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aes.decrypt_bytes(b'\x00' * AES_IV_SIZE + b'\x01')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, AES_IV_SIZE, 4096])
+def test_aes_encrypt_stream_decrypt_stream_cycle(chunk_size):
+    aes = AESEncryption()
+    data = os.urandom(10_000)
+    encrypted, decrypted = io.BytesIO(), io.BytesIO()
+
+    written = aes.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=chunk_size)
+    assert written == AES_IV_SIZE + len(data)
+
+    encrypted.seek(0)
+    assert aes.decrypt_stream(encrypted, decrypted, chunk_size=chunk_size) == len(data)
+    assert decrypted.getvalue() == data
+
+
+def test_aes_stream_is_compatible_with_bytes_api():
+    aes = AESEncryption()
+    data = os.urandom(5000)
+    encrypted = io.BytesIO()
+    aes.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=1000)
+    assert aes.decrypt_bytes(encrypted.getvalue()) == data
+
+    decrypted = io.BytesIO()
+    aes.decrypt_stream(io.BytesIO(aes.encrypt_bytes(data)), decrypted)
+    assert decrypted.getvalue() == data
+
+
+def test_aes_stream_empty_payload():
+    aes = AESEncryption()
+    encrypted, decrypted = io.BytesIO(), io.BytesIO()
+    assert aes.encrypt_stream(io.BytesIO(), encrypted) == AES_IV_SIZE
+    encrypted.seek(0)
+    assert aes.decrypt_stream(encrypted, decrypted) == 0
+    assert not decrypted.getvalue()
+
+
+def test_aes_encryptor_emits_iv_first():
+    aes = AESEncryption()
+    encryptor = aes.encryptor()
+    first = encryptor.update(b'abc')
+    second = encryptor.update(b'def')
+    assert len(first) == AES_IV_SIZE + 3
+    assert len(second) == 3
+    assert aes.decrypt_bytes(first + second + encryptor.finalize()) == b'abcdef'
+
+
+def test_aes_encryptor_finalize_without_update_emits_iv():
+    aes = AESEncryption()
+    assert len(aes.encryptor().finalize()) == AES_IV_SIZE
+
+
+def test_aes_decryptor_splits_iv_across_chunks():
+    aes = AESEncryption()
+    encrypted = aes.encrypt_bytes(b'split payload')
+    decryptor = aes.decryptor()
+    assert not decryptor.update(encrypted[:5])
+    plaintext = decryptor.update(encrypted[5:20]) + decryptor.update(encrypted[20:])
+    assert plaintext + decryptor.finalize() == b'split payload'
+
+
+def test_aes_decrypt_stream_too_short_raises():
+    aes = AESEncryption()
+    with pytest.raises(ValueError, match='too short to contain an IV'):
+        aes.decrypt_stream(io.BytesIO(b'\x00' * (AES_IV_SIZE - 1)), io.BytesIO())
+
+
+def test_aes_encrypt_stream_invalid_chunk_size_type_raises():
+    aes = AESEncryption()
+    with pytest.raises(TypeError, match='chunk_size must be an integer'):
+        aes.encrypt_stream(io.BytesIO(b'data'), io.BytesIO(), chunk_size='1024')
+
+
+def test_aes_encrypt_stream_non_positive_chunk_size_raises():
+    aes = AESEncryption()
+    with pytest.raises(ValueError, match='chunk_size must be a positive integer'):
+        aes.encrypt_stream(io.BytesIO(b'data'), io.BytesIO(), chunk_size=0)
+
+
+def test_aes_encryptor_raises_encryption_error_on_cipher_failure():
+    encryptor = AESEncryption().encryptor()
+    with pytest.raises(EncryptionError, match='Error occurred during encryption'):
+        encryptor.update('not-bytes')
+
+
+def test_aes_decryptor_raises_decryption_error_on_cipher_failure(monkeypatch):
+    aes = AESEncryption()
+
+    class DummyCipher:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        @staticmethod
+        def decryptor():
+            raise RuntimeError('decryptor failure')
+
+    monkeypatch.setattr('confy_addons.encryption.aes.Cipher', DummyCipher)
+
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aes.decryptor().update(b'\x00' * (AES_IV_SIZE + 1))
+
+
+def test_aes_compression_round_trip_shrinks_large_payloads():
+    key = os.urandom(32)
+    plaintext = 'chat history line\n' * 200
+    compressed = AESEncryption(key=key, compression=ZlibCompression())
+    plain = AESEncryption(key=key)
+
+    ciphertext = compressed.encrypt(plaintext)
+    assert len(ciphertext) < len(plain.encrypt(plaintext)) // 4
+    assert compressed.decrypt(ciphertext) == plaintext
+
+
+def test_aes_compression_skips_small_and_incompressible_payloads():
+    class ExpandingCompression(ZlibCompression):
+        def compress(self, data):
+            return super().compress(data) + b'padding' * 100
+
+    cases = [(ZlibCompression(), 'a' * 63), (ExpandingCompression(), 'a' * 500)]
+    for codec, plaintext in cases:
+        aes = AESEncryption(compression=codec, compression_threshold=64)
+        data = base64.b64decode(aes.encrypt(plaintext))
+        assert len(data) == AES_IV_SIZE + 1 + len(plaintext)
+        assert aes.decrypt(aes.encrypt(plaintext)) == plaintext
+
+
+def test_aes_compression_batches_round_trip():
+    aes = AESEncryption(compression=ZlibCompression(), compression_threshold=0)
+    messages = ['', 'short', 'x' * 1000]
+    assert aes.decrypt_many(aes.encrypt_many(messages)) == messages
+    assert [aes.decrypt(item) for item in aes.encrypt_many(messages)] == messages
+
+
+def test_aes_compression_requires_matching_peer():
+    key = os.urandom(32)
+    compressed = AESEncryption(key=key, compression=ZlibCompression())
+    plain = AESEncryption(key=key)
+    assert plain.decrypt(compressed.encrypt('hello')) != 'hello'
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        compressed.decrypt(plain.encrypt('hello'))
+
+
+def test_aes_compression_rejects_tampered_payload():
+    aes = AESEncryption(compression=ZlibCompression(), compression_threshold=0)
+    data = bytearray(base64.b64decode(aes.encrypt('x' * 500)))
+    data[AES_IV_SIZE + 5] ^= 0xFF
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aes.decrypt(base64.b64encode(data).decode())
+    with pytest.raises(DecryptionError, match='Decryption failed'):
+        aes.decrypt(base64.b64encode(os.urandom(AES_IV_SIZE)).decode())
+
+
+def test_aes_compression_invalid_arguments_raise():
+    with pytest.raises(TypeError, match='compression must be an instance of CompressionCodecABC'):
+        AESEncryption(compression='zlib')
+    with pytest.raises(TypeError, match='compression_threshold must be an integer'):
+        AESEncryption(compression_threshold=1.5)
+    with pytest.raises(ValueError, match='compression_threshold must not be negative'):
+        AESEncryption(compression_threshold=-1)
+
+
+def test_aes_compression_properties():
+    codec = ZlibCompression()
+    aes = AESEncryption(compression=codec, compression_threshold=10)
+    assert aes.compression is codec
+    assert aes.compression_threshold == 10
+    assert AESEncryption().compression is None
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+from confy_addons import (
+    AESEncryption,
+    AsyncAESEncryption,
+    AsyncRSAEncryption,
+    AsyncRSAPublicEncryption,
+    RSAEncryption,
+    RSAPublicEncryption,
+)
+from confy_addons.core.constants import DEFAULT_RSA_KEY_SIZE
+from confy_addons.core.exceptions import DecryptionError, SignatureVerificationError
+from confy_addons.encryption import aio
+
+
+@pytest.fixture(scope='module')
+def rsa():
+    return RSAEncryption()
+
+
+def test_async_rsa_create_generates_key_pair():
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await AsyncRSAEncryption.create(keygen_executor=executor)
+
+    handler = asyncio.run(run())
+    assert isinstance(handler.rsa, RSAEncryption)
+    assert handler.rsa.key_size == DEFAULT_RSA_KEY_SIZE
+    assert handler.public_key is handler.rsa.public_key
+    assert handler.base64_public_key == handler.rsa.base64_public_key
+
+
+def test_async_rsa_create_generates_keys_off_the_event_loop(rsa, monkeypatch):
+    der = rsa.private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    threads = []
+
+    def generate(key_size):
+        threads.append(threading.current_thread().name)
+        return der
+
+    monkeypatch.setattr(aio, 'generate_private_key_der', generate)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='keygen') as executor:
+            return await AsyncRSAEncryption.create(keygen_executor=executor)
+
+    handler = asyncio.run(run())
+    assert len(threads) == 1
+    assert threads[0].startswith('keygen')
+    assert handler.public_key.public_numbers() == rsa.public_key.public_numbers()
+
+
+def test_async_rsa_create_rejects_invalid_key_size():
+    with pytest.raises(TypeError, match='key_size must be an integer'):
+        asyncio.run(AsyncRSAEncryption.create(key_size='4096'))  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='key_size must be at least'):
+        asyncio.run(AsyncRSAEncryption.create(key_size=2048))
+
+
+def test_async_rsa_create_wraps_generation_failure(monkeypatch):
+    def fail(key_size):
+        raise OSError('boom')
+
+    monkeypatch.setattr(aio, 'generate_private_key_der', fail)
+
+    with pytest.raises(RuntimeError, match='Failed to generate RSA key pair'):
+        asyncio.run(AsyncRSAEncryption.create())
+
+
+def test_async_rsa_rejects_invalid_arguments(rsa):
+    with pytest.raises(TypeError, match='rsa must be an instance of RSAEncryption'):
+        AsyncRSAEncryption(object())  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='executor must be an instance'):
+        AsyncRSAEncryption(rsa, executor=object())  # type: ignore[arg-type]
+
+
+def test_async_rsa_round_trip(rsa):
+    async def run():
+        private = AsyncRSAEncryption(rsa)
+        public = AsyncRSAPublicEncryption(RSAPublicEncryption(rsa.public_key))
+        ciphertext = await public.encrypt(b'hello')
+        signature = await private.sign(b'hello')
+        await public.verify(b'hello', signature)
+        return await private.decrypt(ciphertext)
+
+    assert asyncio.run(run()) == b'hello'
+
+
+def test_async_rsa_propagates_errors(rsa):
+    async def run():
+        private = AsyncRSAEncryption(rsa)
+        public = AsyncRSAPublicEncryption(RSAPublicEncryption(rsa.public_key))
+        with pytest.raises(DecryptionError):
+            await private.decrypt(b'\x00' * 512)
+        with pytest.raises(SignatureVerificationError):
+            await public.verify(b'hello', b'\x00' * 512)
+        with pytest.raises(TypeError):
+            await private.sign('hello')  # type: ignore[arg-type]
+
+    asyncio.run(run())
+
+
+def test_async_rsa_public_rejects_invalid_rsa():
+    with pytest.raises(TypeError, match='rsa must be an instance of RSAPublicEncryption'):
+        AsyncRSAPublicEncryption(object())  # type: ignore[arg-type]
+
+
+def test_async_aes_batches_round_trip():
+    aes = AESEncryption()
+    handler = AsyncAESEncryption(aes)
+    messages = ['a', 'bb', 'ccc']
+
+    async def run():
+        return await handler.decrypt_many(await handler.encrypt_many(messages))
+
+    assert asyncio.run(run()) == messages
+    assert handler.aes is aes
+
+
+def test_async_aes_uses_given_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        handler = AsyncAESEncryption(executor=executor)
+        ciphertexts = asyncio.run(handler.encrypt_many(['x']))
+    assert handler.aes.decrypt_many(ciphertexts) == ['x']
+
+
+def test_async_aes_rejects_invalid_aes():
+    with pytest.raises(TypeError, match='aes must be an instance of AESEncryption'):
+        AsyncAESEncryption(object())  # type: ignore[arg-type]
+
+
+def test_async_repr_hides_keys(rsa):
+    assert 'key=<hidden>' in repr(AsyncAESEncryption())
+    assert f'key_size={rsa.key_size}' in repr(AsyncRSAEncryption(rsa))
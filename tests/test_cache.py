@@ -0,0 +1,118 @@
+import base64
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from confy_addons import PublicKeyCache, RSAEncryption, RSAPublicEncryption
+
+
+@pytest.fixture(scope='module')
+def rsa_keys():
+    return [RSAEncryption() for _ in range(3)]
+
+
+def test_cache_returns_same_key_object_on_hit(rsa_keys):
+    cache = PublicKeyCache()
+    b64_key = rsa_keys[0].base64_public_key
+    first = cache.deserialize(b64_key)
+    second = cache.deserialize(b64_key)
+    assert first is second
+    assert first.public_numbers() == rsa_keys[0].public_key.public_numbers()
+    assert cache.stats() == (1, 1, 0, 1, cache.max_size)
+
+
+def test_cache_evicts_least_recently_used(rsa_keys):
+    cache = PublicKeyCache(max_size=2)
+    keys = [rsa.base64_public_key for rsa in rsa_keys]
+    cache.deserialize(keys[0])
+    cache.deserialize(keys[1])
+    cache.deserialize(keys[0])
+    cache.deserialize(keys[2])
+
+    assert len(cache) == 2
+    assert cache.stats().evictions == 1
+    cache.deserialize(keys[0])
+    assert cache.stats().hits == 2
+    cache.deserialize(keys[1])
+    assert cache.stats().misses == 4
+
+
+def test_cache_entries_expire_after_ttl(rsa_keys, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('confy_addons.encryption.cache.time.monotonic', lambda: now[0])
+
+    cache = PublicKeyCache(ttl=30)
+    b64_key = rsa_keys[0].base64_public_key
+    first = cache.deserialize(b64_key)
+
+    now[0] += 29
+    assert cache.deserialize(b64_key) is first
+
+    now[0] += 2
+    assert cache.deserialize(b64_key) is not first
+    assert cache.stats() == (1, 2, 1, 1, cache.max_size)
+
+
+def test_cache_public_encryption_wrapper_is_shared(rsa_keys):
+    cache = PublicKeyCache()
+    b64_key = rsa_keys[0].base64_public_key
+    wrapper = cache.public_encryption(b64_key)
+    assert isinstance(wrapper, RSAPublicEncryption)
+    assert cache.public_encryption(b64_key) is wrapper
+    assert rsa_keys[0].decrypt(wrapper.encrypt(b'cached')) == b'cached'
+
+
+def test_cache_public_encryption_rejects_non_rsa_key():
+    ec_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+    pem = ec_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    cache = PublicKeyCache()
+    with pytest.raises(TypeError, match='key must be an instance of RSAPublicKey'):
+        cache.public_encryption(base64.b64encode(pem).decode())
+
+
+def test_cache_invalidate_and_clear(rsa_keys):
+    cache = PublicKeyCache()
+    keys = [rsa.base64_public_key for rsa in rsa_keys[:2]]
+    for b64_key in keys:
+        cache.deserialize(b64_key)
+
+    cache.invalidate(keys[0])
+    cache.invalidate('not-cached')
+    assert len(cache) == 1
+
+    cache.clear()
+    assert not len(cache)
+    assert cache.stats().misses == 2
+
+
+def test_cache_does_not_store_invalid_keys():
+    cache = PublicKeyCache()
+    with pytest.raises(ValueError, match='Invalid base64 public key'):
+        cache.deserialize('not base64!')
+    with pytest.raises(TypeError, match='b64_key must be a base64-encoded string'):
+        cache.deserialize(b'not-a-string')
+    assert not len(cache)
+
+
+def test_cache_rejects_invalid_arguments():
+    with pytest.raises(TypeError, match='max_size must be an integer'):
+        PublicKeyCache(max_size='10')
+    with pytest.raises(ValueError, match='max_size must be a positive integer'):
+        PublicKeyCache(max_size=0)
+    with pytest.raises(TypeError, match='ttl must be a number of seconds'):
+        PublicKeyCache(ttl='10')
+    with pytest.raises(ValueError, match='ttl must be positive'):
+        PublicKeyCache(ttl=0)
+
+
+def test_repr_public_key_cache():
+    cache = PublicKeyCache(max_size=8, ttl=60)
+    assert cache.ttl == 60
+    repr_str = repr(cache)
+    assert 'PublicKeyCache' in repr_str
+    assert 'max_size=8' in repr_str
+    assert 'ttl=60' in repr_str
@@ -0,0 +1,79 @@
+import pytest
+
+from confy_addons.codec import Message, MessageType, classify, decode, encode
+from confy_addons.prefixes import (
+    AES_KEY_PREFIX,
+    AES_PREFIX,
+    KEY_EXCHANGE_PREFIX,
+    SYSTEM_ERROR_PREFIX,
+    SYSTEM_PREFIX,
+)
+
+
+@pytest.mark.parametrize(
+    ('prefix', 'kind'),
+    [
+        (SYSTEM_PREFIX, MessageType.SYSTEM),
+        (KEY_EXCHANGE_PREFIX, MessageType.KEY_EXCHANGE),
+        (AES_KEY_PREFIX, MessageType.AES_KEY),
+        (AES_PREFIX, MessageType.AES),
+        (SYSTEM_ERROR_PREFIX, MessageType.SYSTEM_ERROR),
+    ],
+)
+def test_decode_every_prefix(prefix, kind):
+    assert decode(f'{prefix}payload') == Message(kind, 'payload')
+    assert decode(f'{prefix}payload'.encode()) == Message(kind, b'payload')
+    assert classify(prefix) is kind
+
+
+def test_decode_keeps_the_frame_type():
+    assert type(decode('enc:abc').payload) is str
+    assert type(decode(b'enc:abc').payload) is bytes
+    assert type(decode(bytearray(b'enc:abc')).payload) is bytearray
+
+
+def test_decode_keeps_colons_in_the_payload():
+    assert decode('system-message:a:b:c').payload == 'a:b:c'
+    assert not decode('enc:').payload
+
+
+def test_decode_rejects_unknown_prefixes():
+    for frame in ('hello', 'unknown:payload', 'enc', ':enc:x', 'x' * 100 + 'enc:'):
+        assert classify(frame) is None
+        with pytest.raises(ValueError, match='Unknown message prefix'):
+            decode(frame)
+    with pytest.raises(ValueError, match='Unknown message prefix'):
+        decode(b'ENC:abc')
+
+
+def test_codec_rejects_invalid_types():
+    with pytest.raises(TypeError, match='frame must be str, bytes or bytearray'):
+        decode(memoryview(b'enc:abc'))  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='frame must be str, bytes or bytearray'):
+        classify(None)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='kind must be a MessageType'):
+        encode('enc:', 'abc')  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='payload must be str, bytes or bytearray'):
+        encode(MessageType.AES, 123)  # type: ignore[arg-type]
+
+
+def test_encode_round_trip():
+    assert encode(MessageType.AES, 'abc') == f'{AES_PREFIX}abc'
+    assert encode(MessageType.AES_KEY, b'abc') == f'{AES_KEY_PREFIX}abc'.encode()
+    for frame in ('key-exchange:xyz', b'system-error:boom'):
+        assert decode(frame).encode() == frame
+
+
+def test_message_uses_slots():
+    message = Message(MessageType.SYSTEM, 'hi')
+    assert not hasattr(message, '__dict__')
+    with pytest.raises(AttributeError):
+        message.extra = 1  # type: ignore[attr-defined]
+
+
+def test_message_equality_and_repr():
+    message = Message(MessageType.AES, 'abc')
+    assert message != Message(MessageType.AES, b'abc')
+    assert message != Message(MessageType.SYSTEM, 'abc')
+    assert message != 'enc:abc'
+    assert "kind=MessageType.AES, payload='abc'" in repr(message)
@@ -0,0 +1,54 @@
+import zlib
+
+import pytest
+
+from confy_addons import ZlibCompression
+from confy_addons.core.abstract import CompressionCodecABC
+from confy_addons.core.constants import DEFAULT_ZLIB_LEVEL
+
+
+def test_zlib_compression_round_trip():
+    codec = ZlibCompression()
+    data = b'system payload ' * 100
+    compressed = codec.compress(data)
+    assert len(compressed) < len(data)
+    assert codec.decompress(compressed) == data
+    assert isinstance(codec, CompressionCodecABC)
+
+
+def test_zlib_compression_level_is_used():
+    data = bytes(range(256)) * 64
+    assert ZlibCompression(level=0).compress(data) == zlib.compress(data, 0)
+    assert ZlibCompression(level=9).compress(data) == zlib.compress(data, 9)
+
+
+def test_zlib_decompression_is_bounded():
+    codec = ZlibCompression(max_size=1024)
+    assert codec.decompress(zlib.compress(b'a' * 1024)) == b'a' * 1024
+    with pytest.raises(ValueError, match='Decompressed data exceeds 1024 bytes'):
+        codec.decompress(zlib.compress(b'a' * 1025))
+
+
+def test_zlib_decompression_rejects_invalid_data():
+    codec = ZlibCompression()
+    with pytest.raises(ValueError, match='Invalid compressed data'):
+        codec.decompress(b'not zlib data')
+    with pytest.raises(ValueError, match='Invalid compressed data'):
+        codec.decompress(zlib.compress(b'a' * 1000)[:-4])
+
+
+def test_zlib_compression_invalid_arguments_raise():
+    with pytest.raises(TypeError, match='level must be an integer'):
+        ZlibCompression(level='6')
+    with pytest.raises(ValueError, match='level must be between 0 and 9'):
+        ZlibCompression(level=10)
+    with pytest.raises(TypeError, match='max_size must be an integer'):
+        ZlibCompression(max_size=None)
+    with pytest.raises(ValueError, match='max_size must be a positive integer'):
+        ZlibCompression(max_size=0)
+
+
+def test_zlib_compression_properties_and_repr():
+    codec = ZlibCompression()
+    assert codec.level == DEFAULT_ZLIB_LEVEL
+    assert f'level={DEFAULT_ZLIB_LEVEL}' in repr(codec)
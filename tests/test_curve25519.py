@@ -0,0 +1,96 @@
+import base64
+
+import pytest
+
+from confy_addons import Ed25519Signer, Ed25519Verifier, X25519KeyExchange
+from confy_addons.core.exceptions import SignatureVerificationError
+from confy_addons.prefixes import KEY_EXCHANGE_PREFIX
+
+
+def test_x25519_both_sides_derive_the_same_aes_key():
+    alice, bob = X25519KeyExchange(), X25519KeyExchange()
+    alice_aes = alice.derive_aes(bob.base64_public_key)
+    bob_aes = bob.derive_aes(alice.base64_public_key)
+    assert alice_aes.key == bob_aes.key
+    assert bob_aes.decrypt(alice_aes.encrypt('hello bob')) == 'hello bob'
+
+
+def test_x25519_key_exchange_message_flow():
+    alice, bob = X25519KeyExchange(), X25519KeyExchange()
+    message = alice.key_exchange_message()
+    assert message.startswith(KEY_EXCHANGE_PREFIX)
+    assert bob.derive_aes(message).key == alice.derive_aes(bob.key_exchange_message()).key
+
+
+def test_x25519_salt_changes_derived_key():
+    alice, bob = X25519KeyExchange(), X25519KeyExchange()
+    assert alice.derive_aes(bob.base64_public_key, salt=b'session-1').key != (
+        alice.derive_aes(bob.base64_public_key, salt=b'session-2').key
+    )
+
+
+def test_x25519_different_peers_derive_different_keys():
+    alice, bob, carol = X25519KeyExchange(), X25519KeyExchange(), X25519KeyExchange()
+    assert alice.derive_aes(bob.base64_public_key).key != (
+        alice.derive_aes(carol.base64_public_key).key
+    )
+
+
+def test_x25519_public_key_format():
+    exchange = X25519KeyExchange()
+    assert len(exchange.public_key) == 32
+    assert base64.b64decode(exchange.base64_public_key) == exchange.public_key
+
+
+def test_x25519_rejects_invalid_peer_keys():
+    exchange = X25519KeyExchange()
+    with pytest.raises(TypeError, match='peer_public_key must be a base64-encoded string'):
+        exchange.derive_aes(b'not-a-string')
+    with pytest.raises(ValueError, match='Invalid base64 public key'):
+        exchange.derive_aes('not base64!')
+    with pytest.raises(ValueError, match='public key must be 32 bytes long'):
+        exchange.derive_aes(base64.b64encode(b'short').decode())
+    with pytest.raises(ValueError, match='Invalid peer public key'):
+        exchange.derive_aes(base64.b64encode(bytes(32)).decode())
+
+
+def test_ed25519_sign_and_verify():
+    signer = Ed25519Signer()
+    signature = signer.sign(b'message to sign')
+    assert len(signature) == 64
+    Ed25519Verifier(signer.base64_public_key).verify(b'message to sign', signature)
+
+
+def test_ed25519_verify_rejects_tampered_data():
+    signer = Ed25519Signer()
+    verifier = Ed25519Verifier(signer.base64_public_key)
+    signature = signer.sign(b'original')
+    with pytest.raises(SignatureVerificationError, match='Verification error'):
+        verifier.verify(b'tampered', signature)
+
+
+def test_ed25519_sign_rejects_invalid_data():
+    signer = Ed25519Signer()
+    with pytest.raises(TypeError, match='data must be bytes'):
+        signer.sign('not-bytes')
+    with pytest.raises(ValueError, match='data is empty'):
+        signer.sign(b'')
+
+
+def test_ed25519_verify_rejects_non_bytes():
+    verifier = Ed25519Verifier(Ed25519Signer().base64_public_key)
+    with pytest.raises(TypeError, match='data and signature must be bytes'):
+        verifier.verify('not-bytes', b'sig')
+
+
+def test_ed25519_verifier_rejects_invalid_key():
+    with pytest.raises(TypeError, match='public_key must be a base64-encoded string'):
+        Ed25519Verifier(b'not-a-string')
+
+
+def test_curve25519_reprs_hide_private_keys():
+    assert 'key=<hidden>' in repr(X25519KeyExchange())
+    signer = Ed25519Signer()
+    assert 'key=<hidden>' in repr(signer)
+    assert signer.base64_public_key in repr(Ed25519Verifier(signer.base64_public_key))
+    assert Ed25519Verifier(signer.base64_public_key).public_key == signer.public_key
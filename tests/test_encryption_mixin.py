@@ -1,5 +1,6 @@
 import pytest
 
+from confy_addons import AEADEncryption, AESEncryption, RSAEncryption, RSAPublicEncryption
 from confy_addons.core.mixins import EncryptionMixin
 
 
@@ -9,3 +10,32 @@ def test_raise_on_delete_attr():
     with pytest.raises(AttributeError) as exc_info:
         del mixin.some_attribute
     assert str(exc_info.value) == 'Attribute deletion is not allowed for security reasons'
+
+
+@pytest.mark.parametrize(
+    'handler',
+    [
+        AESEncryption(),
+        AEADEncryption(),
+        RSAPublicEncryption(RSAEncryption().public_key),
+    ],
+    ids=['aes', 'aead', 'rsa-public'],
+)
+def test_slotted_handlers_have_no_instance_dict(handler):
+    assert EncryptionMixin.__slots__ == ()
+    assert not hasattr(handler, '__dict__')
+    with pytest.raises(AttributeError):
+        handler.extra = 1
+    with pytest.raises(AttributeError) as exc_info:
+        del handler._key
+    assert str(exc_info.value) == 'Attribute deletion is not allowed for security reasons'
+
+
+def test_rsa_encryption_has_no_instance_dict():
+    rsa = RSAEncryption()
+    assert not hasattr(rsa, '__dict__')
+    assert (
+        rsa.base64_public_key == RSAEncryption.from_private_key(rsa.private_key).base64_public_key
+    )
+    with pytest.raises(AttributeError, match='Attribute deletion is not allowed'):
+        del rsa._private_key
@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pytest
+
+from confy_addons.core.constants import AEAD_NONCE_SIZE, AES_IV_SIZE
+from confy_addons.encryption import entropy
+from confy_addons.encryption.entropy import RandomPool
+
+
+def test_pool_returns_distinct_tokens_of_the_requested_size():
+    pool = RandomPool()
+
+    tokens = [pool.token_bytes(size) for size in (AES_IV_SIZE, AEAD_NONCE_SIZE) * 1000]
+
+    assert [len(token) for token in tokens[:2]] == [AES_IV_SIZE, AEAD_NONCE_SIZE]
+    assert len(set(tokens)) == len(tokens)
+
+
+def test_pool_reads_blocks_from_the_operating_system(monkeypatch):
+    calls = []
+
+    def pattern(size):
+        return bytes(index % 251 for index in range(size))
+
+    def urandom(size):
+        calls.append(size)
+        return pattern(size)
+
+    monkeypatch.setattr('confy_addons.encryption.entropy.os.urandom', urandom)
+    pool = RandomPool(block_size=1024)
+
+    tokens = [pool.token_bytes(AES_IV_SIZE) for _ in range(65)]
+    assert calls == [1024, 1024]
+    assert sorted(tokens[:64]) == sorted(pattern(1024)[i : i + 16] for i in range(0, 1024, 16))
+
+    assert pool.token_bytes(AEAD_NONCE_SIZE) == pattern(12)
+    assert calls[-1] == 1020
+
+    calls.clear()
+    assert len(pool.token_bytes(17)) == 17
+    assert calls == [17]
+
+    pool.reset()
+    pool.token_bytes(AES_IV_SIZE)
+    assert calls == [17, 1024]
+
+
+def test_pool_from_many_threads():
+    pool = RandomPool()
+    barrier = threading.Barrier(8)
+    tokens = []
+
+    def work():
+        barrier.wait()
+        tokens.extend(pool.token_bytes(AES_IV_SIZE) for _ in range(500))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(tokens) == 8 * 500
+    assert len(set(tokens)) == len(tokens)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_forked_child_does_not_reuse_buffered_bytes():
+    pool = RandomPool()
+    pool.token_bytes(AES_IV_SIZE)
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_fd)
+        os.write(write_fd, pool.token_bytes(AES_IV_SIZE) + entropy.token_bytes(AES_IV_SIZE))
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as reader:
+        child = reader.read()
+    os.waitpid(pid, 0)
+
+    assert len(child) == 2 * AES_IV_SIZE
+    assert child[:AES_IV_SIZE] != pool.token_bytes(AES_IV_SIZE)
+    assert child[AES_IV_SIZE:] != entropy.token_bytes(AES_IV_SIZE)
+
+
+def test_pool_rejects_invalid_block_size():
+    with pytest.raises(TypeError, match='block_size must be an integer'):
+        RandomPool(block_size='64')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='block_size must be a positive integer'):
+        RandomPool(block_size=0)
+
+
+def test_repr_random_pool():
+    pool = RandomPool(block_size=64)
+    assert pool.block_size == 64
+    repr_str = repr(pool)
+    assert 'RandomPool' in repr_str
+    assert 'block_size=64' in repr_str
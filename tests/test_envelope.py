@@ -0,0 +1,139 @@
+import base64
+
+import pytest
+
+from confy_addons import (
+    AESEncryption,
+    EnvelopeEncryption,
+    RSAEncryption,
+    RSAPublicEncryption,
+    SealedEnvelope,
+    open_envelope,
+)
+from confy_addons.core.exceptions import DecryptionError
+from confy_addons.prefixes import AES_KEY_PREFIX, AES_PREFIX
+
+
+@pytest.fixture(scope='module')
+def recipients():
+    return {f'user-{index}': RSAEncryption() for index in range(3)}
+
+
+@pytest.fixture(scope='module')
+def public_recipients(recipients):
+    return {
+        recipient_id: RSAPublicEncryption(rsa.public_key)
+        for recipient_id, rsa in recipients.items()
+    }
+
+
+def test_seal_encrypts_once_for_every_recipient(recipients, public_recipients):
+    sealed = EnvelopeEncryption.seal('group message', public_recipients)
+
+    assert isinstance(sealed, SealedEnvelope)
+    assert set(sealed.wrapped_keys) == set(recipients)
+    for recipient_id, rsa in recipients.items():
+        assert open_envelope(sealed.ciphertext, sealed.wrapped_keys[recipient_id], rsa) == (
+            'group message'
+        )
+
+
+def test_seal_ciphertext_is_compatible_with_aes(recipients, public_recipients):
+    sealed = EnvelopeEncryption.seal('compatible', public_recipients)
+    data_key = recipients['user-0'].decrypt(base64.b64decode(sealed.wrapped_keys['user-0']))
+    assert AESEncryption(data_key).decrypt(sealed.ciphertext) == 'compatible'
+
+
+def test_seal_uses_a_fresh_data_key_per_envelope(recipients, public_recipients):
+    envelope = EnvelopeEncryption()
+    first = envelope.seal('for user-0', {'user-0': public_recipients['user-0']})
+    second = envelope.seal('for user-1', {'user-1': public_recipients['user-1']})
+
+    opened = EnvelopeEncryption.from_wrapped_key(
+        first.wrapped_keys['user-0'], recipients['user-0']
+    )
+    assert opened.decrypt(first.ciphertext) == 'for user-0'
+    assert opened.aes.key != envelope.aes.key
+    try:
+        leaked = opened.decrypt(second.ciphertext)
+    except DecryptionError:
+        leaked = None
+    assert leaked != 'for user-1'
+    assert (
+        open_envelope(second.ciphertext, second.wrapped_keys['user-1'], recipients['user-1'])
+        == 'for user-1'
+    )
+
+
+def test_unwrapped_key_does_not_open_another_recipients_envelope(recipients, public_recipients):
+    first = EnvelopeEncryption.seal('for user-0', {'user-0': public_recipients['user-0']})
+    second = EnvelopeEncryption.seal('for user-1', {'user-1': public_recipients['user-1']})
+
+    first_key = recipients['user-0'].decrypt(base64.b64decode(first.wrapped_keys['user-0']))
+    second_key = recipients['user-1'].decrypt(base64.b64decode(second.wrapped_keys['user-1']))
+    assert first_key != second_key
+
+    try:
+        leaked = AESEncryption(first_key).decrypt(second.ciphertext)
+    except DecryptionError:
+        leaked = None
+    assert leaked != 'for user-1'
+
+
+def test_seal_with_no_recipients():
+    sealed = EnvelopeEncryption.seal('nobody', {})
+    assert not sealed.wrapped_keys
+
+
+def test_wrapped_key_is_rsa_encrypted_data_key(recipients, public_recipients):
+    envelope = EnvelopeEncryption()
+    wrapped = envelope.wrap_key(public_recipients['user-0'])
+    assert recipients['user-0'].decrypt(base64.b64decode(wrapped)) == envelope.aes.key
+
+
+def test_key_message_and_encrypted_message_flow(recipients, public_recipients):
+    sender = EnvelopeEncryption()
+    key_message = sender.key_message(public_recipients['user-1'])
+    assert key_message.startswith(AES_KEY_PREFIX)
+
+    receiver = EnvelopeEncryption.from_key_message(key_message, recipients['user-1'])
+    message = sender.encrypt_message('over the wire')
+    assert message.startswith(AES_PREFIX)
+    assert receiver.decrypt_message(message) == 'over the wire'
+    assert receiver.decrypt(sender.encrypt('plain api')) == 'plain api'
+
+
+def test_from_key_message_rejects_wrong_prefix(recipients):
+    with pytest.raises(ValueError, match="message must start with 'aes-key:'"):
+        EnvelopeEncryption.from_key_message('enc:abc', recipients['user-0'])
+
+
+def test_decrypt_message_rejects_non_string():
+    with pytest.raises(TypeError, match='message must be a str'):
+        EnvelopeEncryption().decrypt_message(b'enc:abc')
+
+
+def test_from_wrapped_key_rejects_invalid_base64(recipients):
+    with pytest.raises(ValueError, match='Invalid base64 wrapped key'):
+        EnvelopeEncryption.from_wrapped_key('not base64!', recipients['user-0'])
+
+
+def test_from_wrapped_key_rejects_non_string(recipients):
+    with pytest.raises(TypeError, match='wrapped_key must be a base64-encoded str'):
+        EnvelopeEncryption.from_wrapped_key(b'abc', recipients['user-0'])
+
+
+def test_wrap_key_rejects_invalid_recipient():
+    with pytest.raises(TypeError, match='recipient must be an instance of RSAPublicEncryption'):
+        EnvelopeEncryption().wrap_key('not-a-recipient')
+
+
+def test_init_rejects_invalid_aes():
+    with pytest.raises(TypeError, match='aes must be an instance of AESEncryption'):
+        EnvelopeEncryption(aes=b'key')
+
+
+def test_repr_envelope_encryption():
+    repr_str = repr(EnvelopeEncryption())
+    assert 'EnvelopeEncryption' in repr_str
+    assert 'key=<hidden>' in repr_str
@@ -0,0 +1,105 @@
+import subprocess
+import sys
+
+import pytest
+
+import confy_addons
+import confy_addons.encryption
+from confy_addons.encryption.aes import AESEncryption
+from confy_addons.encryption.rsa import deserialize_public_key
+
+
+def import_time(statement: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every module loaded."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import confy_addons',
+        'import confy_addons.prefixes',
+        'import confy_addons.messages',
+        'import confy_addons.http_messages',
+        'from confy_addons.prefixes import AES_PREFIX',
+    ],
+)
+def test_constants_import_without_cryptography(statement):
+    modules = import_time(statement)
+    assert 'confy_addons' in modules
+    assert not [name for name in modules if name.startswith('cryptography')]
+    assert 'confy_addons.encryption' not in modules
+    assert 'asyncio' not in modules
+    assert 'logging' not in modules
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Return the modules loaded after running statement in a fresh interpreter."""
+    code = f'{statement}\nimport sys\nprint(*sys.modules)'
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, check=True, text=True
+    )
+    return set(result.stdout.split())
+
+
+def test_handler_import_loads_only_its_modules():
+    modules = loaded_modules('from confy_addons import AESEncryption')
+    assert 'confy_addons.encryption.aes' in modules
+    assert 'confy_addons.encryption.rsa' not in modules
+    assert 'confy_addons.encryption.aio' not in modules
+
+
+def test_package_import_is_faster_than_handler_import():
+    package = import_time('import confy_addons')['confy_addons']
+    handler = import_time('import confy_addons.encryption.aes')['confy_addons.encryption.aes']
+    assert package < handler
+
+
+def test_public_names_resolve_lazily():
+    assert confy_addons.AESEncryption is AESEncryption
+    assert confy_addons.encryption.AESEncryption is AESEncryption
+    assert confy_addons.deserialize_public_key is deserialize_public_key
+    assert callable(confy_addons.quiet)
+    assert set(confy_addons.__all__) <= set(dir(confy_addons))
+    assert set(confy_addons.encryption.__all__) <= set(dir(confy_addons.encryption))
+    assert 'encryption' in dir(confy_addons)
+
+
+def test_star_import_exports_every_public_name():
+    namespace: dict = {}
+    exec('from confy_addons import *', namespace)
+    assert set(confy_addons.__all__) <= set(namespace)
+    assert 'RSAEncryption' in namespace
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        confy_addons.Missing
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        confy_addons.encryption.Missing
+    with pytest.raises(ImportError):
+        exec('from confy_addons import Missing', {})
+
+
+def test_submodules_resolve_after_package_import():
+    code = (
+        'import confy_addons\n'
+        'assert confy_addons.encryption.aes.AESEncryption is confy_addons.AESEncryption\n'
+        'assert confy_addons.core.constants.AES_KEY_SIZE == 32\n'
+        'assert confy_addons.prefixes.AES_PREFIX\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        confy_addons.core.missing
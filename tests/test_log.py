@@ -0,0 +1,104 @@
+import logging
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from confy_addons import AESEncryption, get_log_level, is_quiet, quiet, set_log_level
+from confy_addons.core.constants import LOGGER_LEVEL, LOGGER_NAME
+
+
+@pytest.fixture(autouse=True)
+def default_level():
+    yield
+    set_log_level(LOGGER_LEVEL)
+
+
+def test_import_does_not_configure_the_root_logger():
+    code = (
+        'import logging, confy_addons, confy_addons.metrics, confy_addons.wire\n'
+        'assert logging.getLogger().handlers == []\n'
+        'assert logging.getLogger().level == logging.WARNING\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_package_logger_has_only_a_null_handler():
+    handlers = logging.getLogger(LOGGER_NAME).handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], logging.NullHandler)
+    assert get_log_level() == LOGGER_LEVEL
+
+
+def test_errors_are_logged_with_lazy_arguments(caplog):
+    with caplog.at_level(logging.ERROR, logger=LOGGER_NAME), pytest.raises(TypeError):
+        AESEncryption().encrypt(b'payload')  # type: ignore[arg-type]
+
+    record = caplog.records[-1]
+    assert record.name == 'confy_addons.encryption.aes'
+    assert record.msg == 'Invalid plaintext type: %s'
+    assert record.args == (bytes,)
+    assert record.getMessage() == "Invalid plaintext type: <class 'bytes'>"
+
+
+def test_set_log_level_filters_records(caplog):
+    caplog.set_level(logging.DEBUG)
+    set_log_level(logging.CRITICAL)
+    assert get_log_level() == logging.CRITICAL
+
+    with pytest.raises(TypeError):
+        AESEncryption().encrypt(1)  # type: ignore[arg-type]
+    assert not caplog.records
+
+    set_log_level(logging.DEBUG)
+    AESEncryption(b'k' * 32)
+    assert caplog.records[-1].getMessage() == 'AES encryption initialized with provided key'
+
+    with pytest.raises(TypeError, match='level must be an integer'):
+        set_log_level('DEBUG')  # type: ignore[arg-type]
+
+
+def test_quiet_skips_log_records(caplog):
+    caplog.set_level(logging.DEBUG)
+    aes = AESEncryption()
+
+    with quiet():
+        assert is_quiet()
+        with pytest.raises(ValueError, match='too short'):
+            aes.decrypt('')
+    assert not is_quiet()
+    assert not caplog.records
+
+    with pytest.raises(ValueError, match='too short'):
+        aes.decrypt('')
+    assert caplog.records
+
+
+def test_quiet_blocks_nest_and_keep_set_level():
+    with quiet():
+        with quiet():
+            set_log_level(logging.DEBUG)
+            assert logging.getLogger(LOGGER_NAME).level > logging.CRITICAL
+        assert is_quiet()
+    assert not is_quiet()
+    assert logging.getLogger(LOGGER_NAME).level == logging.DEBUG
+
+
+def test_quiet_from_several_threads():
+    barrier = threading.Barrier(4)
+
+    def work():
+        with quiet():
+            barrier.wait()
+            assert is_quiet()
+        barrier.wait()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not is_quiet()
+    assert logging.getLogger(LOGGER_NAME).level == LOGGER_LEVEL
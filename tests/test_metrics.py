@@ -0,0 +1,326 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+import confy_addons
+from confy_addons import metrics
+from confy_addons.core.abstract import MetricsSinkABC
+from confy_addons.encryption import aio
+from confy_addons.encryption import pool as pool_module
+from confy_addons.encryption import rsa as rsa_module
+from confy_addons.encryption.aead import AEADEncryption
+from confy_addons.encryption.aes import AESEncryption
+from confy_addons.encryption.aio import AsyncRSAEncryption
+from confy_addons.encryption.pool import RSAKeyPool
+from confy_addons.encryption.rsa import RSAEncryption, RSAPublicEncryption
+from confy_addons.metrics import (
+    LATENCY_BUCKETS,
+    CallbackSink,
+    MetricEvent,
+    MetricsRegistry,
+    PrometheusExporter,
+)
+
+
+@pytest.fixture(autouse=True)
+def metrics_disabled():
+    yield
+    metrics.disable()
+
+
+@pytest.fixture(scope='module')
+def rsa():
+    return RSAEncryption()
+
+
+def test_enable_and_disable_restore_the_original_methods():
+    encrypt = AESEncryption.encrypt
+    deserialize = rsa_module.deserialize_public_key
+
+    metrics.enable(MetricsRegistry())
+    assert metrics.is_enabled()
+    assert AESEncryption.encrypt is not encrypt
+    assert AESEncryption.encrypt.__wrapped__ is encrypt  # type: ignore[attr-defined]
+
+    metrics.disable()
+    assert not metrics.is_enabled()
+    assert AESEncryption.encrypt is encrypt
+    assert rsa_module.deserialize_public_key is deserialize
+    assert confy_addons.deserialize_public_key is deserialize
+
+
+def test_disable_restores_functions_resolved_lazily_while_enabled():
+    deserialize = rsa_module.deserialize_public_key
+    vars(confy_addons).pop('deserialize_public_key', None)
+    vars(confy_addons.encryption).pop('deserialize_public_key', None)
+
+    metrics.enable(MetricsRegistry())
+    assert confy_addons.deserialize_public_key is not deserialize
+
+    metrics.disable()
+    assert confy_addons.deserialize_public_key is deserialize
+    assert confy_addons.encryption.deserialize_public_key is deserialize
+
+
+def test_enable_twice_replaces_the_sinks():
+    first, second = MetricsRegistry(), MetricsRegistry()
+    encrypt = AESEncryption.encrypt
+    metrics.enable(first)
+    metrics.enable(second)
+
+    AESEncryption().encrypt('payload')
+
+    assert first.snapshot() == {}
+    assert second.snapshot()['aes.encrypt'].calls == 1
+    metrics.disable()
+    assert AESEncryption.encrypt is encrypt
+
+
+def test_registry_counts_calls_bytes_and_errors():
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+    aes = AESEncryption()
+
+    ciphertext = aes.encrypt('payload')
+    aes.encrypt('x' * 100)
+    assert aes.decrypt(ciphertext) == 'payload'
+    with pytest.raises(ValueError, match='too short'):
+        aes.decrypt('!!!')
+
+    snapshot = registry.snapshot()
+    assert snapshot['aes.encrypt'].calls == 2
+    assert snapshot['aes.encrypt'].errors == 0
+    assert snapshot['aes.encrypt'].bytes == 107
+    assert snapshot['aes.decrypt'].calls == 2
+    assert snapshot['aes.decrypt'].errors == 1
+    assert snapshot['aes.decrypt'].duration_sum > 0
+
+
+def test_registry_counts_bytes_and_keyword_arguments():
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+    aes, aead = AESEncryption(), AEADEncryption()
+
+    payload = aes.encrypt_bytes(data=b'x' * 64)
+    aes.decrypt_bytes(memoryview(payload))
+    aead.decrypt(aead.encrypt('payload'))
+
+    snapshot = registry.snapshot()
+    assert snapshot['aes.encrypt'].bytes == 64
+    assert snapshot['aes.decrypt'].bytes == len(payload)
+    assert snapshot['aead.encrypt'].bytes == 7
+    assert snapshot['aead.decrypt'].calls == 1
+
+
+def test_batch_methods_measure_the_whole_batch():
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+    aes = AESEncryption()
+
+    ciphertexts = aes.encrypt_many(text for text in ('a', 'bb', 'ccc'))
+    assert aes.decrypt_many(iter(ciphertexts)) == ['a', 'bb', 'ccc']
+
+    snapshot = registry.snapshot()
+    assert snapshot['aes.encrypt_many'].calls == 1
+    assert snapshot['aes.encrypt_many'].bytes == 6
+    assert snapshot['aes.decrypt_many'].bytes == sum(map(len, ciphertexts))
+
+
+def test_rsa_operations_are_measured(rsa):
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+
+    public = RSAPublicEncryption(confy_addons.deserialize_public_key(rsa.base64_public_key))
+    signature = rsa.sign(b'payload')
+    public.verify(b'payload', signature)
+    assert rsa.decrypt(public.encrypt(b'key')) == b'key'
+
+    snapshot = registry.snapshot()
+    for operation in ('rsa.deserialize', 'rsa.sign', 'rsa.verify', 'rsa.encrypt', 'rsa.decrypt'):
+        assert snapshot[operation].calls == 1
+    assert snapshot['rsa.deserialize'].bytes == len(rsa.base64_public_key)
+
+
+KEYGEN_DELAY = 0.05
+
+
+@pytest.fixture
+def slow_keygen(rsa, monkeypatch):
+    """Make every key generation path sleep, then return the rsa fixture key."""
+    der = rsa.private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+    def generate_private_key(**_):
+        time.sleep(KEYGEN_DELAY)
+        return rsa.private_key
+
+    def generate_private_key_der(key_size):
+        time.sleep(KEYGEN_DELAY)
+        return der
+
+    monkeypatch.setattr(pool_module.rsa, 'generate_private_key', generate_private_key)
+    monkeypatch.setattr(pool_module, 'generate_private_key_der', generate_private_key_der)
+    monkeypatch.setattr(aio, 'generate_private_key_der', generate_private_key_der)
+
+
+def test_keygen_times_the_generation_of_pool_misses(slow_keygen):
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+
+    RSAEncryption.from_pool(RSAKeyPool(target_size=1, processes=False))
+
+    keygen = registry.snapshot()['rsa.keygen']
+    assert keygen.calls == 1
+    assert keygen.duration_sum >= KEYGEN_DELAY
+
+
+def test_keygen_times_batches_as_one_operation(slow_keygen):
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+
+    assert len(RSAEncryption.generate_many(2, workers=1)) == 2
+
+    snapshot = registry.snapshot()
+    assert 'rsa.keygen' not in snapshot
+    assert snapshot['rsa.keygen_many'].calls == 1
+    assert snapshot['rsa.keygen_many'].duration_sum >= 2 * KEYGEN_DELAY
+
+
+def test_keygen_times_async_creation(slow_keygen):
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await AsyncRSAEncryption.create(keygen_executor=executor)
+
+    assert isinstance(asyncio.run(run()), AsyncRSAEncryption)
+
+    keygen = registry.snapshot()['rsa.keygen']
+    assert keygen.calls == 1
+    assert keygen.duration_sum >= KEYGEN_DELAY
+
+
+def test_handlers_from_existing_keys_are_not_keygen(rsa):
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+
+    RSAEncryption.from_private_key(rsa.private_key)
+
+    assert 'rsa.keygen' not in registry.snapshot()
+
+
+def test_text_payloads_are_measured_in_utf8_bytes():
+    registry = MetricsRegistry()
+    metrics.enable(registry)
+
+    AESEncryption().encrypt('héllo')
+
+    assert registry.snapshot()['aes.encrypt'].bytes == len('héllo'.encode())
+
+
+def test_instrumented_classmethods_stay_classmethods(slow_keygen):
+    class CustomAsyncRSA(AsyncRSAEncryption):
+        pass
+
+    original = vars(AsyncRSAEncryption)['create']
+    metrics.enable(MetricsRegistry())
+    assert isinstance(asyncio.run(CustomAsyncRSA.create()), CustomAsyncRSA)
+
+    metrics.disable()
+    assert vars(AsyncRSAEncryption)['create'] is original
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    for duration in (0.000001, 0.0003, 0.0003, 100.0):
+        registry.record(MetricEvent('op', 1, duration, False))
+
+    buckets = registry.snapshot()['op'].buckets
+    assert len(buckets) == len(LATENCY_BUCKETS) + 1
+    assert buckets[0] == 1
+    assert buckets[LATENCY_BUCKETS.index(0.0005)] == 3
+    assert buckets[-2] == 3
+    assert buckets[-1] == 4
+
+
+def test_registry_reset():
+    registry = MetricsRegistry()
+    registry.record(MetricEvent('op', 1, 0.1, True))
+    assert registry.snapshot()['op'].errors == 1
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_prometheus_exporter_renders_text_format():
+    registry = MetricsRegistry()
+    registry.record(MetricEvent('aes.encrypt', 10, 0.002, False))
+    registry.record(MetricEvent('aes.encrypt', 20, 0.5, True))
+
+    text = PrometheusExporter(registry, namespace='app').render()
+
+    assert text.endswith('\n')
+    assert '# TYPE app_operations_total counter' in text
+    assert 'app_operations_total{operation="aes.encrypt"} 2' in text
+    assert 'app_operation_errors_total{operation="aes.encrypt"} 1' in text
+    assert 'app_operation_bytes_total{operation="aes.encrypt"} 30' in text
+    assert '# TYPE app_operation_duration_seconds histogram' in text
+    assert 'app_operation_duration_seconds_bucket{operation="aes.encrypt",le="0.001"} 0' in text
+    assert 'app_operation_duration_seconds_bucket{operation="aes.encrypt",le="0.0025"} 1' in text
+    assert 'app_operation_duration_seconds_bucket{operation="aes.encrypt",le="10.0"} 2' in text
+    assert 'app_operation_duration_seconds_bucket{operation="aes.encrypt",le="+Inf"} 2' in text
+    assert 'app_operation_duration_seconds_sum{operation="aes.encrypt"} 0.502' in text
+    assert 'app_operation_duration_seconds_count{operation="aes.encrypt"} 2' in text
+
+
+def test_callback_sink_receives_events():
+    events: list[MetricEvent] = []
+    metrics.enable(CallbackSink(events.append))
+
+    AESEncryption().encrypt('payload')
+
+    assert len(events) == 1
+    assert events[0].operation == 'aes.encrypt'
+    assert events[0].size == 7
+    assert events[0].error is False
+    assert isinstance(CallbackSink(print), MetricsSinkABC)
+
+
+def test_failing_sink_does_not_fail_the_operation():
+    def fail(event):
+        raise RuntimeError('sink failure')
+
+    registry = MetricsRegistry()
+    metrics.enable(CallbackSink(fail), registry)
+
+    aes = AESEncryption()
+    assert aes.decrypt(aes.encrypt('payload')) == 'payload'
+    assert registry.snapshot()['aes.encrypt'].calls == 1
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError, match='at least one sink is required'):
+        metrics.enable()
+    with pytest.raises(TypeError, match='sinks must be instances of MetricsSinkABC'):
+        metrics.enable(print)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='registry must be an instance of MetricsRegistry'):
+        PrometheusExporter(object())  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='namespace must be a str'):
+        PrometheusExporter(MetricsRegistry(), namespace=1)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='callback must be callable'):
+        CallbackSink(1)  # type: ignore[arg-type]
+    assert not metrics.is_enabled()
+
+
+def test_repr():
+    registry = MetricsRegistry()
+    registry.record(MetricEvent('op', 1, 0.1, False))
+    assert 'MetricsRegistry(operations=1)' in repr(registry)
+    assert "PrometheusExporter(namespace='confy_addons')" in repr(PrometheusExporter(registry))
+    assert 'CallbackSink(callback=' in repr(CallbackSink(print))
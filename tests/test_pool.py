@@ -0,0 +1,273 @@
+import multiprocessing
+import os
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa as RSA
+
+from confy_addons import RSAEncryption, RSAKeyPool, RSAPublicEncryption
+from confy_addons.core.constants import DEFAULT_RSA_KEY_SIZE
+from confy_addons.encryption import pool as pool_module
+from confy_addons.encryption.pool import generate_private_keys, get_default_pool
+
+
+@pytest.fixture
+def default_pools():
+    yield
+    with pool_module._default_pools_lock:
+        pools = list(pool_module._default_pools.values())
+        pool_module._default_pools.clear()
+    for pool in pools:
+        pool.stop()
+
+
+def test_pool_serves_pregenerated_keys():
+    with RSAKeyPool(target_size=1) as pool:
+        assert pool.wait_ready(timeout=60)
+        key = pool.acquire()
+
+    assert isinstance(key, RSA.RSAPrivateKey)
+    assert key.key_size == DEFAULT_RSA_KEY_SIZE
+    stats = pool.stats()
+    assert stats.hits == 1
+    assert stats.misses == 0
+    assert stats.generated >= 1
+
+
+def test_pool_miss_generates_synchronously():
+    pool = RSAKeyPool(target_size=1)
+    key = pool.acquire()
+    assert isinstance(key, RSA.RSAPrivateKey)
+    assert pool.stats() == (0, 1, 0, 0, 1)
+
+
+def test_pool_never_hands_out_the_same_key_twice():
+    with RSAKeyPool(target_size=2) as pool:
+        assert pool.wait_ready(timeout=60)
+        first, second = pool.acquire(), pool.acquire()
+    assert first.private_numbers() != second.private_numbers()
+
+
+@pytest.mark.parametrize('processes', [True, False])
+def test_pool_refills_after_acquire(processes):
+    with RSAKeyPool(target_size=1, processes=processes) as pool:
+        assert pool.wait_ready(timeout=60)
+        pool.acquire()
+        assert pool.wait_ready(timeout=60)
+        assert pool.stats().available == 1
+
+
+def test_pool_start_is_idempotent_and_stop_keeps_keys():
+    pool = RSAKeyPool(target_size=1)
+    pool.start()
+    pool.start()
+    assert pool.wait_ready(timeout=60)
+    pool.stop()
+    assert pool.stats().available == 1
+    pool.acquire()
+    assert pool.stats().hits == 1
+
+
+def test_pool_generates_keys_in_worker_processes(monkeypatch):
+    with RSAKeyPool(target_size=1) as pool:
+        assert pool.wait_ready(timeout=60)
+        # The worker processes already exist, so this only affects the parent.
+        calls = []
+        monkeypatch.setattr(
+            'confy_addons.encryption.pool.rsa.generate_private_key',
+            lambda **kwargs: calls.append(kwargs),
+        )
+        pool.acquire()
+        assert pool.wait_ready(timeout=60)
+        pool.acquire()
+        key = pool.acquire()
+
+    assert isinstance(key, RSA.RSAPrivateKey)
+    assert not calls
+    assert pool.stats().misses == 1
+
+
+def test_rsa_from_pool_uses_given_pool():
+    with RSAKeyPool(target_size=1) as pool:
+        assert pool.wait_ready(timeout=60)
+        rsa = RSAEncryption.from_pool(pool)
+
+    assert rsa.key_size == DEFAULT_RSA_KEY_SIZE
+    assert pool.stats().hits == 1
+    signature = rsa.sign(b'pooled key')
+    assert signature
+
+
+def test_rsa_from_pool_uses_default_pool(default_pools):
+    rsa = RSAEncryption.from_pool()
+    assert isinstance(rsa, RSAEncryption)
+    assert get_default_pool() is get_default_pool()
+
+
+def test_rsa_from_private_key_rejects_wrong_type():
+    with pytest.raises(TypeError, match='private_key must be an instance of RSAPrivateKey'):
+        RSAEncryption.from_private_key('not-a-key')
+
+
+def test_rsa_from_private_key_rejects_small_key():
+    small_key = RSA.generate_private_key(public_exponent=65537, key_size=2048)
+    with pytest.raises(ValueError, match='key_size must be at least'):
+        RSAEncryption.from_private_key(small_key)
+
+
+def test_rsa_from_private_key_rejects_other_exponent():
+    key = RSA.generate_private_key(public_exponent=3, key_size=DEFAULT_RSA_KEY_SIZE)
+    with pytest.raises(ValueError, match='public exponent must be 65537'):
+        RSAEncryption.from_private_key(key)
+
+
+@pytest.mark.parametrize('argument', ['key_size', 'target_size', 'workers'])
+def test_pool_rejects_non_integer_arguments(argument):
+    with pytest.raises(TypeError, match=f'{argument} must be an integer'):
+        RSAKeyPool(**{argument: '1'})
+
+
+def test_pool_rejects_small_key_size():
+    with pytest.raises(ValueError, match='key_size must be at least'):
+        RSAKeyPool(key_size=DEFAULT_RSA_KEY_SIZE - 1)
+
+
+@pytest.mark.parametrize('argument', ['target_size', 'workers'])
+def test_pool_rejects_non_positive_sizes(argument):
+    with pytest.raises(ValueError, match=f'{argument} must be a positive integer'):
+        RSAKeyPool(**{argument: 0})
+
+
+def test_worker_processes_are_not_forked():
+    assert pool_module._default_mp_context().get_start_method() != 'fork'
+
+
+def test_pool_uses_the_given_mp_context():
+    context = multiprocessing.get_context('spawn')
+    with RSAKeyPool(target_size=1, mp_context=context) as pool:
+        assert pool._executor is not None
+        assert pool._executor._mp_context is context
+        assert pool.wait_ready(timeout=60)
+    assert (
+        generate_private_keys(2, workers=2, mp_context=context)[0].key_size == DEFAULT_RSA_KEY_SIZE
+    )
+
+
+def test_invalid_mp_context_raises():
+    with pytest.raises(TypeError, match='mp_context must be a multiprocessing context'):
+        RSAKeyPool(mp_context='spawn')  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='mp_context must be a multiprocessing context'):
+        generate_private_keys(1, mp_context='spawn')  # type: ignore[arg-type]
+
+
+def test_pool_generation_failure_raises_runtime_error(monkeypatch):
+    def fake_generate_private_key(*args, **kwargs):
+        raise ValueError('simulated failure')
+
+    monkeypatch.setattr(
+        'confy_addons.encryption.pool.rsa.generate_private_key', fake_generate_private_key
+    )
+
+    # Worker processes do not see the patch, so the workers run on threads.
+    pool = RSAKeyPool(target_size=1, processes=False)
+    with pytest.raises(RuntimeError, match='Failed to generate RSA key pair'):
+        pool.acquire()
+
+    pool.start()
+    pool.stop(timeout=5)
+    assert pool.stats().generated == 0
+
+
+def test_repr_rsa_key_pool():
+    repr_str = repr(RSAKeyPool(target_size=2))
+    assert 'RSAKeyPool' in repr_str
+    assert 'target_size=2' in repr_str
+    assert 'object at' in repr_str
+
+
+def test_generate_private_keys_in_process_pool():
+    keys = generate_private_keys(2, workers=2)
+    assert len(keys) == 2
+    assert all(isinstance(key, RSA.RSAPrivateKey) for key in keys)
+    assert keys[0].private_numbers() != keys[1].private_numbers()
+
+
+def test_generate_private_keys_single_worker_and_empty():
+    assert not generate_private_keys(0)
+    (key,) = generate_private_keys(1, workers=1)
+    assert key.key_size == DEFAULT_RSA_KEY_SIZE
+
+
+def test_rsa_generate_many_returns_ready_instances():
+    instances = RSAEncryption.generate_many(2, workers=2)
+    assert len(instances) == 2
+    for rsa in instances:
+        rsa_pub = RSAPublicEncryption(rsa.public_key)
+        assert rsa.decrypt(rsa_pub.encrypt(b'bulk')) == b'bulk'
+
+
+@pytest.mark.parametrize('argument', ['count', 'key_size', 'workers'])
+def test_generate_private_keys_rejects_non_integer_arguments(argument):
+    arguments = {'count': 1, 'key_size': DEFAULT_RSA_KEY_SIZE, 'workers': 1}
+    arguments[argument] = '1'
+    with pytest.raises(TypeError, match=f'{argument} must be an integer'):
+        generate_private_keys(**arguments)
+
+
+def test_generate_private_keys_rejects_invalid_values():
+    with pytest.raises(ValueError, match='count must not be negative'):
+        generate_private_keys(-1)
+    with pytest.raises(ValueError, match='key_size must be at least'):
+        generate_private_keys(1, key_size=DEFAULT_RSA_KEY_SIZE - 1)
+    with pytest.raises(ValueError, match='workers must be a positive integer'):
+        generate_private_keys(1, workers=0)
+
+
+def test_generate_private_keys_failure_raises_runtime_error(monkeypatch):
+    def fake_generate_private_key(*args, **kwargs):
+        raise ValueError('simulated failure')
+
+    monkeypatch.setattr(
+        'confy_addons.encryption.pool.rsa.generate_private_key', fake_generate_private_key
+    )
+
+    with pytest.raises(RuntimeError, match='Failed to generate RSA key pair'):
+        generate_private_keys(1, workers=1)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_forked_child_gets_an_empty_stopped_pool(default_pools):
+    pool = RSAKeyPool(target_size=1)
+    pool.start()
+    assert pool.wait_ready(timeout=60)
+    default_pool = get_default_pool()
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_fd)
+        stats = pool.stats()
+        pool.start()
+        refilled = pool.wait_ready(timeout=60)
+        child_key = pool.acquire()
+        pool.stop()
+        child_default_pool = get_default_pool()
+        child_default_pool.stop()
+        report = (
+            f'{stats.available} {stats.generated > 0} {refilled} '
+            f'{child_default_pool is not default_pool} {child_key.private_numbers().p}'
+        )
+        os.write(write_fd, report.encode())
+        os._exit(0)
+
+    # Worker processes spawned meanwhile may inherit write_fd and keep the
+    # pipe open, so wait for the child instead of reading until EOF.
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    report = os.read(read_fd, 4096).decode().split()
+    os.close(read_fd)
+    parent_key = pool.acquire()
+    pool.stop()
+
+    assert report[:4] == ['0', 'True', 'True', 'True']
+    assert int(report[4]) != parent_key.private_numbers().p
+    assert pool.stats().hits == 1
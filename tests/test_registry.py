@@ -0,0 +1,244 @@
+import threading
+
+import pytest
+
+from confy_addons import (
+    AEADEncryption,
+    AESEncryption,
+    AESSession,
+    PeerSession,
+    RSAEncryption,
+    RSAPublicEncryption,
+    SessionRegistry,
+)
+from confy_addons.core.exceptions import DecryptionError, EncryptionError
+from confy_addons.encryption import aes as aes_module
+
+
+@pytest.fixture(scope='module')
+def public():
+    return RSAPublicEncryption(RSAEncryption().public_key)
+
+
+def is_wiped(aes):
+    with pytest.raises(EncryptionError):
+        aes.encrypt('payload')
+    return True
+
+
+def test_registry_stores_and_returns_sessions(public):
+    registry = SessionRegistry()
+    aes = AESEncryption()
+
+    session = registry.put('alice', aes, public)
+
+    assert session == PeerSession(aes, public)
+    assert registry.get('alice') == session
+    assert registry.get('bob') is None
+    assert 'alice' in registry
+    assert 'bob' not in registry
+    assert 1 not in registry
+    assert len(registry) == 1
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_registry_evicts_least_recently_used_and_wipes_it():
+    registry = SessionRegistry(max_sessions=2)
+    handlers = {peer: AESEncryption() for peer in ('alice', 'bob', 'carol')}
+
+    registry.put('alice', handlers['alice'])
+    registry.put('bob', handlers['bob'])
+    registry.get('alice')
+    registry.put('carol', handlers['carol'])
+
+    assert 'bob' not in registry
+    assert 'alice' in registry
+    assert 'carol' in registry
+    assert is_wiped(handlers['bob'])
+    assert handlers['alice'].decrypt(handlers['alice'].encrypt('hi')) == 'hi'
+    assert registry.stats().evictions == 1
+
+
+def test_registry_expires_idle_sessions(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('confy_addons.core.registry.time.monotonic', lambda: now[0])
+    registry = SessionRegistry(ttl=60)
+    active, idle = AESEncryption(), AESEncryption()
+    registry.put('active', active)
+    registry.put('idle', idle)
+
+    now[0] += 50
+    assert registry.get('active') is not None
+    now[0] += 50
+
+    assert 'idle' not in registry
+    assert len(registry) == 2
+    assert registry.purge() == 1
+    assert len(registry) == 1
+    assert is_wiped(idle)
+    assert registry.get('active') is not None
+
+    now[0] += 61
+    assert registry.get('active') is None
+    assert is_wiped(active)
+    assert registry.stats().expirations == 2
+
+
+def test_registry_without_ttl_keeps_sessions(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('confy_addons.core.registry.time.monotonic', lambda: now[0])
+    registry = SessionRegistry(ttl=None)
+    registry.put('alice', AESEncryption())
+
+    now[0] += 10**9
+    assert registry.get('alice') is not None
+    assert registry.purge() == 0
+
+
+def test_registry_put_replaces_and_wipes_previous_session(public):
+    registry = SessionRegistry()
+    old, new = AESEncryption(), AESEncryption()
+    registry.put('alice', old)
+
+    registry.put('alice', old, public)
+    assert registry.get('alice') == PeerSession(old, public)
+    assert old.decrypt(old.encrypt('still usable')) == 'still usable'
+
+    registry.put('alice', new)
+    assert registry.get('alice') == PeerSession(new)
+    assert is_wiped(old)
+
+
+def test_registry_remove_and_clear_wipe_keys():
+    registry = SessionRegistry()
+    aes, aead = AESEncryption(), AEADEncryption()
+    session = AESSession(b's' * 32)
+    registry.put('alice', aes)
+    registry.put('bob', aead)
+    registry.put('carol', session)
+
+    assert registry.remove('alice')
+    assert not registry.remove('alice')
+    assert is_wiped(aes)
+    assert aes.key == b''
+
+    registry.clear()
+    assert len(registry) == 0
+    assert aead.key == bytes(32)
+    assert is_wiped(aead)
+    with pytest.raises(EncryptionError, match='Session was wiped'):
+        session.encrypt('payload')
+
+
+def test_registry_from_many_threads():
+    registry = SessionRegistry(max_sessions=64)
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def work(index):
+        barrier.wait()
+        for number in range(200):
+            peer_id = f'peer-{(index * 7 + number) % 100}'
+            registry.put(peer_id, AESEncryption())
+            session = registry.get(peer_id)
+            if session is not None:
+                try:
+                    session.aes.encrypt('payload')
+                except EncryptionError:
+                    # Evicted by another thread between get and use.
+                    pass
+                except Exception as e:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(registry) <= 64
+
+
+def test_registry_rejects_invalid_arguments():
+    with pytest.raises(TypeError, match='max_sessions must be an integer'):
+        SessionRegistry(max_sessions='10')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='max_sessions must be a positive integer'):
+        SessionRegistry(max_sessions=0)
+    with pytest.raises(TypeError, match='ttl must be a number of seconds'):
+        SessionRegistry(ttl='10')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='ttl must be positive'):
+        SessionRegistry(ttl=0)
+
+    registry = SessionRegistry()
+    with pytest.raises(TypeError, match='peer_id must be a str'):
+        registry.put(1, AESEncryption())  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='aes must be an AESEncryption'):
+        registry.put('alice', object())  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='public must be an instance of RSAPublicEncryption'):
+        registry.put('alice', AESEncryption(), object())  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='peer_id must be a str'):
+        registry.get(b'alice')  # type: ignore[arg-type]
+
+
+def test_repr_session_registry():
+    registry = SessionRegistry(max_sessions=8, ttl=60)
+    assert registry.max_sessions == 8
+    assert registry.ttl == 60
+    repr_str = repr(registry)
+    assert 'SessionRegistry' in repr_str
+    assert 'max_sessions=8' in repr_str
+    assert 'ttl=60' in repr_str
+
+
+def test_wiped_handlers_fail_to_decrypt():
+    aes, aead = AESEncryption(), AEADEncryption()
+    session = AESSession(b's' * 32)
+    ciphertexts = aes.encrypt('payload'), aead.encrypt('payload'), session.encrypt('payload')
+
+    for handler in (aes, aead, session):
+        handler.wipe()
+
+    with pytest.raises(DecryptionError):
+        aes.decrypt(ciphertexts[0])
+    with pytest.raises(DecryptionError):
+        aead.decrypt(ciphertexts[1])
+    with pytest.raises(DecryptionError, match='Session was wiped'):
+        session.decrypt(ciphertexts[2])
+
+
+@pytest.mark.parametrize(
+    ('method', 'argument', 'error'),
+    [
+        ('encrypt', 'payload', EncryptionError),
+        ('encrypt_bytes', b'payload', EncryptionError),
+        ('encrypt_many', ['payload'], EncryptionError),
+        ('encryptor', None, EncryptionError),
+        ('decryptor', None, DecryptionError),
+    ],
+)
+def test_wipe_racing_with_a_call_never_uses_the_zeroed_key(monkeypatch, method, argument, error):
+    aes = AESEncryption()
+    real_cipher = aes_module.Cipher
+
+    def cipher_during_wipe(algorithm, mode):
+        # Runs the first steps of wipe right after the call read the
+        # algorithm, leaving the key zeroed but not yet cleared.
+        aes._algorithm = None
+        aes._key[:] = bytes(32)
+        return real_cipher(algorithm, mode)
+
+    def algorithm_during_wipe(key):
+        aes._algorithm = None
+        aes._key[:] = bytes(32)
+        return real_algorithm(key)
+
+    real_algorithm = aes_module.algorithms.AES
+    monkeypatch.setattr(aes_module, 'Cipher', cipher_during_wipe)
+    if method == 'decryptor':
+        monkeypatch.setattr(aes_module.algorithms, 'AES', algorithm_during_wipe)
+
+    call = getattr(aes, method)
+    with pytest.raises(error):
+        call() if argument is None else call(argument)
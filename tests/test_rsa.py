@@ -1,6 +1,9 @@
+import base64
 import binascii
 
 import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.asymmetric import rsa as RSA
 
 from confy_addons import (
@@ -13,6 +16,12 @@ from confy_addons.core.exceptions import (
     DecryptionError,
     EncryptionError,
 )
+from confy_addons.encryption.rsa import (
+    OAEP_SHA256,
+    PSS_AUTO_SHA256,
+    PSS_DIGEST_LENGTH_SHA256,
+    PSS_MAX_LENGTH_SHA256,
+)
 
 
 def test_rsa_keypair_generation_not_is_none():
@@ -311,3 +320,103 @@ def test_rsa_public_verify_raises_signature_verification_error_on_unexpected_exc
 
     with pytest.raises(Exception, match=r'Verification error:'):
         rsa_pub.verify(data, signature)
+
+
+def test_public_key_serializations_are_cached():
+    rsa = RSAEncryption()
+    assert rsa.public_key is rsa.public_key
+    assert rsa.serialized_public_key is rsa.serialized_public_key
+    assert rsa.der_public_key is rsa.der_public_key
+    assert rsa.base64_public_key is rsa.base64_public_key
+
+
+def test_base64_public_key_matches_serialized_public_key():
+    rsa = RSAEncryption()
+    assert base64.b64decode(rsa.base64_public_key) == rsa.serialized_public_key
+    assert rsa.serialized_public_key.startswith(b'-----BEGIN PUBLIC KEY-----')
+
+
+def test_der_public_key_is_smaller_and_deserializable():
+    rsa = RSAEncryption()
+    der = rsa.der_public_key
+    assert isinstance(der, bytes)
+    assert len(der) < len(rsa.serialized_public_key)
+
+    deserialized_key = deserialize_public_key(base64.b64encode(der).decode())
+    assert deserialized_key.public_numbers() == rsa.public_key.public_numbers()
+
+
+def test_deserialize_public_key_raises_on_invalid_der():
+    b64_key = base64.b64encode(b'not a der key').decode()
+    with pytest.raises(ValueError, match='Failed to load public key from DER'):
+        deserialize_public_key(b64_key)
+
+
+def test_rsa_default_padding_profiles_are_shared():
+    rsa = RSAEncryption()
+    rsa_pub = RSAPublicEncryption(rsa.public_key)
+    assert rsa.encryption_padding is OAEP_SHA256
+    assert rsa.signature_padding is PSS_MAX_LENGTH_SHA256
+    assert rsa_pub.encryption_padding is OAEP_SHA256
+    assert rsa_pub.signature_padding is PSS_MAX_LENGTH_SHA256
+
+
+def test_rsa_operations_do_not_rebuild_paddings(monkeypatch):
+    rsa = RSAEncryption()
+    rsa_pub = RSAPublicEncryption(rsa.public_key)
+
+    def fail_on_rebuild(*args, **kwargs):
+        raise AssertionError('padding rebuilt on the hot path')
+
+    for name in ('OAEP', 'PSS', 'MGF1'):
+        monkeypatch.setattr(f'confy_addons.encryption.rsa.padding.{name}', fail_on_rebuild)
+
+    assert rsa.decrypt(rsa_pub.encrypt(b'shared padding')) == b'shared padding'
+    rsa_pub.verify(b'shared padding', rsa.sign(b'shared padding'))
+
+
+def test_rsa_sign_with_digest_length_salt_and_verify_with_auto():
+    rsa = RSAEncryption(signature_padding=PSS_DIGEST_LENGTH_SHA256)
+    signature = rsa.sign(b'cheaper salt')
+
+    RSAPublicEncryption(rsa.public_key, signature_padding=PSS_DIGEST_LENGTH_SHA256).verify(
+        b'cheaper salt', signature
+    )
+    RSAPublicEncryption(rsa.public_key, signature_padding=PSS_AUTO_SHA256).verify(
+        b'cheaper salt', signature
+    )
+
+
+def test_rsa_from_private_key_keeps_custom_padding():
+    rsa = RSAEncryption()
+    other = RSAEncryption.from_private_key(
+        rsa.private_key, signature_padding=PSS_DIGEST_LENGTH_SHA256
+    )
+    assert other.signature_padding is PSS_DIGEST_LENGTH_SHA256
+    assert other.encryption_padding is OAEP_SHA256
+
+
+def test_rsa_invalid_paddings_raise():
+    rsa = RSAEncryption()
+    with pytest.raises(TypeError, match='encryption_padding must be an instance of OAEP'):
+        RSAEncryption.from_private_key(rsa.private_key, encryption_padding=PSS_AUTO_SHA256)
+    with pytest.raises(TypeError, match='signature_padding must be an instance of PSS'):
+        RSAPublicEncryption(rsa.public_key, signature_padding=OAEP_SHA256)
+
+
+def test_rsa_auto_salt_length_only_verifies():
+    rsa = RSAEncryption()
+    with pytest.raises(ValueError, match='AUTO salt length can only verify'):
+        RSAEncryption.from_private_key(rsa.private_key, signature_padding=PSS_AUTO_SHA256)
+    with pytest.raises(ValueError, match='AUTO salt length can only verify'):
+        RSAEncryption.from_pool(signature_padding=PSS_AUTO_SHA256)
+    RSAPublicEncryption(rsa.public_key, signature_padding=PSS_AUTO_SHA256)
+
+
+def test_rsa_signature_padding_must_use_sha256():
+    rsa = RSAEncryption()
+    pss_sha512 = padding.PSS(mgf=padding.MGF1(hashes.SHA512()), salt_length=padding.PSS.MAX_LENGTH)
+    with pytest.raises(ValueError, match='must use MGF1 with SHA256'):
+        RSAEncryption.from_private_key(rsa.private_key, signature_padding=pss_sha512)
+    with pytest.raises(ValueError, match='must use MGF1 with SHA256'):
+        RSAPublicEncryption(rsa.public_key, signature_padding=pss_sha512)
@@ -0,0 +1,206 @@
+import base64
+import secrets
+
+import pytest
+
+from confy_addons import AESEncryption, AESSession
+from confy_addons.core.constants import DEFAULT_SESSION_MAX_SKIP, SESSION_KEY_ID_SIZE
+from confy_addons.core.exceptions import DecryptionError, IntegrityError
+from confy_addons.encryption import session as session_module
+
+
+@pytest.fixture
+def root():
+    return secrets.token_bytes(32)
+
+
+def key_id_of(b64_ciphertext):
+    return int.from_bytes(base64.b64decode(b64_ciphertext)[:SESSION_KEY_ID_SIZE], 'big')
+
+
+def test_session_round_trip(root):
+    alice, bob = AESSession(root), AESSession(root)
+    ciphertext = alice.encrypt('hello bob')
+    assert key_id_of(ciphertext) == 0
+    assert bob.decrypt(ciphertext) == 'hello bob'
+
+
+def test_session_bytes_round_trip(root):
+    alice, bob = AESSession(root), AESSession(root)
+    payload = alice.encrypt_bytes(bytearray(b'\x00\x01binary'))
+    assert bob.decrypt_bytes(memoryview(payload)) == b'\x00\x01binary'
+
+
+def test_session_rotates_after_max_messages(root):
+    alice, bob = AESSession(root, max_messages=2), AESSession(root)
+    ciphertexts = [alice.encrypt(str(i)) for i in range(5)]
+    assert [key_id_of(c) for c in ciphertexts] == [0, 0, 1, 1, 2]
+    assert [bob.decrypt(c) for c in ciphertexts] == ['0', '1', '2', '3', '4']
+    assert bob.key_id == 2
+
+
+def test_session_rotates_after_max_age(root, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_module.time, 'monotonic', lambda: now[0])
+    alice = AESSession(root, max_messages=None, max_age=60)
+
+    assert key_id_of(alice.encrypt('a')) == 0
+    now[0] += 59
+    assert key_id_of(alice.encrypt('b')) == 0
+    now[0] += 1
+    assert key_id_of(alice.encrypt('c')) == 1
+
+
+def test_session_rotated_keys_differ_from_root_and_each_other(root):
+    session = AESSession(root)
+    session.rotate()
+    keys = [aes.key for aes in session._keys.values()]
+    assert len(set(keys + [root])) == 3
+
+
+def test_session_keeps_window_of_previous_keys(root):
+    alice, bob = AESSession(root, window=2), AESSession(root, window=2)
+    old = alice.encrypt('in flight')
+    for _ in range(2):
+        alice.rotate()
+    bob.decrypt(alice.encrypt('newer'))
+    assert bob.decrypt(old) == 'in flight'
+
+    alice.rotate()
+    bob.decrypt(alice.encrypt('newest'))
+    with pytest.raises(DecryptionError, match='Session key expired'):
+        bob.decrypt(old)
+
+
+def test_session_receiver_ratchets_its_own_sending_key(root):
+    alice, bob = AESSession(root), AESSession(root)
+    alice.rotate()
+    bob.decrypt(alice.encrypt('hi'))
+    reply = bob.encrypt('hello')
+    assert key_id_of(reply) == 1
+    assert alice.decrypt(reply) == 'hello'
+
+
+def test_session_rejects_key_id_too_far_ahead(root):
+    payload = bytearray(AESSession(root).encrypt_bytes(b'x'))
+    payload[:SESSION_KEY_ID_SIZE] = (DEFAULT_SESSION_MAX_SKIP + 1).to_bytes(
+        SESSION_KEY_ID_SIZE, 'big'
+    )
+    bob = AESSession(root)
+    with pytest.raises(DecryptionError, match='Unknown session key'):
+        bob.decrypt_bytes(payload)
+    assert bob.key_id == 0
+
+
+def test_session_max_skip_is_configurable(root, monkeypatch):
+    steps = []
+    ratchet = session_module._ratchet
+    monkeypatch.setattr(session_module, '_ratchet', lambda key: steps.append(key) or ratchet(key))
+
+    alice, bob = AESSession(root), AESSession(root, max_skip=2)
+    for _ in range(3):
+        alice.rotate()
+    steps.clear()
+    with pytest.raises(DecryptionError, match='Unknown session key'):
+        bob.decrypt_bytes(alice.encrypt_bytes(b'too far'))
+    assert not steps
+    assert bob.max_skip == 2
+
+
+def test_session_wipes_keys_leaving_the_window(root):
+    session = AESSession(root, window=1)
+    first = session._keys[0]
+    session.rotate()
+    assert first._key != bytearray(32)
+    session.rotate()
+    assert first._key == bytearray(32)
+    assert list(session._keys) == [1, 2]
+    assert all(aead._key != bytearray(32) for aead in session._keys.values())
+
+
+def test_session_forged_key_id_does_not_ratchet(root):
+    alice, bob = AESSession(root, window=2), AESSession(root, window=2)
+    in_flight = alice.encrypt_bytes(b'in flight')
+    forged = bytearray(in_flight)
+    forged[:SESSION_KEY_ID_SIZE] = DEFAULT_SESSION_MAX_SKIP.to_bytes(SESSION_KEY_ID_SIZE, 'big')
+
+    with pytest.raises(IntegrityError):
+        bob.decrypt_bytes(forged)
+    assert bob.key_id == 0
+    assert bob.decrypt_bytes(in_flight) == b'in flight'
+
+    alice.rotate()
+    assert bob.decrypt_bytes(alice.encrypt_bytes(b'later')) == b'later'
+    assert bob.key_id == 1
+
+
+def test_session_key_id_is_authenticated(root):
+    alice, bob = AESSession(root), AESSession(root)
+    alice.rotate()
+    payload = bytearray(alice.encrypt_bytes(b'hello'))
+    payload[:SESSION_KEY_ID_SIZE] = (0).to_bytes(SESSION_KEY_ID_SIZE, 'big')
+    with pytest.raises(IntegrityError):
+        bob.decrypt_bytes(payload)
+
+
+def test_session_different_roots_do_not_interoperate(root):
+    ciphertext = AESSession(root).encrypt_bytes(b'hello')
+    with pytest.raises(IntegrityError):
+        AESSession(secrets.token_bytes(32)).decrypt_bytes(ciphertext)
+
+
+def test_session_key_ids_exhausted(root, monkeypatch):
+    alice = AESSession(root)
+    monkeypatch.setattr(session_module, 'SESSION_MAX_KEY_ID', 1)
+    alice.rotate()
+    with pytest.raises(RuntimeError, match='Session key IDs exhausted'):
+        alice.rotate()
+
+
+def test_session_from_aes(root):
+    aes = AESEncryption(key=root)
+    assert AESSession(root).decrypt(AESSession.from_aes(aes).encrypt('hi')) == 'hi'
+    with pytest.raises(TypeError, match='aes must be an instance of AESEncryption'):
+        AESSession.from_aes(root)  # type: ignore[arg-type]
+
+
+def test_session_rejects_invalid_arguments(root):
+    with pytest.raises(TypeError, match='root_secret must be bytes'):
+        AESSession('secret')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='root_secret must be at least 32 bytes'):
+        AESSession(b'short')
+    with pytest.raises(TypeError, match='max_messages must be an integer'):
+        AESSession(root, max_messages=1.5)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='max_messages must be a positive integer'):
+        AESSession(root, max_messages=0)
+    with pytest.raises(TypeError, match='max_age must be a number'):
+        AESSession(root, max_age='60')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='max_age must be positive'):
+        AESSession(root, max_age=0)
+    with pytest.raises(TypeError, match='window must be an integer'):
+        AESSession(root, window=None)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='window must not be negative'):
+        AESSession(root, window=-1)
+    with pytest.raises(TypeError, match='max_skip must be an integer'):
+        AESSession(root, max_skip=None)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='max_skip must be a positive integer'):
+        AESSession(root, max_skip=0)
+
+
+def test_session_rejects_invalid_ciphertexts(root):
+    session = AESSession(root)
+    with pytest.raises(TypeError, match='b64_ciphertext must be a base64-encoded str'):
+        session.decrypt(b'data')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='Invalid base64 encrypted data'):
+        session.decrypt('not base64!')
+    with pytest.raises(ValueError, match='too short to contain a key ID and an AEAD payload'):
+        session.decrypt_bytes(b'\x00' * 32)
+    with pytest.raises(TypeError, match='plaintext must be a str'):
+        session.encrypt(b'data')  # type: ignore[arg-type]
+
+
+def test_session_properties_and_repr(root):
+    session = AESSession(root, max_messages=10, max_age=5.0, window=3)
+    assert (session.max_messages, session.max_age, session.window) == (10, 5.0, 3)
+    assert session.key_id == 0
+    assert 'key=<hidden>, key_id=0' in repr(session)
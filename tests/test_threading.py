@@ -0,0 +1,109 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from confy_addons import (
+    AEADEncryption,
+    AESEncryption,
+    RSAEncryption,
+    RSAPublicEncryption,
+    ZlibCompression,
+)
+from confy_addons.core.constants import AES_IV_SIZE
+
+THREADS = 8
+MESSAGES = 200
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    # Switch threads as often as possible so that GIL builds interleave too.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.fixture(scope='module')
+def rsa():
+    return RSAEncryption()
+
+
+def run_threads(func, threads=THREADS):
+    """Run func(index) on every thread at once and return the results in order."""
+    barrier = threading.Barrier(threads)
+
+    def start(index):
+        barrier.wait()
+        return func(index)
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(start, range(threads)))
+
+
+@pytest.mark.parametrize(
+    'handler',
+    [
+        AESEncryption(),
+        AESEncryption(compression=ZlibCompression(), compression_threshold=0),
+        AEADEncryption(),
+    ],
+    ids=['aes', 'aes-compressed', 'aead'],
+)
+def test_shared_handler_round_trips_from_many_threads(handler):
+    def work(index):
+        plaintexts = [f'thread {index} message {number} ' * (number % 7) for number in range(100)]
+        ciphertexts = [handler.encrypt(plaintext) for plaintext in plaintexts]
+        assert [handler.decrypt(ciphertext) for ciphertext in ciphertexts] == plaintexts
+        return ciphertexts
+
+    results = run_threads(work)
+
+    # Ciphertexts made on one thread decrypt on any other.
+    for index, ciphertexts in enumerate(reversed(results)):
+        assert handler.decrypt(ciphertexts[1]) == f'thread {THREADS - 1 - index} message 1 '
+
+
+def test_shared_aes_uses_unique_ivs_across_threads():
+    aes = AESEncryption()
+
+    def work(index):
+        payloads = [aes.encrypt_bytes(b'payload') for _ in range(MESSAGES)]
+        payloads += aes.encrypt_many(['payload'] * MESSAGES)
+        return payloads
+
+    payloads = [payload for result in run_threads(work) for payload in result]
+    ivs = {
+        payload[:AES_IV_SIZE] if isinstance(payload, bytes) else payload[:24]
+        for payload in payloads
+    }
+    assert len(ivs) == len(payloads) == THREADS * MESSAGES * 2
+
+
+def test_shared_aes_bytes_and_into_from_many_threads():
+    aes = AESEncryption()
+
+    def work(index):
+        data = bytes([index]) * 1024
+        buffer = bytearray(AES_IV_SIZE + len(data))
+        for _ in range(MESSAGES):
+            written = aes.encrypt_into(data, buffer)
+            assert aes.decrypt_bytes(buffer[:written]) == data
+        return True
+
+    assert all(run_threads(work))
+
+
+def test_shared_rsa_handlers_from_many_threads(rsa):
+    public = RSAPublicEncryption(rsa.public_key)
+
+    def work(index):
+        data = f'key {index}'.encode()
+        assert rsa.decrypt(public.encrypt(data)) == data
+        public.verify(data, rsa.sign(data))
+        return rsa.base64_public_key, rsa.der_public_key
+
+    results = run_threads(work, threads=4)
+    assert len(set(results)) == 1
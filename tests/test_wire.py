@@ -0,0 +1,89 @@
+import base64
+
+import pytest
+
+from confy_addons import AESEncryption, RSAEncryption, X25519KeyExchange
+from confy_addons.codec import Message, MessageType
+from confy_addons.core.constants import WIRE_FORMAT_VERSION
+from confy_addons.prefixes import AES_KEY_PREFIX, AES_PREFIX, KEY_EXCHANGE_PREFIX, SYSTEM_PREFIX
+from confy_addons.wire import TYPE_TAGS, pack, to_binary, to_text, unpack
+
+
+@pytest.fixture(scope='module')
+def rsa():
+    return RSAEncryption()
+
+
+def test_pack_unpack_round_trip():
+    frame = pack(MessageType.AES, memoryview(b'iv+ciphertext'))
+    assert frame[:2] == bytes((WIRE_FORMAT_VERSION, TYPE_TAGS[MessageType.AES]))
+    assert unpack(frame) == Message(MessageType.AES, b'iv+ciphertext')
+    assert unpack(bytearray(frame)) == Message(MessageType.AES, b'iv+ciphertext')
+
+
+def test_binary_aes_frame_is_smaller_and_decrypts():
+    aes = AESEncryption()
+    text = f'{AES_PREFIX}{aes.encrypt("x" * 300)}'
+    binary = to_binary(text)
+    assert len(binary) < len(text) * 3 // 4 + 2
+    assert aes.decrypt_bytes(unpack(binary).payload) == b'x' * 300  # type: ignore[arg-type]
+    assert to_text(binary) == text
+
+
+def test_rsa_key_exchange_converts_to_der(rsa):
+    text = f'{KEY_EXCHANGE_PREFIX}{rsa.base64_public_key}'
+    binary = to_binary(text)
+    assert unpack(binary).payload == rsa.der_public_key
+    assert to_text(binary) == text
+
+
+def test_x25519_key_exchange_keeps_raw_key():
+    exchange = X25519KeyExchange()
+    text = exchange.key_exchange_message()
+    binary = to_binary(text)
+    assert unpack(binary).payload == exchange.public_key
+    assert to_text(binary) == text
+
+
+def test_wrapped_key_and_system_frames_round_trip(rsa):
+    wrapped = base64.b64encode(rsa.public_key.encrypt(b'k' * 32, rsa.encryption_padding)).decode()
+    for text in (f'{AES_KEY_PREFIX}{wrapped}', f'{SYSTEM_PREFIX}olá: mundo'):
+        assert to_text(to_binary(text)) == text
+    assert unpack(to_binary(f'{SYSTEM_PREFIX}olá')).payload == 'olá'.encode()
+
+
+def test_unpack_rejects_malformed_frames():
+    with pytest.raises(ValueError, match='too short'):
+        unpack(b'\x01')
+    with pytest.raises(ValueError, match='Unsupported wire format version'):
+        unpack(b'\x02\x04body')
+    with pytest.raises(ValueError, match='Unknown wire format type tag'):
+        unpack(b'\x01\xffbody')
+    with pytest.raises(TypeError, match='frame must be a contiguous bytes-like object'):
+        unpack('\x01\x04body')  # type: ignore[arg-type]
+
+
+def test_pack_rejects_invalid_arguments():
+    with pytest.raises(TypeError, match='kind must be a MessageType'):
+        pack('enc:', b'body')  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match='body must be a contiguous bytes-like object'):
+        pack(MessageType.AES, 'body')  # type: ignore[arg-type]
+
+
+def test_to_binary_rejects_invalid_frames():
+    with pytest.raises(TypeError, match='frame must be a str'):
+        to_binary(b'enc:abc')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='Unknown message prefix'):
+        to_binary('hello')
+    with pytest.raises(ValueError, match='Invalid base64 payload'):
+        to_binary(f'{AES_PREFIX}not base64!')
+    bad_pem = base64.b64encode(b'-----BEGIN PUBLIC KEY-----\ngarbage').decode()
+    with pytest.raises(ValueError, match='Failed to load public key from PEM'):
+        to_binary(f'{KEY_EXCHANGE_PREFIX}{bad_pem}')
+
+
+def test_to_text_rejects_invalid_bodies():
+    with pytest.raises(ValueError, match='Text body is not valid UTF-8'):
+        to_text(pack(MessageType.SYSTEM, b'\xff\xfe'))
+    with pytest.raises(ValueError, match='Failed to load public key from DER'):
+        to_text(pack(MessageType.KEY_EXCHANGE, b'not a der key'))